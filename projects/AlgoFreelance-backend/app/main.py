@@ -3,12 +3,15 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from contextlib import asynccontextmanager
 import logging
 
 # Import your route handlers
 from .routes import jobs
 from .routes import ipfs
 
+from .services import algorand_service
+
 # Import custom exceptions
 from .services.exceptions import (
     AlgoFreelanceError,
@@ -19,17 +22,27 @@ from .services.exceptions import (
     IPFSUploadError,
     InvalidIPFSHashError,
     TransactionConstructionError,
-    InvalidEscrowAmountError
+    InvalidEscrowAmountError,
+    AlgorandNodeError
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Start background services (job index sync loop)
+    algorand_service.start_background_tasks()
+    yield
+    await algorand_service.stop_background_tasks()
+
+
 app = FastAPI(
     title="AlgoFreelance API",
     description="Backend for the Decentralized Freelancer Escrow Platform",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # --- Custom Exception Handlers ---
@@ -141,6 +154,19 @@ async def invalid_escrow_amount_handler(request: Request, exc: InvalidEscrowAmou
     )
 
 
+@app.exception_handler(AlgorandNodeError)
+async def algorand_node_error_handler(request: Request, exc: AlgorandNodeError):
+    logger.error(f"Algorand node error: {exc.message}")
+    return JSONResponse(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        content={
+            "error": exc.error_code,
+            "detail": exc.message,
+            "service": exc.service
+        }
+    )
+
+
 @app.exception_handler(AlgoFreelanceError)
 async def general_algofreelance_error_handler(request: Request, exc: AlgoFreelanceError):
     """Catch-all for any AlgoFreelance errors not handled above"""
@@ -211,4 +237,11 @@ def health_check():
         "status": "healthy",
         "service": "AlgoFreelance Backend",
         "version": "1.0.0"
+    }
+
+@app.get("/metrics")
+def metrics():
+    """Cache hit/miss/eviction counters for monitoring"""
+    return {
+        "caches": algorand_service.get_cache_stats()
     }
\ No newline at end of file
@@ -19,6 +19,23 @@ class JobCreateResponse(BaseModel):
     txn_id: str
     explorer_url: str
 
+# Request/response for the create-batch endpoint
+class JobBatchCreateRequest(BaseModel):
+    jobs: List[JobCreateRequest]
+
+class JobBatchCreateResult(BaseModel):
+    index: int  # Position in the request
+    success: bool
+    app_id: Optional[int] = None
+    app_address: Optional[str] = None
+    funding_amount: Optional[int] = None
+    txn_id: Optional[str] = None
+    explorer_url: Optional[str] = None
+    error: Optional[str] = None  # Set when the job's group failed
+
+class JobBatchCreateResponse(BaseModel):
+    results: List[JobBatchCreateResult]
+
 # From PRD Section 8: GET /api/v1/jobs/{app_id}
 class JobDetailsResponse(BaseModel):
     app_id: int
@@ -96,6 +113,35 @@ class ApproveWorkResponse(BaseModel):
     expected_payment_amount: int  # Amount that will be paid to freelancer
     message: str = "Sign and send this transaction to approve work and mint NFT"
 
+class TransactionBatchItem(BaseModel):
+    """One action to construct in a batch"""
+    action: str  # "fund", "submit" or "approve"
+    app_id: int
+    address: str  # Address that will sign the action's transactions
+    ipfs_hash: Optional[str] = None  # Required for "submit"
+
+class TransactionBatchRequest(BaseModel):
+    """Request to construct unsigned transactions for several actions"""
+    actions: List[TransactionBatchItem]
+
+class TransactionBatchResult(BaseModel):
+    """Unsigned transactions for one action from a batch"""
+    index: int
+    action: str
+    app_id: int
+    success: bool
+    transactions: List[str] = []  # Base64-encoded unsigned transactions, in signing order
+    group_id: Optional[str] = None  # Set for fund (payment + app call group)
+    signer_address: Optional[str] = None
+    expected_nft_name: Optional[str] = None  # Set for approve
+    expected_payment_amount: Optional[int] = None  # Set for approve
+    error: Optional[str] = None  # Set when the action could not be constructed
+
+class TransactionBatchResponse(BaseModel):
+    """Per-action results of a batch construction, in request order"""
+    results: List[TransactionBatchResult]
+    message: str = "Sign all transactions together, then broadcast each action's transactions as one group"
+
 class BroadcastTransactionRequest(BaseModel):
     """Request to broadcast a signed transaction"""
     signed_transaction: str  # Base64-encoded signed transaction
@@ -105,6 +151,35 @@ class BroadcastTransactionResponse(BaseModel):
     success: bool = True
     txn_id: str
     explorer_url: str
+    status: Optional[str] = None  # "pending" until confirmed; poll tracking_url
+    tracking_url: Optional[str] = None  # GET endpoint for confirmation status
+
+class BatchBroadcastRequest(BaseModel):
+    """Request to broadcast several signed transactions or atomic groups"""
+    groups: List[List[str]]  # One list of base64-encoded signed transactions per group
+
+class BroadcastGroupResult(BaseModel):
+    """Outcome of broadcasting one group from a batch"""
+    group_index: int
+    success: bool
+    txn_id: Optional[str] = None  # ID of the group's first transaction
+    explorer_url: Optional[str] = None
+    status: Optional[str] = None
+    tracking_url: Optional[str] = None
+    error: Optional[str] = None  # Set when the group was rejected
+
+class BatchBroadcastResponse(BaseModel):
+    """Per-group results of a batch broadcast, in request order"""
+    results: List[BroadcastGroupResult]
+
+class TransactionStatusResponse(BaseModel):
+    """Confirmation status of a transaction broadcast through the backend"""
+    txn_id: str
+    status: str  # pending, confirmed, failed or expired
+    submitted_round: Optional[int] = None
+    confirmed_round: Optional[int] = None
+    pool_error: Optional[str] = None  # Rejection reason when status is failed
+    app_ids: List[int] = []  # Job contracts called by the transaction
 
 # Job Listing Models
 
@@ -115,6 +190,7 @@ class JobListRequest(BaseModel):
     freelancer_address: Optional[str] = None  # Filter by freelancer address
     limit: int = 10  # Number of jobs to return (default: 10, max: 100)
     offset: int = 0  # Pagination offset (default: 0)
+    cursor: Optional[str] = None  # Keyset cursor from a previous page (overrides offset)
 
 class JobSummary(BaseModel):
     """Lightweight job information for list view"""
@@ -135,4 +211,5 @@ class JobListResponse(BaseModel):
     total_count: int  # Total number of jobs matching filters
     limit: int
     offset: int
-    has_more: bool  # Whether there are more results beyond current page
\ No newline at end of file
+    has_more: bool  # Whether there are more results beyond current page
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to fetch the next page
\ No newline at end of file
@@ -1,21 +1,27 @@
 # In backend/app/routes/jobs.py
 from fastapi import APIRouter, HTTPException, Body, Query
+from fastapi.responses import StreamingResponse
 from typing import Annotated, Optional
 
 # Import your Pydantic models and service functions
 from ..models.job import (
-    JobCreateRequest, JobCreateResponse,
+    JobCreateRequest, JobCreateResponse, JobBatchCreateRequest, JobBatchCreateResponse,
     JobDetailsResponse, PortfolioResponse,
     FundJobRequest, FundJobResponse, SubmitWorkRequest, SubmitWorkResponse,
     ApproveWorkRequest, ApproveWorkResponse, BroadcastTransactionRequest, BroadcastTransactionResponse,
-    JobListResponse  # Added for job listing
+    JobListResponse,  # Added for job listing
+    TransactionStatusResponse, BatchBroadcastRequest, BatchBroadcastResponse,
+    TransactionBatchRequest, TransactionBatchResponse
 )
 from ..services import algorand_service
+from ..services.exceptions import AlgoFreelanceError
 from ..services.algorand import (
-    deploy_new_job_contract, get_job_details_from_state, get_freelancer_nfts,
+    deploy_new_job_contract, deploy_job_contracts_batch, get_job_details_from_state, get_freelancer_nfts,
     construct_fund_transaction, construct_submit_work_transaction,
     construct_approve_work_transaction, broadcast_signed_transaction,
-    list_jobs  # Added for job listing
+    list_jobs,  # Added for job listing
+    job_event_stream, get_transaction_status, broadcast_signed_groups,
+    construct_transactions_batch
 )
 
 # This creates a "router" that you'll include in your main app
@@ -37,10 +43,27 @@ async def create_job(job_data: JobCreateRequest):
             txn_id=contract_details["txn_id"],
             explorer_url=f"https://testnet.explorer.perawallet.app/application/{contract_details['app_id']}"
         )
+    except AlgoFreelanceError:
+        # Invalid address/escrow amount: handled as 400 by the app's exception handlers
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Contract deployment failed: {e}")
 
 
+# POST /api/v1/jobs/create-batch - Deploy many job contracts at once
+@router.post("/jobs/create-batch", response_model=JobBatchCreateResponse)
+async def create_jobs_batch(request: JobBatchCreateRequest):
+    try:
+        results = await deploy_job_contracts_batch(request.jobs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    for result in results:
+        if result["success"]:
+            result["explorer_url"] = f"https://testnet.explorer.perawallet.app/application/{result['app_id']}"
+    return JobBatchCreateResponse(results=results)
+
+
 # Corresponds to PRD Section 8: GET /api/v1/jobs/{app_id}
 @router.get("/jobs/{app_id}", response_model=JobDetailsResponse)
 async def get_job(app_id: int):
@@ -51,6 +74,22 @@ async def get_job(app_id: int):
         raise HTTPException(status_code=404, detail=f"Job not found or error: {e}")
 
 
+# GET /api/v1/jobs/{app_id}/events - Live job status via Server-Sent Events
+@router.get("/jobs/{app_id}/events")
+async def stream_job_events(app_id: int):
+    # Fail with a normal 404 before the stream starts
+    try:
+        await get_job_details_from_state(app_id)
+    except Exception as e:
+        raise HTTPException(status_code=404, detail=f"Job not found or error: {e}")
+
+    return StreamingResponse(
+        job_event_stream(app_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # NEW: GET /api/v1/jobs - List all jobs with filtering and pagination
 @router.get("/jobs", response_model=JobListResponse)
 async def list_all_jobs(
@@ -58,7 +97,8 @@ async def list_all_jobs(
     client_address: Optional[str] = Query(None, description="Filter by client address"),
     freelancer_address: Optional[str] = Query(None, description="Filter by freelancer address"),
     limit: int = Query(10, ge=1, le=100, description="Number of results to return (max 100)"),
-    offset: int = Query(0, ge=0, description="Pagination offset")
+    offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor (overrides offset)")
 ):
     """
     List all AlgoFreelance job contracts with optional filtering and pagination.
@@ -69,15 +109,18 @@ async def list_all_jobs(
     - freelancer_address: Filter by specific freelancer Algorand address
     - limit: Number of results per page (default: 10, max: 100)
     - offset: Pagination offset (default: 0)
+    - cursor: Keyset cursor returned as next_cursor; stable when new jobs are deployed
     
     **Returns:**
     - jobs: List of job summaries
     - total_count: Total number of jobs matching filters
     - has_more: Whether there are more results beyond current page
+    - next_cursor: Cursor for the next page (null on the last page)
     
     **Example:**
     ```
     GET /api/v1/jobs?status=1&limit=5&offset=0
+    GET /api/v1/jobs?status=1&limit=5&cursor=MTcyOTI3MDgwMDoxMjM0NQ
     ```
     """
     try:
@@ -86,9 +129,12 @@ async def list_all_jobs(
             client_address=client_address,
             freelancer_address=freelancer_address,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         return JobListResponse(**result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list jobs: {e}")
 
@@ -195,6 +241,31 @@ async def approve_work(app_id: int, request: ApproveWorkRequest):
         raise HTTPException(status_code=400, detail=f"Failed to construct approve transaction: {e}")
 
 
+# POST /api/v1/transactions/batch - Construct unsigned transactions for several actions
+@router.post("/transactions/batch", response_model=TransactionBatchResponse)
+async def construct_transactions(request: TransactionBatchRequest):
+    """
+    Constructs unsigned transactions for several fund/submit/approve actions.
+
+    All transactions share one suggested-params snapshot and the job state
+    they need is fetched concurrently, so the wallet can sign them together.
+
+    **Args:**
+    - actions: List of {action, app_id, address[, ipfs_hash]} where action is
+      "fund", "submit" (needs ipfs_hash) or "approve"
+
+    **Returns:**
+    - One result per action, in request order, with its unsigned transactions;
+      an action that cannot be constructed reports its error without
+      affecting the others
+    """
+    try:
+        results = await construct_transactions_batch([item.model_dump() for item in request.actions])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return TransactionBatchResponse(results=results)
+
+
 @router.post("/broadcast", response_model=BroadcastTransactionResponse)
 async def broadcast_transaction(request: BroadcastTransactionRequest):
     """
@@ -209,9 +280,39 @@ async def broadcast_transaction(request: BroadcastTransactionRequest):
     **Returns:**
     - Transaction ID
     - Block explorer URL
+    - Tracking status ("pending") and URL; the request does not wait for confirmation
     """
     try:
         result = await broadcast_signed_transaction(request.signed_transaction)
         return BroadcastTransactionResponse(**result)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to broadcast transaction: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to broadcast transaction: {e}")
+
+# POST /api/v1/broadcast/batch - Broadcast several signed transactions/groups at once
+@router.post("/broadcast/batch", response_model=BatchBroadcastResponse)
+async def broadcast_batch(request: BatchBroadcastRequest):
+    """
+    Broadcasts several signed transactions or atomic groups in one request.
+
+    **Args:**
+    - groups: List of groups, each a list of base64-encoded signed transactions
+      (e.g. both signed transactions of a fund group)
+
+    **Returns:**
+    - One result per group, in request order; a rejected group reports its
+      error without affecting the others
+    """
+    try:
+        results = await broadcast_signed_groups(request.groups)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BatchBroadcastResponse(results=results)
+
+
+# GET /api/v1/transactions/{txn_id} - Confirmation status of a broadcast transaction
+@router.get("/transactions/{txn_id}", response_model=TransactionStatusResponse)
+async def transaction_status(txn_id: str):
+    record = get_transaction_status(txn_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Transaction {txn_id} is not tracked by this backend")
+    return TransactionStatusResponse(**record)
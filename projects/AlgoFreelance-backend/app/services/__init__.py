@@ -1,5 +1,13 @@
 # Services module
-from . import algorand as algorand_service
+# algorand.py loads the network config and compiled client on import, so it
+# is only imported when first used; the self-contained modules (cache,
+# job_index, job_events, ...) can be imported without a node or .env file.
+import importlib
 
 __all__ = ['algorand_service']
 
+
+def __getattr__(name):
+    if name == 'algorand_service':
+        return importlib.import_module('.algorand', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,241 @@
+# AlgoFreelance Backend - Async algod/Indexer Clients
+# httpx.AsyncClient-based adapters for the algod and Indexer REST APIs.
+# Connections are pooled and kept alive across requests (HTTP/2 when the
+# `h2` package is installed), every endpoint has its own timeout, and
+# transient failures are retried with exponential backoff.
+
+import asyncio
+import importlib.util
+import io
+import os
+import random
+
+import httpx
+import msgpack
+from algosdk import encoding, transaction
+
+from .exceptions import AlgorandNodeError
+
+# Connection pool and retry configuration
+HTTP_MAX_CONNECTIONS = int(os.getenv("ALGOD_HTTP_MAX_CONNECTIONS", "50"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("ALGOD_HTTP_MAX_KEEPALIVE", "20"))
+HTTP_TIMEOUT = float(os.getenv("ALGOD_HTTP_TIMEOUT", "10"))  # seconds, default per request
+HTTP_RETRIES = int(os.getenv("ALGOD_HTTP_RETRIES", "3"))
+HTTP_BACKOFF = float(os.getenv("ALGOD_HTTP_BACKOFF", "0.2"))  # seconds, doubled per attempt
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Status codes worth retrying: rate limiting and transient server errors
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# algod rejections meaning the transaction was already accepted (e.g. by an
+# earlier attempt whose response was lost)
+_DUPLICATE_SUBMISSION_REASONS = ("already in ledger", "already in pool")
+
+
+def first_txid(signed_txn_bytes: bytes) -> str:
+    """Transaction ID of the first signed transaction in a (concatenated) blob."""
+    unpacker = msgpack.Unpacker(io.BytesIO(signed_txn_bytes), raw=False, strict_map_key=False)
+    return encoding.msgpack_decode(next(unpacker)).get_txid()
+
+
+class _AsyncNodeClient:
+    """Shared pooling, timeout and retry logic for algod and Indexer."""
+
+    service = "node"
+    token_header = ""
+
+    def __init__(self, base_url: str, token: str = ""):
+        headers = {self.token_header: token} if token else {}
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers=headers,
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            ),
+            http2=HTTP2_AVAILABLE,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict | None = None,
+        content: bytes | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+        retries: int = HTTP_RETRIES,
+    ) -> dict:
+        """
+        Sends a request and returns the decoded JSON body.
+
+        Transport errors and 429/5xx responses are retried with exponential
+        backoff and jitter; other 4xx responses fail immediately.
+
+        Raises:
+            AlgorandNodeError if the request ultimately fails
+        """
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        for attempt in range(retries + 1):
+            try:
+                response = await self._client.request(
+                    method,
+                    path,
+                    params=params,
+                    content=content,
+                    headers=headers,
+                    timeout=timeout if timeout is not None else HTTP_TIMEOUT,
+                )
+            except httpx.TransportError as e:
+                if attempt < retries:
+                    await self._backoff(attempt)
+                    continue
+                raise AlgorandNodeError(self.service, path, str(e) or type(e).__name__)
+
+            if response.status_code in _RETRY_STATUS_CODES and attempt < retries:
+                await self._backoff(attempt)
+                continue
+            if response.is_error:
+                try:
+                    reason = response.json().get("message", response.text)
+                except ValueError:
+                    reason = response.text
+                raise AlgorandNodeError(self.service, path, reason, status_code=response.status_code)
+            return response.json()
+
+    @staticmethod
+    async def _backoff(attempt: int) -> None:
+        delay = HTTP_BACKOFF * (2 ** attempt)
+        await asyncio.sleep(delay + random.uniform(0, delay / 2))
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class AsyncAlgodClient(_AsyncNodeClient):
+    """Async subset of algod's v2 REST API used by the backend."""
+
+    service = "algod"
+    token_header = "X-Algo-API-Token"
+
+    async def status(self) -> dict:
+        return await self._request("GET", "/v2/status", timeout=5)
+
+    async def status_after_block(self, round_num: int) -> dict:
+        # algod holds this request open until the round passes (or ~1 min)
+        return await self._request("GET", f"/v2/status/wait-for-block-after/{round_num}", timeout=70)
+
+    async def block_info(self, round_num: int) -> dict:
+        return await self._request("GET", f"/v2/blocks/{round_num}", params={"format": "json"}, timeout=10)
+
+    async def application_info(self, app_id: int) -> dict:
+        return await self._request("GET", f"/v2/applications/{app_id}", timeout=5)
+
+    async def account_info(self, address: str) -> dict:
+        return await self._request("GET", f"/v2/accounts/{address}", params={"exclude": "all"}, timeout=5)
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        params = await self._request("GET", "/v2/transactions/params", timeout=5)
+        return transaction.SuggestedParams(
+            fee=params["fee"],
+            first=params["last-round"],
+            last=params["last-round"] + 1000,
+            gh=params["genesis-hash"],
+            gen=params["genesis-id"],
+            flat_fee=False,
+            consensus_version=params["consensus-version"],
+            min_fee=params["min-fee"],
+        )
+
+    async def send_raw_transaction(self, signed_txn_bytes: bytes) -> str:
+        """
+        Submits one signed transaction or a concatenated signed group.
+
+        A retried POST may reach algod after the first attempt was already
+        accepted; algod then rejects the duplicate, which is reported as
+        success with the transaction's own ID.
+
+        Returns:
+            Transaction ID of the first transaction
+        """
+        try:
+            response = await self._request(
+                "POST",
+                "/v2/transactions",
+                content=signed_txn_bytes,
+                headers={"Content-Type": "application/x-binary"},
+                timeout=10,
+            )
+        except AlgorandNodeError as e:
+            if any(reason in e.message.lower() for reason in _DUPLICATE_SUBMISSION_REASONS):
+                txid = first_txid(signed_txn_bytes)
+                print(f"[AlgodClient] Transaction {txid} was already submitted; treating as sent")
+                return txid
+            raise
+        return response["txId"]
+
+    async def simulate_raw_transactions(self, request_bytes: bytes) -> dict:
+        """
+        Runs algod simulate on a msgpack-encoded SimulateRequest.
+        Nothing is signed or submitted; the JSON simulation result is returned.
+        """
+        return await self._request(
+            "POST",
+            "/v2/transactions/simulate",
+            params={"format": "json"},
+            content=request_bytes,
+            headers={"Content-Type": "application/msgpack"},
+            timeout=10,
+        )
+
+    async def pending_transaction_info(self, txid: str) -> dict:
+        return await self._request("GET", f"/v2/transactions/pending/{txid}", timeout=5)
+
+
+class AsyncIndexerClient(_AsyncNodeClient):
+    """Async subset of the Indexer's v2 REST API used by the backend."""
+
+    service = "indexer"
+    token_header = "X-Indexer-API-Token"
+
+    async def lookup_account_application_by_creator(
+        self, creator: str, limit: int | None = None, next_page: str | None = None
+    ) -> dict:
+        return await self._request(
+            "GET",
+            f"/v2/accounts/{creator}/created-applications",
+            params={"limit": limit, "next": next_page},
+            timeout=20,
+        )
+
+    async def lookup_account_assets(
+        self, address: str, limit: int | None = None, next_page: str | None = None
+    ) -> dict:
+        return await self._request(
+            "GET",
+            f"/v2/accounts/{address}/assets",
+            params={"limit": limit, "next": next_page},
+        )
+
+    async def lookup_asset_by_id(self, asset_id: int) -> dict:
+        return await self._request("GET", f"/v2/assets/{asset_id}", timeout=5)
+
+    async def search_transactions_by_address(
+        self,
+        address: str,
+        limit: int | None = None,
+        next_page: str | None = None,
+        txn_type: str | None = None,
+    ) -> dict:
+        return await self._request(
+            "GET",
+            f"/v2/accounts/{address}/transactions",
+            params={"limit": limit, "next": next_page, "tx-type": txn_type},
+            timeout=20,
+        )
@@ -1,11 +1,20 @@
 # AlgoFreelance Backend - Algorand Service
 # Updated to use algopy-generated client
 
+import asyncio
+import base64
+import copy
+import functools
+import io
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from algosdk import account, mnemonic
+from typing import AsyncIterator
+from algosdk import account, mnemonic, transaction
 from algokit_utils import AlgorandClient, Account
+from algosdk.abi import Method as ABIMethod
 from dotenv import load_dotenv
 
 # Import the auto-generated client from contracts artifacts
@@ -13,7 +22,7 @@ contracts_path = Path(__file__).parent.parent.parent.parent / "AlgoFreelance-con
 sys.path.insert(0, str(contracts_path))
 
 try:
-    from algo_freelance_client import AlgoFreelanceClient, AlgoFreelanceFactory
+    from algo_freelance_client import AlgoFreelanceClient
 except ImportError as e:
     raise ImportError(
         f"Failed to import AlgoFreelanceClient. Make sure the contract is compiled. "
@@ -22,6 +31,17 @@ except ImportError as e:
 
 # Import Pydantic models
 from ..models.job import JobCreateRequest
+from .algod_http import AsyncAlgodClient, AsyncIndexerClient
+from .asset_cache import AssetParamsStore
+from .block_follower import BlockFollower
+from .confirmation_tracker import ConfirmationTracker
+from .deploy_scheduler import RetrySeparately
+from .deployer_pool import Deployer, DeployerPool
+from .job_events import JobEventBroadcaster
+from .cache import TTLCache
+from .job_index import JobIndex, decode_cursor, encode_cursor
+from .exceptions import AlgorandNodeError, ContractNotFoundError, InvalidAddressError, InvalidEscrowAmountError
+from .suggested_params import SuggestedParamsProvider
 
 # --- Environment Configuration ---
 # Load environment based on ALGORAND_NETWORK variable
@@ -43,90 +63,510 @@ os.environ['ALGOD_TOKEN'] = os.getenv('ALGOD_TOKEN', '')
 os.environ['INDEXER_SERVER'] = os.getenv('INDEXER_SERVER', '')
 os.environ['INDEXER_TOKEN'] = os.getenv('INDEXER_TOKEN', '')
 
-# Initialize AlgorandClient from environment
+# Initialize AlgorandClient from environment (used for algokit app clients)
 algorand_client = AlgorandClient.from_environment()
 
-# --- Deployer Account ---
+# Native asyncio clients with pooled keep-alive connections, used for every
+# direct algod/Indexer REST call in this module
+algod = AsyncAlgodClient(os.environ['ALGOD_SERVER'], os.environ['ALGOD_TOKEN'])
+indexer = AsyncIndexerClient(os.environ['INDEXER_SERVER'], os.environ['INDEXER_TOKEN'])
+
+# One suggested-params value shared by all transaction builders,
+# refreshed from the block follower every few rounds
+suggested_params_provider = SuggestedParamsProvider(algod)
+# Confirmation status of everything broadcast through the backend
+confirmation_tracker = ConfirmationTracker(algod)
+
+# Results requested per Indexer page when walking paginated endpoints
+INDEXER_PAGE_LIMIT = int(os.getenv("INDEXER_PAGE_LIMIT", "100"))
+
+# --- Blocking SDK Calls ---
+# algokit_utils app clients are synchronous. Their calls go through a
+# bounded thread pool so a slow algod request never blocks the event loop,
+# and total concurrency against the node stays capped.
+ALGOD_MAX_WORKERS = int(os.getenv("ALGOD_MAX_WORKERS", "16"))
+_algod_executor = ThreadPoolExecutor(max_workers=ALGOD_MAX_WORKERS, thread_name_prefix="algod")
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Runs a blocking algokit/algosdk call on the bounded thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_algod_executor, functools.partial(func, *args, **kwargs))
+
+# --- Deployer Accounts ---
+# DEPLOYER_MNEMONIC is the primary deployer. DEPLOYER_MNEMONICS (comma-separated)
+# adds more accounts to the deployer pool; TREASURY_MNEMONIC, if set, tops
+# pool accounts up when they run low.
 DEPLOYER_MNEMONIC = os.getenv("DEPLOYER_MNEMONIC")
-if not DEPLOYER_MNEMONIC:
+DEPLOYER_MNEMONICS = [phrase.strip() for phrase in os.getenv("DEPLOYER_MNEMONICS", "").split(",") if phrase.strip()]
+_deployer_mnemonics = list(dict.fromkeys(([DEPLOYER_MNEMONIC] if DEPLOYER_MNEMONIC else []) + DEPLOYER_MNEMONICS))
+if not _deployer_mnemonics:
     raise ValueError(
         f"DEPLOYER_MNEMONIC not set in {env_file}. "
         "Backend needs an account to deploy contracts."
     )
 
-deployer_private_key = mnemonic.to_private_key(DEPLOYER_MNEMONIC)
+deployer_private_key = mnemonic.to_private_key(_deployer_mnemonics[0])
 deployer_address = account.address_from_private_key(deployer_private_key)
 deployer_account = Account(private_key=deployer_private_key)
 
+TREASURY_MNEMONIC = os.getenv("TREASURY_MNEMONIC")
+
 print(f"[AlgoFreelance Backend] Initialized on {network}")
-print(f"[AlgoFreelance Backend] Deployer address: {deployer_address}")
+print(f"[AlgoFreelance Backend] Deployer address: {deployer_address} ({len(_deployer_mnemonics)} deployer(s) in pool)")
+
+
+# Status string mapping used by job details
+_DETAILS_STATUS_MAP = {
+    0: "Created",
+    1: "Funded",
+    2: "Work Submitted",
+    3: "Completed",
+    4: "Canceled"
+}
+
+# Status string mapping used by job listings
+_LIST_STATUS_MAP = {
+    0: "Created",
+    1: "Funded",
+    2: "Submitted",
+    3: "Completed",
+    4: "Canceled"
+}
+
+
+# --- Contract Program ---
+# The ARC-56 spec is parsed once at import. Deployments reuse the compiled
+# approval/clear programs from its byteCode section, so no request ever
+# compiles TEAL through algod or constructs a factory.
+
+CONTRACT_SPEC = json.loads((contracts_path / "AlgoFreelance.arc56.json").read_text())
+
+# Algorand's atomic group size limit
+MAX_GROUP_SIZE = 16
+
+
+
+def _method_signature(method: dict) -> str:
+    """ARC-4 signature of an ARC-56 method entry, e.g. submit_work(string)void."""
+    arg_types = ",".join(arg["type"] for arg in method["args"])
+    return f"{method['name']}({arg_types}){method['returns']['type']}"
+
+
+# ABI methods by name, with their selectors and argument types precomputed,
+# so building a transaction never parses the spec or constructs a client
+CONTRACT_METHODS: dict[str, ABIMethod] = {
+    method["name"]: ABIMethod.from_signature(_method_signature(method)) for method in CONTRACT_SPEC["methods"]
+}
+METHOD_SELECTORS: dict[str, bytes] = {name: method.get_selector() for name, method in CONTRACT_METHODS.items()}
+_METHOD_ARG_TYPES = {name: [arg.type for arg in method.args] for name, method in CONTRACT_METHODS.items()}
+
+
+def encode_app_args(method_name: str, *args) -> list[bytes]:
+    """Selector followed by the ARC-4 encoded arguments of a contract method call."""
+    return [
+        METHOD_SELECTORS[method_name],
+        *(arg_type.encode(value) for arg_type, value in zip(_METHOD_ARG_TYPES[method_name], args)),
+    ]
+
+
+_GLOBAL_SCHEMA = transaction.StateSchema(
+    CONTRACT_SPEC["state"]["schema"]["global"]["ints"], CONTRACT_SPEC["state"]["schema"]["global"]["bytes"]
+)
+_LOCAL_SCHEMA = transaction.StateSchema(
+    CONTRACT_SPEC["state"]["schema"]["local"]["ints"], CONTRACT_SPEC["state"]["schema"]["local"]["bytes"]
+)
+
+# (approval, clear) program bytes, loaded on first use
+_programs: tuple[bytes, bytes] | None = None
+_program_stats = {"source": None, "hits": 0, "compilations": 0}
+
+
+def _load_programs() -> tuple[bytes, bytes]:
+    """Compiled programs from the spec, or compiled once if the spec has no byteCode."""
+    byte_code = CONTRACT_SPEC.get("byteCode")
+    if byte_code:
+        _program_stats["source"] = "arc56"
+        return base64.b64decode(byte_code["approval"]), base64.b64decode(byte_code["clear"])
+
+    _program_stats["source"] = "algod"
+    _program_stats["compilations"] += 2
+    return tuple(
+        algorand_client.app.compile_teal(base64.b64decode(CONTRACT_SPEC["source"][name]).decode("utf-8")).compiled_base64_to_bytes
+        for name in ("approval", "clear")
+    )
+
+
+async def _get_programs() -> tuple[bytes, bytes]:
+    global _programs
+    if _programs is None:
+        _programs = await _run_blocking(_load_programs)
+    else:
+        _program_stats["hits"] += 1
+    return _programs
+
+
+# --- Deployment ---
+# Every deploy goes through the deployer pool. Each deployer's
+# DeployScheduler coalesces concurrent requests into atomic groups of app
+# creates, each transaction carries a unique note, and the number of
+# unconfirmed groups per deployer is bounded.
+
+DEPLOY_BATCH_MAX_JOBS = int(os.getenv("DEPLOY_BATCH_MAX_JOBS", "64"))
+# Validity window of deploy transactions: once it passes unconfirmed, the
+# group can never confirm and its jobs are safe to send again
+DEPLOY_VALID_ROUNDS = int(os.getenv("DEPLOY_VALID_ROUNDS", "20"))
+
+def validate_job_request(job_data: JobCreateRequest) -> None:
+    """
+    Rejects jobs that initialize() would fail on, before they are queued:
+    a coalesced group fails as a whole, so one bad job must never reach a
+    group shared with other requests.
+
+    Raises:
+        InvalidEscrowAmountError: If escrow_amount is not positive
+        InvalidAddressError: If the client or freelancer address is malformed
+    """
+    from algosdk import encoding
+
+    if job_data.escrow_amount <= 0:
+        raise InvalidEscrowAmountError(job_data.escrow_amount)
+    for address in (job_data.client_address, job_data.freelancer_address):
+        if not encoding.is_valid_address(address):
+            raise InvalidAddressError(address, "not a valid Algorand address")
+
+
+def _job_init_args(job_data: JobCreateRequest) -> list:
+    return [job_data.client_address, job_data.freelancer_address, job_data.escrow_amount, job_data.job_title]
+
+
+class _GroupRejected(Exception):
+    """algod refused a deploy group, or its validity window passed unconfirmed: none of it is on chain."""
+
+
+class _OutcomeUnknown(Exception):
+    """A deploy group was sent but could not be followed to a result; it may still confirm."""
+
+    def __init__(self, txn_ids: list[str], reason: str):
+        self.txn_ids = txn_ids
+        super().__init__(f"outcome of {txn_ids[0]} unknown ({reason})")
+
+
+async def _deploy_params():
+    """Shared suggested params with a short validity window, so an unconfirmed group expires quickly."""
+    sp = await suggested_params_provider.get()
+    sp.last = min(sp.last, sp.first + DEPLOY_VALID_ROUNDS)
+    return sp
+
+
+def _sign_group(deployer: Deployer, txns: list) -> bytes:
+    """Groups (if more than one) and signs deployer transactions into one blob for send_raw_transaction."""
+    from algosdk import encoding
+
+    if len(txns) > 1:
+        transaction.assign_group_id(txns)
+    signed = deployer.signer.sign_transactions(txns, list(range(len(txns))))
+    return b"".join(base64.b64decode(encoding.msgpack_encode(stxn)) for stxn in signed)
+
+
+async def _send_and_confirm(signed_group: bytes, txn_ids: list[str], last_valid: int) -> list[dict]:
+    """
+    Sends a signed deploy group and waits for it to confirm.
+
+    A group is only ever resent by the caller after _GroupRejected. If the
+    send itself fails without a 4xx answer (timeout, 5xx), the group may
+    have reached the pool, so it is looked up by transaction ID instead.
+
+    Returns:
+        pending_transaction_info of every transaction, in order
+
+    Raises:
+        _GroupRejected: algod rejected the group, or last_valid passed
+        _OutcomeUnknown: the group was possibly sent but could not be followed
+    """
+    try:
+        await algod.send_raw_transaction(signed_group)
+    except AlgorandNodeError as e:
+        if e.status_code is not None and 400 <= e.status_code < 500:
+            # Includes logic-eval failures: the whole group was refused
+            raise _GroupRejected(e.message) from e
+        print(f"[Deploy] Send of {txn_ids[0]} failed ({e}); looking it up before any retry")
+
+    try:
+        current_round = (await algod.status())["last-round"]
+        while True:
+            try:
+                info = await algod.pending_transaction_info(txn_ids[0])
+            except AlgorandNodeError as e:
+                # Neither pending nor recently confirmed: it has not reached this node
+                if e.status_code != 404:
+                    raise
+                info = {}
+            if info.get("confirmed-round"):
+                return [info, *await asyncio.gather(*(algod.pending_transaction_info(txid) for txid in txn_ids[1:]))]
+            if info.get("pool-error"):
+                raise _GroupRejected(info["pool-error"])
+            if current_round > last_valid:
+                raise _GroupRejected(f"not confirmed by round {last_valid}")
+            current_round = (await algod.status_after_block(current_round))["last-round"]
+    except AlgorandNodeError as e:
+        raise _OutcomeUnknown(txn_ids, str(e)) from e
+
+
+async def _create_apps(deployer: Deployer, jobs: list[JobCreateRequest], programs: tuple[bytes, bytes]) -> list[dict]:
+    """
+    Creates up to MAX_GROUP_SIZE bare job contracts in one atomic group.
+
+    The shipped contract only accepts initialize() as a call on an existing
+    app, and an app ID is not known before its create confirms, so the
+    contracts are initialized by a second group (_initialize_apps).
+
+    Returns:
+        [{"app_id", "txn_id"}] in job order
+    """
+    approval_program, clear_program = programs
+    sp = await _deploy_params()
+    txns = [
+        transaction.ApplicationCreateTxn(
+            sender=deployer.address,
+            sp=sp,
+            on_complete=transaction.OnComplete.NoOpOC,
+            approval_program=approval_program,
+            clear_program=clear_program,
+            global_schema=_GLOBAL_SCHEMA,
+            local_schema=_LOCAL_SCHEMA,
+            # Identical jobs (or a double-clicked create) would otherwise be
+            # identical transactions and fail as "already in ledger"
+            note=os.urandom(8),
+        )
+        for _ in jobs
+    ]
+    signed_group = _sign_group(deployer, txns)
+    txn_ids = [txn.get_txid() for txn in txns]
+    confirmations = await _send_and_confirm(signed_group, txn_ids, sp.last)
+    return [
+        {"app_id": confirmation["application-index"], "txn_id": txn_id}
+        for confirmation, txn_id in zip(confirmations, txn_ids)
+    ]
+
+
+async def _initialize_apps(deployer: Deployer, created: list[tuple[int, JobCreateRequest]]) -> list[str]:
+    """
+    Initializes up to MAX_GROUP_SIZE created job contracts in one atomic group.
+
+    Returns:
+        initialize() transaction IDs in order
+    """
+    sp = await _deploy_params()
+    txns = [
+        transaction.ApplicationCallTxn(
+            sender=deployer.address,
+            sp=sp,
+            index=app_id,
+            on_complete=transaction.OnComplete.NoOpOC,
+            app_args=encode_app_args("initialize", *_job_init_args(job_data)),
+        )
+        for app_id, job_data in created
+    ]
+    signed_group = _sign_group(deployer, txns)
+    txn_ids = [txn.get_txid() for txn in txns]
+    await _send_and_confirm(signed_group, txn_ids, sp.last)
+    return txn_ids
+
+
+async def _deploy_group(deployer: Deployer, jobs: list[JobCreateRequest]) -> list:
+    """
+    Deploys up to MAX_GROUP_SIZE jobs from one deployer: one atomic group of
+    app creates, then one grouped initialize() round. Called by the
+    deployer's scheduler.
+
+    The jobs may come from unrelated requests. When algod definitely rejects
+    the create group, each job is handed back to the scheduler as
+    RetrySeparately and sent again in a group of its own; a group whose
+    outcome is unknown is never resent, since it may still confirm.
+
+    Returns:
+        One result per job: success, app_id, app_address, txn_id and
+        funding_amount, or success=False with an error message
+        (or RetrySeparately, see above)
+    """
+    from algosdk.logic import get_application_address
+
+    try:
+        created = await _create_apps(deployer, jobs, await _get_programs())
+    except _GroupRejected as e:
+        print(f"[Deploy] Create group of {len(jobs)} rejected: {e}")
+        if len(jobs) == 1:
+            return [{"success": False, "error": f"Deploy rejected: {e}"}]
+        return [RetrySeparately(str(e)) for _ in jobs]
+    except _OutcomeUnknown as e:
+        print(f"[Deploy] Create group of {len(jobs)} not resent: {e}")
+        return [{"success": False, "error": f"Deploy {e}; it was not retried and may still confirm"} for _ in jobs]
+    except Exception as e:
+        # Failed before anything was sent (programs, params or signing)
+        print(f"[Deploy] Create group of {len(jobs)} failed: {e}")
+        return [{"success": False, "error": str(e)} for _ in jobs]
+
+    results = [
+        {
+            "success": False,  # until initialize() confirms
+            "app_id": outcome["app_id"],
+            "app_address": get_application_address(outcome["app_id"]),
+            "txn_id": outcome["txn_id"],
+            # escrow + 0.3 ALGO buffer for min balance + fees
+            "funding_amount": job_data.escrow_amount + 300_000,
+        }
+        for job_data, outcome in zip(jobs, created)
+    ]
+
+    await _initialize_created(deployer, list(zip(results, jobs)))
+
+    app_ids = [result["app_id"] for result in results if result["success"]]
+    print(f"[Deploy] {deployer.address[:8]}... deployed {len(app_ids)}/{len(jobs)} job(s) in one group: {app_ids}")
+
+    # Make the new jobs visible in listings right away
+    if app_ids:
+        await invalidate_job_listings(app_ids)
+    return results
+
+
+async def _initialize_created(deployer: Deployer, pending: list[tuple[dict, JobCreateRequest]]) -> None:
+    """
+    Initializes apps whose bare creates have confirmed, updating each result
+    in place. The apps already exist, so this stays within the group's
+    scheduler slot: a rejected group is retried one app at a time, so a
+    single bad job does not leave the others uninitialized. When the outcome
+    is unknown the apps are read back instead of being initialized again.
+    """
+    try:
+        txn_ids = await _initialize_apps(deployer, [(result["app_id"], job_data) for result, job_data in pending])
+    except _GroupRejected as e:
+        print(f"[Deploy] Initialize group of {len(pending)} rejected: {e}")
+        if len(pending) == 1:
+            pending[0][0]["error"] = f"Contract created but initialize failed: {e}"
+            return
+        await asyncio.gather(*(_initialize_created(deployer, [item]) for item in pending))
+    except _OutcomeUnknown as e:
+        print(f"[Deploy] Initialize group of {len(pending)} not resent: {e}")
+        for (result, _), txn_id in zip(pending, e.txn_ids):
+            try:
+                await read_job_state(result["app_id"])
+            except Exception:
+                result["error"] = f"Contract created; initialize {txn_id} outcome unknown, not retried"
+            else:
+                result.update(txn_id=txn_id, success=True)
+    except Exception as e:
+        print(f"[Deploy] Initialize group of {len(pending)} failed: {e}")
+        for result, _ in pending:
+            result["error"] = f"Contract created but initialize failed: {e}"
+    else:
+        # Use the initialization transaction ID (more meaningful than create)
+        for (result, _), txn_id in zip(pending, txn_ids):
+            result.update(txn_id=txn_id, success=True)
+
+
+def _make_deployer(mnemonic_phrase: str) -> Deployer:
+    private_key = mnemonic.to_private_key(mnemonic_phrase)
+    return Deployer(private_key, Account(private_key=private_key).signer, _deploy_group, max_group_size=MAX_GROUP_SIZE)
+
+
+deployer_pool = DeployerPool(
+    [_make_deployer(phrase) for phrase in _deployer_mnemonics],
+    algod,
+    suggested_params_provider,
+    confirmation_tracker,
+    treasury_private_key=mnemonic.to_private_key(TREASURY_MNEMONIC) if TREASURY_MNEMONIC else None,
+)
 
 
 # --- Service Functions ---
 
 async def deploy_new_job_contract(job_data: JobCreateRequest) -> dict:
     """
-    Deploys a new instance of the AlgoFreelance contract.
-    Uses the auto-generated factory from algopy.
+    Deploys a new instance of the AlgoFreelance contract
+    from the precompiled programs in the ARC-56 spec.
+
+    The job is queued on the least-loaded deployer of the pool and may share
+    an atomic group (and its confirmation wait) with concurrent deploys.
 
     Args:
         job_data: JobCreateRequest with client/freelancer addresses, amount, title
 
     Returns:
         dict with app_id, app_address, txn_id, funding_amount
+
+    Raises:
+        InvalidEscrowAmountError, InvalidAddressError: If the job fails
+        validate_job_request (nothing is deployed)
     """
-    try:
-        # Create factory for deploying new contracts
-        factory = AlgoFreelanceFactory(
-            algorand=algorand_client,
-            default_sender=deployer_address,
-            default_signer=deployer_account.signer,
-        )
+    validate_job_request(job_data)
+    result = await deployer_pool.submit(job_data)
+    if not result["success"]:
+        raise RuntimeError(result["error"])
 
-        # Deploy contract (create application with bare call)
-        # The contract allows bare create (see contract.py bareActions)
-        client, result = factory.send.create.bare()
+    print(f"[Deploy] Created contract with App ID: {result['app_id']}")
+    print(f"[Deploy] Contract address: {result['app_address']}")
+    print(f"[Deploy] Status should be 0 (Created)")
 
-        app_id = result.app_id
-        app_address = result.app_address
+    return {
+        "app_id": result["app_id"],
+        "app_address": result["app_address"],
+        "txn_id": result["txn_id"],
+        "funding_amount": result["funding_amount"],
+    }
 
-        print(f"[Deploy] Created contract with App ID: {app_id}")
-        print(f"[Deploy] Contract address: {app_address}")
 
-        # Call initialize method
-        init_result = client.send.initialize(
-            args=(job_data.client_address, job_data.freelancer_address, job_data.escrow_amount, job_data.job_title)
-        )
+async def deploy_job_contracts_batch(jobs: list[JobCreateRequest]) -> list[dict]:
+    """
+    Deploys many job contracts at once.
 
-        # Use the initialization transaction ID (more meaningful than create)
-        init_txn_id = init_result.tx_id
+    All jobs are queued on the deployer pool together; each deployer's
+    scheduler packs them into atomic groups of up to MAX_GROUP_SIZE app
+    creates and the groups are submitted concurrently, so a batch costs two
+    confirmation waits (creates, then initialize() calls) instead of two per
+    job. Jobs that fail validate_job_request are reported without being
+    queued, and members of a rejected group are retried one per group.
 
-        print(f"[Deploy] Initialized contract. Txn ID: {init_txn_id}")
-        print(f"[Deploy] Status should be 0 (Created)")
+    Args:
+        jobs: JobCreateRequests to deploy
 
-        # Calculate funding amount (escrow + 0.3 ALGO buffer for min balance + fees)
-        funding_amount = job_data.escrow_amount + 300_000  # 0.3 ALGO
+    Returns:
+        One result per job, in request order: index, success, app_id,
+        app_address, txn_id and funding_amount, or success=False with an
+        error message
 
-        return {
-            "app_id": app_id,
-            "app_address": app_address,
-            "txn_id": init_txn_id,
-            "funding_amount": funding_amount,
-        }
-    except ValueError as e:
-        error_message = str(e)
-        if "transaction already in ledger" in error_message:
-            raise ValueError("Job creation already in progress. Please wait for the current transaction to complete and avoid clicking the button multiple times.")
-        raise
-    except Exception as e:
-        print(f"[Deploy] Error during deployment: {e}")
-        raise
+    Raises:
+        ValueError: If the batch is empty or larger than DEPLOY_BATCH_MAX_JOBS
+    """
+    if not jobs:
+        raise ValueError("At least one job is required")
+    if len(jobs) > DEPLOY_BATCH_MAX_JOBS:
+        raise ValueError(f"At most {DEPLOY_BATCH_MAX_JOBS} jobs per batch")
+
+    async def deploy(job_data: JobCreateRequest) -> dict:
+        validate_job_request(job_data)
+        return await deployer_pool.submit(job_data)
+
+    outcomes = await asyncio.gather(*(deploy(job_data) for job_data in jobs), return_exceptions=True)
+
+    results = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            outcome = {"success": False, "error": str(outcome)}
+        results.append({"index": index, **outcome})
+    print(f"[DeployBatch] Deployed {sum(r['success'] for r in results)}/{len(jobs)} jobs")
+    return results
 
 
 async def get_job_details_from_state(app_id: int) -> dict:
     """
-    Reads the global state of a job contract using get_job_details() method.
-    Enhanced with contract balance and status information.
+    Reads the job state of a contract without signing anything.
+    Global state is decoded straight from application_info (the same data
+    get_job_details() returns), enhanced with contract balance and status.
+
+    Results are cached per app together with the round they were read at,
+    and dropped as soon as a newer block (or one of our own broadcasts)
+    touches the app, so polling clients are served from memory.
     
     Args:
         app_id: Application ID of the deployed contract
@@ -137,63 +577,234 @@ async def get_job_details_from_state(app_id: int) -> dict:
         - contract_address: The contract's Algorand address
         - status_string: Human-readable status
     """
+    cached = _job_details_cache.get(app_id)
+    if cached is not None:
+        return dict(cached[0])
+
+    # Balance first: its round is a lower bound for the state read after it
     from algosdk.logic import get_application_address
+    contract_balance, read_round = await _get_contract_balance_and_round(get_application_address(app_id))
+    job_state = await read_job_state(app_id)
+    job_state["contract_balance"] = contract_balance
     
-    # Create client for existing app (sender needed even for readonly calls)
+    print(f"[GetDetails] App {app_id} - Status: {job_state['status_string']}, Balance: {contract_balance / 1_000_000} ALGO")
+
+    # Only cache while the block follower runs, and only reads at or after
+    # the last block it processed; older reads could miss an invalidation
+    followed_round = block_follower.last_round
+    if read_round is not None and followed_round and read_round >= followed_round:
+        _job_details_cache.set(app_id, (dict(job_state), read_round))
+    
+    return job_state
+
+
+async def get_job_details_via_abi_call(app_id: int) -> dict:
+    """
+    Previous read path: sends the readonly get_job_details() ABI call through
+    the algokit client with the deployer as signer. Kept for benchmarking
+    (see benchmark_job_details.py); the API uses get_job_details_from_state().
+    """
     client = AlgoFreelanceClient(
         algorand=algorand_client,
         app_id=app_id,
         default_sender=deployer_address,
         default_signer=deployer_account.signer,
     )
-    
-    # Call the readonly get_job_details method
-    result = client.send.get_job_details()
+    result = await _run_blocking(client.send.get_job_details)
     job_details = result.abi_return  # This is a typed JobDetails object
-    
-    # Get contract address and balance
-    contract_address = get_application_address(app_id)
-    
+
+    job_state = _format_job_details(
+        app_id,
+        client_address=job_details.client_address,
+        freelancer_address=job_details.freelancer_address,
+        escrow_amount=job_details.escrow_amount,
+        job_status=job_details.job_status,
+        job_title=job_details.job_title,
+        work_hash=job_details.work_hash,
+        created_at=job_details.created_at,
+    )
+    job_state["contract_balance"] = await _get_contract_balance(job_state["contract_address"])
+    return job_state
+
+
+async def read_job_state(app_id: int, include_balance: bool = False) -> dict:
+    """
+    Lightweight job state reader: decodes global state straight from one
+    application_info call instead of sending the get_job_details() ABI call.
+
+    Args:
+        app_id: Application ID of the deployed contract
+        include_balance: Also look up the contract balance (one more algod read)
+
+    Returns:
+        dict with the same fields as get_job_details_from_state();
+        contract_balance is only present when include_balance is True
+
+    Raises:
+        ContractNotFoundError if the app does not exist or is not an
+        initialized AlgoFreelance job
+    """
     try:
-        account_info = algorand_client.client.algod.account_info(contract_address)
-        contract_balance = account_info.get('amount', 0)
-    except Exception as e:
-        print(f"[GetDetails] Warning: Could not get contract balance: {e}")
-        contract_balance = 0
-    
-    # Map status to human-readable string
-    status_map = {
-        0: "Created",
-        1: "Funded",
-        2: "Work Submitted",
-        3: "Completed",
-        4: "Canceled"
-    }
-    status_string = status_map.get(job_details.job_status, f"Unknown ({job_details.job_status})")
-    
-    print(f"[GetDetails] App {app_id} - Status: {status_string}, Balance: {contract_balance / 1_000_000} ALGO")
-    
-    # Convert to dict matching PRD §8 with enhancements
+        app_info = await algod.application_info(app_id)
+    except AlgorandNodeError as e:
+        if e.status_code == 404:
+            raise ContractNotFoundError(app_id)
+        raise
+
+    state_dict = _decode_global_state(app_info.get("params", {}).get("global-state", []))
+    if "job_status" not in state_dict:
+        # Foreign app, or a job contract whose initialize() never ran
+        raise ContractNotFoundError(app_id)
+    job_state = _format_job_details(
+        app_id,
+        client_address=_state_address(state_dict.get("client_address")),
+        freelancer_address=_state_address(state_dict.get("freelancer_address")),
+        escrow_amount=_state_uint(state_dict.get("escrow_amount")),
+        job_status=_state_uint(state_dict.get("job_status")),
+        job_title=_state_string(state_dict.get("job_title")),
+        work_hash=_state_string(state_dict.get("work_hash")),
+        created_at=_state_uint(state_dict.get("created_at")),
+    )
+
+    if include_balance:
+        job_state["contract_balance"] = await _get_contract_balance(job_state["contract_address"])
+
+    return job_state
+
+
+async def simulate_job_details(app_id: int, include_balance: bool = False) -> dict:
+    """
+    Zero-signature readonly call: runs get_job_details() through algod
+    simulate with an unsigned transaction and decodes the ABI return value.
+    Nothing is signed or submitted.
+
+    Args:
+        app_id: Application ID of the deployed contract
+        include_balance: Also look up the contract balance (one more algod read)
+
+    Returns:
+        dict with the same fields as read_job_state()
+    """
+    from algosdk import encoding, transaction
+    from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+    method = CONTRACT_METHODS["get_job_details"]
+    app_call_txn = transaction.ApplicationCallTxn(
+        sender=deployer_address,
+        sp=await suggested_params_provider.get(),
+        index=app_id,
+        on_complete=transaction.OnComplete.NoOpOC,
+        app_args=[method.get_selector()],
+    )
+    request = SimulateRequest(
+        txn_groups=[SimulateRequestTransactionGroup(txns=[transaction.SignedTransaction(app_call_txn, None)])],
+        allow_empty_signatures=True,
+    )
+    response = await algod.simulate_raw_transactions(base64.b64decode(encoding.msgpack_encode(request)))
+
+    group_result = response["txn-groups"][0]
+    if group_result.get("failure-message"):
+        raise ValueError(f"get_job_details simulation failed: {group_result['failure-message']}")
+
+    # ARC-4 return value: last log, prefixed with 0x151f7c75
+    return_log = base64.b64decode(group_result["txn-results"][0]["txn-result"]["logs"][-1])
+    (client_addr, freelancer_addr, escrow_amount, job_status,
+     work_hash, job_title, created_at, _) = method.returns.type.decode(return_log[4:])
+
+    job_state = _format_job_details(
+        app_id,
+        client_address=client_addr,
+        freelancer_address=freelancer_addr,
+        escrow_amount=escrow_amount,
+        job_status=job_status,
+        job_title=job_title,
+        work_hash=work_hash,
+        created_at=created_at,
+    )
+
+    if include_balance:
+        job_state["contract_balance"] = await _get_contract_balance(job_state["contract_address"])
+
+    return job_state
+
+
+def _format_job_details(
+    app_id: int,
+    *,
+    client_address: str,
+    freelancer_address: str,
+    escrow_amount: int,
+    job_status: int,
+    job_title: str,
+    work_hash: str,
+    created_at: int,
+) -> dict:
+    """Shapes decoded job fields into the JobDetailsResponse dict (minus balance)."""
+    from algosdk.logic import get_application_address
+
     return {
         "app_id": app_id,
-        "client_address": job_details.client_address,
-        "freelancer_address": job_details.freelancer_address,
-        "escrow_amount": job_details.escrow_amount,
-        "job_status": job_details.job_status,
-        "status_string": status_string,
-        "job_title": job_details.job_title,
-        "work_hash": job_details.work_hash if job_details.work_hash else None,
-        "created_at": job_details.created_at,
-        "is_funded": job_details.job_status >= 1,  # Status 1+ means funded
-        "contract_address": contract_address,
-        "contract_balance": contract_balance,
+        "client_address": client_address,
+        "freelancer_address": freelancer_address,
+        "escrow_amount": escrow_amount,
+        "job_status": job_status,
+        "status_string": _DETAILS_STATUS_MAP.get(job_status, f"Unknown ({job_status})"),
+        "job_title": job_title,
+        "work_hash": work_hash or None,
+        "created_at": created_at,
+        "is_funded": job_status >= 1,  # Status 1+ means funded
+        "contract_address": get_application_address(app_id),
     }
 
 
-async def construct_fund_transaction(app_id: int, client_address: str) -> dict:
+async def _get_contract_balance(contract_address: str) -> int:
+    """Contract balance in microALGOs (0 if it cannot be read)."""
+    contract_balance, _ = await _get_contract_balance_and_round(contract_address)
+    return contract_balance
+
+
+async def _get_contract_balance_and_round(contract_address: str) -> tuple[int, int | None]:
+    """Contract balance in microALGOs and the round it was read at (0, None on error)."""
+    try:
+        account_info = await algod.account_info(contract_address)
+        return account_info.get('amount', 0), account_info.get('round')
+    except Exception as e:
+        print(f"[GetDetails] Warning: Could not get contract balance: {e}")
+        return 0, None
+
+
+# --- Job Details Cache ---
+# Decoded JobDetails + balance per app, stored with the round they were read
+# at. The block follower drops entries for every app called in a new block.
+
+JOB_DETAILS_CACHE_SIZE = int(os.getenv("JOB_DETAILS_CACHE_SIZE", "1024"))  # entries
+JOB_DETAILS_CACHE_TTL = float(os.getenv("JOB_DETAILS_CACHE_TTL", "60"))  # seconds, safety net only
+_job_details_cache = TTLCache(max_size=JOB_DETAILS_CACHE_SIZE, ttl=JOB_DETAILS_CACHE_TTL, name="job_details")
+
+async def _get_job_terms(app_id: int) -> dict:
+    """
+    escrow_amount and job_title for transaction construction.
+    Both are fixed by initialize(), so an indexed job needs no algod read
+    at all; otherwise a single application_info read is made.
+    """
+    job = job_index.get(app_id)
+    if job is None:
+        job = await read_job_state(app_id)
+    return {"escrow_amount": job["escrow_amount"], "job_title": job["job_title"]}
+
+
+async def construct_fund_transaction(
+    app_id: int, client_address: str, *, sp=None, job_terms: dict | None = None
+) -> dict:
     """
     Constructs unsigned grouped transactions for funding a job contract.
 
+    Args:
+        app_id: Application ID
+        client_address: Client's address (will sign both transactions)
+        sp: Suggested params to build with (default: the shared snapshot)
+        job_terms: Prefetched result of _get_job_terms (default: fetched here)
+
     Returns:
         - Two unsigned transactions (payment + app call) as base64 strings
         - Group ID for the atomic transaction group
@@ -208,17 +819,19 @@ async def construct_fund_transaction(app_id: int, client_address: str) -> dict:
         print(f"[FundTxn] Starting fund transaction construction for app {app_id}")
         print(f"[FundTxn] Client address: {client_address}, type: {type(client_address)}")
 
-        # Get job details to retrieve escrow amount
-        job_details = await get_job_details_from_state(app_id)
-        escrow_amount = job_details["escrow_amount"]
+        # Get escrow amount (from the job index, or one cheap state read)
+        if job_terms is None:
+            job_terms = await _get_job_terms(app_id)
+        escrow_amount = job_terms["escrow_amount"]
         print(f"[FundTxn] Escrow amount: {escrow_amount}")
 
         # Get contract address
         contract_address = get_application_address(app_id)
         print(f"[FundTxn] Contract address: {contract_address}")
 
-        # Get suggested params
-        sp = algorand_client.client.algod.suggested_params()
+        # Get suggested params (shared snapshot, refreshed in the background)
+        if sp is None:
+            sp = await suggested_params_provider.get()
         print(f"[FundTxn] Got suggested params")
     except Exception as e:
         print(f"[FundTxn] Error in setup: {e}")
@@ -235,20 +848,14 @@ async def construct_fund_transaction(app_id: int, client_address: str) -> dict:
         )
         print(f"[FundTxn] Payment transaction created")
 
-        # Transaction 2: App call to fund() method
+        # Transaction 2: App call to fund() method (selector only, no args)
         print(f"[FundTxn] Creating app call transaction...")
-        from algosdk.abi import Method as ABIMethod
-
-        # Create algosdk Method object to get selector - fund() takes no arguments
-        abi_method = ABIMethod.from_signature("fund()void")
-        print(f"[FundTxn] ABI method created, selector: {abi_method.get_selector()}")
-
         app_call_txn = transaction.ApplicationCallTxn(
             sender=client_address,
             sp=sp,
             index=app_id,
             on_complete=transaction.OnComplete.NoOpOC,
-            app_args=[abi_method.get_selector()],  # Just the method selector, no args
+            app_args=encode_app_args("fund"),
         )
         print(f"[FundTxn] App call transaction created")
 
@@ -288,7 +895,9 @@ async def construct_fund_transaction(app_id: int, client_address: str) -> dict:
     }
 
 
-async def construct_submit_work_transaction(app_id: int, freelancer_address: str, ipfs_hash: str) -> dict:
+async def construct_submit_work_transaction(
+    app_id: int, freelancer_address: str, ipfs_hash: str, *, sp=None
+) -> dict:
     """
     Constructs unsigned transaction for submitting work to a job contract.
     
@@ -296,12 +905,12 @@ async def construct_submit_work_transaction(app_id: int, freelancer_address: str
         app_id: Application ID
         freelancer_address: Freelancer's address (will sign this)
         ipfs_hash: IPFS CID (will be validated)
+        sp: Suggested params to build with (default: the shared snapshot)
         
     Returns:
         Unsigned transaction as base64 string
     """
-    from algosdk import transaction
-    import base64
+    from algosdk import encoding, transaction
     
     # Validate IPFS hash format (46-59 characters for CIDv0/v1)
     if not ipfs_hash or len(ipfs_hash) < 46 or len(ipfs_hash) > 59:
@@ -314,47 +923,21 @@ async def construct_submit_work_transaction(app_id: int, freelancer_address: str
     
     print(f"[SubmitWork] Validated IPFS hash: {ipfs_hash} (length: {len(ipfs_hash)})")
     
-    # Get suggested params
-    sp = algorand_client.client.algod.suggested_params()
-    
-    # Create client to build the app call
-    client = AlgoFreelanceClient(
-        algorand=algorand_client,
-        app_id=app_id,
-        default_sender=freelancer_address,
-        default_signer=None,
-    )
+    # Get suggested params (shared snapshot, refreshed in the background)
+    if sp is None:
+        sp = await suggested_params_provider.get()
     
-    # Get the submit_work method from ABI
-    submit_work_method = None
-    for method in client.app_client.app_spec.methods:
-        if method.name == "submit_work":
-            submit_work_method = method
-            break
-
-    if not submit_work_method:
-        raise ValueError("submit_work() method not found in contract ABI")
-
-    # Create algosdk Method object to get selector
-    from algosdk.abi import Method as ABIMethod, StringType
-    abi_method = ABIMethod.from_signature(f"{submit_work_method.name}(string)void")
-
-    # Encode the ipfs_hash argument (it's an arc4.String)
-    string_type = StringType()
-    encoded_hash = string_type.encode(ipfs_hash)
-
-    # Build app call transaction
+    # Build app call transaction (ipfs_hash is an arc4.String argument)
     app_call_txn = transaction.ApplicationCallTxn(
         sender=freelancer_address,
         sp=sp,
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
-        app_args=[abi_method.get_selector(), encoded_hash],
+        app_args=encode_app_args("submit_work", ipfs_hash),
     )
 
-    # Encode to base64
-    from algosdk import encoding
-    txn_b64 = base64.b64encode(encoding.msgpack_encode(app_call_txn)).decode('utf-8')
+    # msgpack_encode() already returns a base64 string
+    txn_b64 = encoding.msgpack_encode(app_call_txn)
     
     print(f"[SubmitWork] Constructed transaction for app {app_id}")
     print(f"[SubmitWork] Freelancer: {freelancer_address}, IPFS: {ipfs_hash}")
@@ -365,7 +948,9 @@ async def construct_submit_work_transaction(app_id: int, freelancer_address: str
     }
 
 
-async def construct_approve_work_transaction(app_id: int, client_address: str) -> dict:
+async def construct_approve_work_transaction(
+    app_id: int, client_address: str, *, sp=None, job_terms: dict | None = None
+) -> dict:
     """
     Constructs unsigned transaction for approving work.
     This will trigger payment + NFT minting + NFT transfer (3 inner transactions).
@@ -373,60 +958,43 @@ async def construct_approve_work_transaction(app_id: int, client_address: str) -
     Args:
         app_id: Application ID
         client_address: Client's address (will sign this)
+        sp: Suggested params to build with (default: the shared snapshot);
+            the fee is overridden on a copy
+        job_terms: Prefetched result of _get_job_terms (default: fetched here)
         
     Returns:
         Unsigned transaction as base64 string with expected outcomes
     """
-    from algosdk import transaction
-    import base64
+    from algosdk import encoding, transaction
     
-    # Get job details to show expected outcomes
-    job_details = await get_job_details_from_state(app_id)
-    escrow_amount = job_details["escrow_amount"]
-    job_title = job_details["job_title"]
+    # Get job terms to show expected outcomes (no ABI call or balance lookup)
+    if job_terms is None:
+        job_terms = await _get_job_terms(app_id)
+    escrow_amount = job_terms["escrow_amount"]
+    job_title = job_terms["job_title"]
     
-    # Get suggested params
-    sp = algorand_client.client.algod.suggested_params()
+    # Get suggested params (shared snapshot, refreshed in the background)
+    if sp is None:
+        sp = await suggested_params_provider.get()
+    # The fee override must not leak into a shared snapshot
+    sp = copy.copy(sp)
     
     # Increase fee to cover 3 inner transactions
     # Base fee (1000) + 3 inner txns (3000) = 4000 microALGOs
     sp.fee = 4000
     sp.flat_fee = True
     
-    # Create client to build the app call
-    client = AlgoFreelanceClient(
-        algorand=algorand_client,
-        app_id=app_id,
-        default_sender=client_address,
-        default_signer=None,
-    )
-    
-    # Get the approve_work method from ABI
-    approve_method = None
-    for method in client.app_client.app_spec.methods:
-        if method.name == "approve_work":
-            approve_method = method
-            break
-
-    if not approve_method:
-        raise ValueError("approve_work() method not found in contract ABI")
-
-    # Create algosdk Method object to get selector
-    from algosdk.abi import Method as ABIMethod
-    abi_method = ABIMethod.from_signature(f"{approve_method.name}()void")
-
     # Build app call transaction (no arguments for approve_work)
     app_call_txn = transaction.ApplicationCallTxn(
         sender=client_address,
         sp=sp,
         index=app_id,
         on_complete=transaction.OnComplete.NoOpOC,
-        app_args=[abi_method.get_selector()],
+        app_args=encode_app_args("approve_work"),
     )
 
-    # Encode to base64
-    from algosdk import encoding
-    txn_b64 = base64.b64encode(encoding.msgpack_encode(app_call_txn)).decode('utf-8')
+    # msgpack_encode() already returns a base64 string
+    txn_b64 = encoding.msgpack_encode(app_call_txn)
     
     expected_nft_name = f"AlgoFreelance: {job_title}"
     
@@ -442,29 +1010,156 @@ async def construct_approve_work_transaction(app_id: int, client_address: str) -
     }
 
 
+TXN_BATCH_MAX_ACTIONS = int(os.getenv("TXN_BATCH_MAX_ACTIONS", "64"))
+
+# Actions whose expected outcomes depend on the job terms
+_TERMS_ACTIONS = {"fund", "approve"}
+
+
+async def construct_transactions_batch(actions: list[dict]) -> list[dict]:
+    """
+    Constructs unsigned transactions for several job actions at once.
+
+    One suggested-params snapshot is used for every transaction, the job
+    terms of all fund/approve targets are fetched concurrently (once per
+    app), and the transactions are then built together, so the wallet can
+    sign everything in one prompt. A failing action does not affect the
+    others.
+
+    Args:
+        actions: Dicts with action ("fund", "submit" or "approve"), app_id,
+                 address (the signer) and, for submit, ipfs_hash
+
+    Returns:
+        One result per action, in request order: index, action, app_id,
+        success, transactions, group_id (fund only), signer_address and
+        the approve outcomes, or success=False with an error message
+
+    Raises:
+        ValueError: If the batch is empty or larger than TXN_BATCH_MAX_ACTIONS
+    """
+    if not actions:
+        raise ValueError("At least one action is required")
+    if len(actions) > TXN_BATCH_MAX_ACTIONS:
+        raise ValueError(f"At most {TXN_BATCH_MAX_ACTIONS} actions per batch")
+
+    sp = await suggested_params_provider.get()
+
+    terms_app_ids = list({item["app_id"] for item in actions if item["action"] in _TERMS_ACTIONS})
+    fetched = await asyncio.gather(*(_get_job_terms(app_id) for app_id in terms_app_ids), return_exceptions=True)
+    terms_by_app = dict(zip(terms_app_ids, fetched))
+
+    def terms_for(app_id: int) -> dict:
+        # Only fund/approve look up terms; a failed lookup fails just those actions
+        job_terms = terms_by_app[app_id]
+        if isinstance(job_terms, Exception):
+            raise job_terms
+        return job_terms
+
+    async def build(item: dict) -> dict:
+        action, app_id, address = item["action"], item["app_id"], item["address"]
+        if action == "fund":
+            return await construct_fund_transaction(app_id, address, sp=sp, job_terms=terms_for(app_id))
+        if action == "submit":
+            return await construct_submit_work_transaction(app_id, address, item.get("ipfs_hash") or "", sp=sp)
+        if action == "approve":
+            return await construct_approve_work_transaction(app_id, address, sp=sp, job_terms=terms_for(app_id))
+        raise ValueError(f"Unknown action: {action}")
+
+    outcomes = await asyncio.gather(*(build(item) for item in actions), return_exceptions=True)
+
+    results = []
+    for index, (item, outcome) in enumerate(zip(actions, outcomes)):
+        result = {"index": index, "action": item["action"], "app_id": item["app_id"]}
+        if isinstance(outcome, Exception):
+            print(f"[TxnBatch] Action {index} ({item['action']} on app {item['app_id']}) failed: {outcome}")
+            result.update(success=False, error=str(outcome))
+        else:
+            # fund returns a group, submit/approve a single transaction
+            transactions = outcome.pop("transactions", None) or [outcome.pop("transaction")]
+            result.update(success=True, transactions=transactions, **outcome)
+        results.append(result)
+    print(f"[TxnBatch] Constructed {sum(r['success'] for r in results)}/{len(actions)} actions")
+    return results
+
+
 async def broadcast_signed_transaction(signed_txn_b64: str) -> dict:
     """
     Optional helper to broadcast a signed transaction.
     Frontend can also broadcast directly to Algorand.
+
+    Returns as soon as algod accepts the transaction; confirmation is
+    followed in the background by the confirmation tracker.
     
     Args:
         signed_txn_b64: Base64-encoded signed transaction
         
     Returns:
-        Transaction ID and explorer URL
+        Transaction ID, explorer URL, tracking status and tracking URL
     """
     import base64
     
     # Decode the transaction
     signed_txn_bytes = base64.b64decode(signed_txn_b64)
     
+    return await _submit_signed_bytes(signed_txn_bytes)
+
+
+BROADCAST_BATCH_MAX_GROUPS = int(os.getenv("BROADCAST_BATCH_MAX_GROUPS", "64"))
+
+
+async def broadcast_signed_groups(groups: list[list[str]]) -> list[dict]:
+    """
+    Broadcasts several signed transactions or atomic groups at once.
+
+    Each group's transactions are concatenated into one send_raw_transaction
+    call, and independent groups are submitted concurrently. A failing
+    group does not affect the others.
+
+    Args:
+        groups: Lists of base64-encoded signed transactions, one list per
+                atomic group (a single transaction is a group of one)
+
+    Returns:
+        One result per group, in request order: the broadcast result plus
+        success=True, or success=False with an error message
+
+    Raises:
+        ValueError: If the batch or a group is empty or too large
+    """
+    import base64
+
+    if not groups:
+        raise ValueError("At least one group is required")
+    if len(groups) > BROADCAST_BATCH_MAX_GROUPS:
+        raise ValueError(f"At most {BROADCAST_BATCH_MAX_GROUPS} groups per batch")
+    for index, group in enumerate(groups):
+        if not 1 <= len(group) <= MAX_GROUP_SIZE:
+            raise ValueError(f"Group {index} must contain 1-{MAX_GROUP_SIZE} transactions")
+
+    async def submit(group: list[str]) -> dict:
+        signed_txn_bytes = b"".join(base64.b64decode(signed_txn) for signed_txn in group)
+        return await _submit_signed_bytes(signed_txn_bytes)
+
+    results = await asyncio.gather(*(submit(group) for group in groups), return_exceptions=True)
+
+    group_results = []
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            print(f"[Broadcast] Group {index} rejected: {result}")
+            group_results.append({"group_index": index, "success": False, "error": str(result)})
+        else:
+            group_results.append({"group_index": index, "success": True, **result})
+    return group_results
+
+
+async def _submit_signed_bytes(signed_txn_bytes: bytes) -> dict:
+    """Sends one signed transaction or concatenated group and starts tracking it."""
     # Send to network
-    txn_id = algorand_client.client.algod.send_raw_transaction(signed_txn_bytes)
+    txn_id = await algod.send_raw_transaction(signed_txn_bytes)
     
-    # Wait for confirmation
-    algorand_client.client.algod.status_after_block(
-        algorand_client.client.algod.status()['last-round'] + 1
-    )
+    # Fund/submit/approve calls change job state: listings refresh on confirmation
+    record = confirmation_tracker.track(txn_id, _app_ids_in_signed_transactions(signed_txn_bytes))
     
     network = os.getenv('ALGORAND_NETWORK', 'testnet')
     explorer_base = "https://testnet.explorer.perawallet.app" if network == "testnet" else "http://localhost:8980"
@@ -475,13 +1170,179 @@ async def broadcast_signed_transaction(signed_txn_b64: str) -> dict:
     return {
         "txn_id": txn_id,
         "explorer_url": explorer_url,
+        "status": record["status"],
+        "tracking_url": f"/api/v1/transactions/{txn_id}",
     }
 
 
+def get_transaction_status(txn_id: str) -> dict | None:
+    """
+    Confirmation status of a transaction broadcast through the backend.
+
+    Returns:
+        Tracking record, or None if the transaction was never broadcast here
+        (or has been dropped from the tracking history)
+    """
+    return confirmation_tracker.get(txn_id)
+
+
+# --- Portfolio (POWCERT NFTs) ---
+
+NFT_LOOKUP_CONCURRENCY = int(os.getenv("NFT_LOOKUP_CONCURRENCY", "8"))  # parallel asset lookups
+ASSET_PARAMS_CACHE_SIZE = int(os.getenv("ASSET_PARAMS_CACHE_SIZE", "10000"))  # entries
+
+# ASA name, unit name, URL and creator can never change after creation,
+# so cached params never expire: an in-memory LRU in front of a permanent
+# on-disk store (LRU eviction only bounds memory)
+_asset_params_cache = TTLCache(max_size=ASSET_PARAMS_CACHE_SIZE, ttl=float("inf"), name="asset_params")
+asset_params_store = AssetParamsStore()
+
+# Certificates whose completion time could not be found in the holder's
+# transfer history are remembered for a while instead of re-walking it on
+# every portfolio request; one lookup walks at most COMPLETION_LOOKUP_MAX_PAGES
+COMPLETION_MISS_TTL = float(os.getenv("COMPLETION_MISS_TTL", "600"))  # seconds
+COMPLETION_LOOKUP_MAX_PAGES = int(os.getenv("COMPLETION_LOOKUP_MAX_PAGES", "20"))
+_completion_misses = TTLCache(max_size=ASSET_PARAMS_CACHE_SIZE, ttl=COMPLETION_MISS_TTL, name="completion_misses")
+
+# One lookup semaphore per event loop, shared by all concurrent portfolio
+# requests so NFT_LOOKUP_CONCURRENCY bounds the process, not each request
+_asset_lookup_loop: asyncio.AbstractEventLoop | None = None
+_asset_lookup_slots: asyncio.Semaphore | None = None
+
+
+def _get_asset_lookup_slots() -> asyncio.Semaphore:
+    global _asset_lookup_loop, _asset_lookup_slots
+    loop = asyncio.get_running_loop()
+    if _asset_lookup_loop is not loop:
+        # New event loop (e.g. a second asyncio.run in a script): start fresh
+        _asset_lookup_loop = loop
+        _asset_lookup_slots = asyncio.Semaphore(NFT_LOOKUP_CONCURRENCY)
+    return _asset_lookup_slots
+
+
+async def _list_account_asset_ids(address: str) -> list[int]:
+    """Returns the IDs of every asset the account currently holds (all Indexer pages)."""
+    asset_ids = []
+    next_token = None
+    while True:
+        response = await indexer.lookup_account_assets(address, limit=INDEXER_PAGE_LIMIT, next_page=next_token)
+        holdings = response.get("assets", [])
+        # Opted-in but empty holdings cannot be certificates
+        asset_ids.extend(h["asset-id"] for h in holdings if h.get("amount", 0) > 0)
+        next_token = response.get("next-token")
+        if not next_token or not holdings:
+            return asset_ids
+
+
+async def _get_asset_params(asset_ids: list[int]) -> dict[int, dict]:
+    """
+    Resolves asset params for many assets at once.
+    Lookup order: in-memory cache, on-disk store (one batched query), then
+    concurrent Indexer lookups (at most NFT_LOOKUP_CONCURRENCY at a time
+    across all requests) whose results are written back to both caches.
+
+    Returns:
+        {asset_id: params} for every asset that could be resolved
+    """
+    semaphore = _get_asset_lookup_slots()
+
+    resolved = {}
+    missing = []
+    for asset_id in asset_ids:
+        params = _asset_params_cache.get(asset_id)
+        if params is None:
+            missing.append(asset_id)
+        else:
+            resolved[asset_id] = params
+
+    stored = asset_params_store.get_many(missing) if missing else {}
+    for asset_id, params in stored.items():
+        _asset_params_cache.set(asset_id, params)
+    resolved.update(stored)
+    missing = [asset_id for asset_id in missing if asset_id not in stored]
+    fetched = {}
+
+    async def fetch(asset_id: int) -> None:
+        async with semaphore:
+            try:
+                asset_details = await indexer.lookup_asset_by_id(asset_id)
+            except Exception as e:
+                print(f"[GetNFTs] Could not look up asset {asset_id}: {e}")
+                return
+        params = asset_details.get("asset", {}).get("params", {})
+        _asset_params_cache.set(asset_id, params)
+        fetched[asset_id] = params
+
+    await asyncio.gather(*(fetch(asset_id) for asset_id in missing))
+    asset_params_store.put_many(fetched)
+    resolved.update(fetched)
+
+    print(f"[GetNFTs] Asset params: {len(asset_ids) - len(missing)} cached, {len(fetched)} fetched")
+    return resolved
+
+
+def _walk_transactions(txn: dict):
+    """Yields a transaction and all of its inner transactions, depth first."""
+    yield txn
+    for inner in txn.get("inner-txns", []):
+        yield from _walk_transactions(inner)
+
+
+async def _get_completion_times(address: str, asset_ids: list[int]) -> dict[int, int]:
+    """
+    Resolves when each POWCERT certificate was delivered to `address`.
+
+    approve_work() mints the certificate and transfers it to the freelancer
+    as inner transactions, so one paginated search over the address's asset
+    transfers (the Indexer returns the root app call with its inner
+    transactions) covers every certificate. Results are cached on disk;
+    certificates that could not be resolved are skipped for
+    COMPLETION_MISS_TTL seconds.
+
+    Returns:
+        {asset_id: unix timestamp of the approve_work block}
+    """
+    completions = asset_params_store.get_completions(asset_ids)
+    pending = {
+        asset_id for asset_id in asset_ids
+        if asset_id not in completions and _completion_misses.get((address, asset_id)) is None
+    }
+    if not pending:
+        return completions
+
+    found = {}
+    next_token = None
+    for _ in range(COMPLETION_LOOKUP_MAX_PAGES):
+        response = await indexer.search_transactions_by_address(
+            address, limit=INDEXER_PAGE_LIMIT, next_page=next_token, txn_type="axfer"
+        )
+        transactions = response.get("transactions", [])
+        for root in transactions:
+            for txn in _walk_transactions(root):
+                transfer = txn.get("asset-transfer-transaction", {})
+                asset_id = transfer.get("asset-id") or txn.get("created-asset-index")
+                if asset_id in pending:
+                    found[asset_id] = root.get("round-time", 0)
+                    pending.discard(asset_id)
+        next_token = response.get("next-token")
+        if not pending or not next_token or not transactions:
+            break
+
+    asset_params_store.put_completions(found)
+    for asset_id in pending:
+        _completion_misses.set((address, asset_id), True)
+    print(f"[GetNFTs] Completion times: {len(completions)} cached, {len(found)} resolved, {len(pending)} unresolved")
+    completions.update(found)
+    return completions
+
+
 async def get_freelancer_nfts(address: str) -> dict:
     """
     Uses the Indexer to find all POWCERT NFTs for an address.
     Filters by unit_name = "POWCERT".
+
+    Holdings are listed once; asset params come from a per-asset cache or
+    from concurrent bounded lookups instead of one sequential call per asset.
     
     Args:
         address: Algorand address of the freelancer
@@ -489,19 +1350,14 @@ async def get_freelancer_nfts(address: str) -> dict:
     Returns:
         dict with freelancer_address, total_jobs, and certificates list
     """
-    indexer_client = algorand_client.client.indexer
-    
     try:
         # Query assets owned by address
-        response = indexer_client.lookup_account_assets(address)
+        asset_ids = await _list_account_asset_ids(address)
+        asset_params = await _get_asset_params(asset_ids)
         
         certificates = []
-        for asset_info in response.get("assets", []):
-            asset_id = asset_info["asset-id"]
-            
-            # Get asset details to check unit name
-            asset_details = indexer_client.lookup_asset_by_id(asset_id)
-            params = asset_details.get("asset", {}).get("params", {})
+        for asset_id in asset_ids:
+            params = asset_params.get(asset_id, {})
             
             # Filter for POWCERT NFTs
             if params.get("unit-name") == "POWCERT":
@@ -515,10 +1371,15 @@ async def get_freelancer_nfts(address: str) -> dict:
                     "job_title": job_title,
                     "ipfs_url": params.get("url", ""),  # Should be "ipfs://..."
                     "client_address": params.get("creator", ""),  # Contract creator
-                    "completed_at": 0,  # TODO: Could query transaction timestamp from indexer
+                    "completed_at": 0,  # Filled in below
                     "block_explorer": f"https://testnet.explorer.perawallet.app/asset/{asset_id}"
                 })
         
+        # Fill completion timestamps with one batched query for all certificates
+        completion_times = await _get_completion_times(address, [c["asset_id"] for c in certificates])
+        for certificate in certificates:
+            certificate["completed_at"] = completion_times.get(certificate["asset_id"], 0)
+
         print(f"[GetNFTs] Found {len(certificates)} POWCERT certificates for {address}")
         
         return {
@@ -537,9 +1398,362 @@ async def get_freelancer_nfts(address: str) -> dict:
         }
 
 
-# Simple in-memory cache for job listings
-_job_list_cache = {}
-_cache_timeout = 30  # seconds
+# --- Job Index ---
+# Jobs are listed from a local SQLite index that a background loop keeps in
+# sync with the Indexer, instead of scanning every deployed app per request.
+
+# Full re-syncs only reconcile; the block follower applies changes as they land
+JOB_INDEX_SYNC_INTERVAL = int(os.getenv("JOB_INDEX_SYNC_INTERVAL", "300"))  # seconds
+
+job_index = JobIndex()
+_job_index_sync_lock = asyncio.Lock()
+_background_tasks: list[asyncio.Task] = []
+
+# Bounded LRU+TTL cache for job listing pages, invalidated on our own writes
+JOB_LIST_CACHE_SIZE = int(os.getenv("JOB_LIST_CACHE_SIZE", "256"))  # entries
+JOB_LIST_CACHE_TTL = float(os.getenv("JOB_LIST_CACHE_TTL", "30"))  # seconds
+_job_list_cache = TTLCache(max_size=JOB_LIST_CACHE_SIZE, ttl=JOB_LIST_CACHE_TTL, name="job_list")
+
+def _decode_global_state(global_state: list[dict]) -> dict:
+    """
+    Decodes raw global state from algod/Indexer into {key: bytes | int}.
+    All AlgoFreelance fields are ARC4 values, so they arrive as bytes.
+    """
+    state_dict = {}
+    for state_item in global_state:
+        value_obj = state_item.get("value", {})
+        try:
+            key_decoded = base64.b64decode(state_item.get("key", "")).decode('utf-8')
+        except Exception:
+            continue
+
+        if value_obj.get("type") == 1:  # bytes
+            state_dict[key_decoded] = base64.b64decode(value_obj.get("bytes", ""))
+        elif value_obj.get("type") == 2:  # uint
+            state_dict[key_decoded] = value_obj.get("uint", 0)
+    return state_dict
+
+
+def _state_uint(value: bytes | int | None) -> int:
+    """arc4.UInt64 is stored as 8 big-endian bytes."""
+    if isinstance(value, bytes):
+        return int.from_bytes(value, "big") if value else 0
+    return value or 0
+
+
+def _state_string(value: bytes | None) -> str:
+    """arc4.String is stored with a 2-byte length prefix."""
+    if not value:
+        return ""
+    if len(value) >= 2 and int.from_bytes(value[:2], "big") == len(value) - 2:
+        value = value[2:]
+    return value.decode('utf-8', errors='replace')
+
+
+def _state_address(value: bytes | None) -> str:
+    """arc4.Address is stored as the raw 32-byte public key."""
+    from algosdk import encoding
+    if isinstance(value, bytes) and len(value) == 32:
+        return encoding.encode_address(value)
+    return ""
+
+
+def _job_summary_from_app(app_info: dict) -> dict | None:
+    """
+    Builds a JobSummary-shaped dict from an Indexer application record.
+    Returns None for apps that were never initialized as jobs.
+    """
+    from algosdk.logic import get_application_address
+
+    app_id = app_info.get("id")
+    state_dict = _decode_global_state(app_info.get("params", {}).get("global-state", []))
+    if "job_status" not in state_dict:
+        return None
+
+    job_status_val = _state_uint(state_dict.get("job_status"))
+    return {
+        "app_id": app_id,
+        "job_title": _state_string(state_dict.get("job_title")),
+        "job_status": job_status_val,
+        "status_string": _LIST_STATUS_MAP.get(job_status_val, "Unknown"),
+        "escrow_amount": _state_uint(state_dict.get("escrow_amount")),
+        "client_address": _state_address(state_dict.get("client_address")),
+        "freelancer_address": _state_address(state_dict.get("freelancer_address")),
+        "created_at": _state_uint(state_dict.get("created_at")),
+        "contract_address": get_application_address(app_id),
+    }
+
+
+async def _iter_creator_app_pages(creator: str) -> AsyncIterator[list[dict]]:
+    """
+    Walks every page of apps created by `creator`, following the Indexer's
+    next-token. The next page is requested while the caller processes the
+    current one, and only one page is held in memory at a time.
+
+    Args:
+        creator: Address that created the applications
+
+    Yields:
+        List of Indexer application records for each page
+    """
+    def fetch_page(next_token: str | None):
+        return indexer.lookup_account_application_by_creator(
+            creator, limit=INDEXER_PAGE_LIMIT, next_page=next_token
+        )
+
+    pending = asyncio.create_task(fetch_page(None))
+    try:
+        while pending is not None:
+            response = await pending
+            apps = response.get("applications", [])
+            next_token = response.get("next-token")
+
+            # Prefetch the next page before handing this one to the caller
+            pending = asyncio.create_task(fetch_page(next_token)) if next_token and apps else None
+            yield apps
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def _iter_creator_jobs(creator: str) -> AsyncIterator[list[dict]]:
+    """Decodes each page from _iter_creator_app_pages() into job summaries."""
+    async for apps in _iter_creator_app_pages(creator):
+        jobs = []
+        for app_info in apps:
+            try:
+                job = _job_summary_from_app(app_info)
+            except Exception as e:
+                print(f"[JobIndex] Error parsing app {app_info.get('id')}: {e}")
+                continue
+            if job is not None:
+                jobs.append(job)
+        yield jobs
+
+
+async def sync_job_index() -> int:
+    """
+    Refreshes the local job index from the Indexer.
+    Streams every page of apps created by each deployer in the pool, upserts
+    each page as it is decoded and prunes apps that no longer exist.
+
+    Returns:
+        Number of jobs in the index after the sync
+    """
+    async with _job_index_sync_lock:
+        creators = deployer_pool.addresses
+        print(f"[JobIndex] Syncing applications created by {len(creators)} deployer(s)")
+
+        seen_app_ids: set[int] = set()
+        pages = 0
+        for creator in creators:
+            async for jobs in _iter_creator_jobs(creator):
+                job_index.upsert_jobs(jobs)
+                seen_app_ids.update(job["app_id"] for job in jobs)
+                pages += 1
+
+        removed = job_index.prune(seen_app_ids)
+        job_index.mark_synced()
+
+        print(f"[JobIndex] Synced {len(seen_app_ids)} jobs from {pages} page(s) ({removed} removed)")
+        return len(seen_app_ids)
+
+
+async def refresh_indexed_jobs(app_ids: list[int]) -> None:
+    """
+    Re-reads specific apps from algod and updates their index rows.
+    Used after the backend itself writes to those apps and for every job
+    event seen by the block follower.
+    """
+    results = await asyncio.gather(
+        *(algod.application_info(app_id) for app_id in app_ids), return_exceptions=True
+    )
+    jobs = []
+    for app_id, app_info in zip(app_ids, results):
+        if isinstance(app_info, Exception):
+            print(f"[JobIndex] Could not refresh app {app_id}: {app_info}")
+            continue
+        job = _job_summary_from_app(app_info)
+        if job is not None:
+            jobs.append(job)
+    job_index.upsert_jobs(jobs)
+
+
+async def invalidate_job_listings(app_ids: list[int] | None = None) -> None:
+    """
+    Invalidation hook for backend writes (deploy, fund, broadcast).
+    Drops cached job details for the affected apps, refreshes their index
+    rows and drops every cached listing page, so the next GET request
+    reflects the write immediately.
+
+    Args:
+        app_ids: Apps touched by the write, if known
+    """
+    if app_ids:
+        for app_id in app_ids:
+            _job_details_cache.invalidate(app_id)
+        await refresh_indexed_jobs(app_ids)
+    _job_list_cache.invalidate()
+    print(f"[ListJobs] Cache invalidated (apps: {app_ids or 'all'})")
+
+
+def _app_ids_in_signed_transactions(signed_txn_bytes: bytes) -> list[int]:
+    """Extracts the app IDs called by a (possibly grouped) signed transaction blob."""
+    from algosdk import encoding, transaction
+    import msgpack
+
+    app_ids = []
+    try:
+        for raw in msgpack.Unpacker(io.BytesIO(signed_txn_bytes), raw=False, strict_map_key=False):
+            stxn = encoding.msgpack_decode(raw)
+            txn = getattr(stxn, "transaction", stxn)
+            if isinstance(txn, transaction.ApplicationCallTxn) and txn.index:
+                app_ids.append(txn.index)
+    except Exception as e:
+        print(f"[Broadcast] Could not decode app IDs from signed transaction: {e}")
+    return app_ids
+
+
+# --- Block Follower ---
+# One block stream for the whole process. Every app call to a job contract
+# (or app created by the deployer) becomes an event; the caches above
+# subscribe to it instead of polling application_info per app.
+
+def _is_followed_app(app_id: int) -> bool:
+    return app_id in _job_details_cache or job_index.get(app_id) is not None
+
+
+block_follower = BlockFollower(algod, is_tracked=_is_followed_app, creators=set(deployer_pool.addresses))
+job_event_broadcaster = JobEventBroadcaster()
+
+# Comment line sent on idle event streams so proxies keep the connection open
+JOB_EVENTS_KEEPALIVE = float(os.getenv("JOB_EVENTS_KEEPALIVE", "15"))  # seconds
+
+
+async def _apply_job_events(events: list[dict]) -> None:
+    """Block follower listener: brings job details, index rows and listings up to date."""
+    if not events:
+        # Follower lost the stream; nothing cached can be vouched for
+        _job_details_cache.invalidate()
+        _job_list_cache.invalidate()
+        await _push_job_updates(job_event_broadcaster.subscribed_app_ids(), None)
+        return
+
+    app_ids = sorted({event["app_id"] for event in events})
+    for app_id in app_ids:
+        _job_details_cache.invalidate(app_id)
+    await refresh_indexed_jobs(app_ids)
+    _job_list_cache.invalidate()
+    await _push_job_updates(app_ids, events[-1]["round"])
+    print(f"[BlockFollower] Round {events[-1]['round']}: {len(events)} job event(s) for apps {app_ids}")
+
+
+async def _push_job_updates(app_ids: list[int], round_num: int | None) -> None:
+    """Reads each watched app once and fans the snapshot out to its event streams."""
+    watched = [app_id for app_id in app_ids if job_event_broadcaster.has_subscribers(app_id)]
+    results = await asyncio.gather(
+        *(get_job_details_from_state(app_id) for app_id in watched), return_exceptions=True
+    )
+    for app_id, job in zip(watched, results):
+        if isinstance(job, Exception):
+            print(f"[JobEvents] Could not read app {app_id}: {job}")
+            continue
+        job_event_broadcaster.publish(app_id, {"round": round_num, "job": job})
+
+
+block_follower.add_listener(_apply_job_events)
+# Per-round work rides on the same block stream instead of its own long-poll
+block_follower.add_round_listener(suggested_params_provider.on_round)
+block_follower.add_round_listener(confirmation_tracker.on_round)
+
+
+async def _apply_confirmed_transaction(record: dict) -> None:
+    """Confirmation tracker listener: our own writes show up without waiting for the follower."""
+    if record["app_ids"]:
+        await invalidate_job_listings(record["app_ids"])
+
+
+confirmation_tracker.add_listener(_apply_confirmed_transaction)
+
+
+def _format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def job_event_stream(app_id: int) -> AsyncIterator[str]:
+    """
+    Server-Sent Events stream of one job's state.
+
+    Starts with the current job details, then sends a new snapshot whenever
+    the block follower sees a transaction touch the app. All subscribers of
+    an app share one state read per change.
+
+    Args:
+        app_id: Application ID of the deployed contract
+
+    Yields:
+        SSE-formatted "job" events and keep-alive comments
+    """
+    # Subscribe before the first read so no change can slip in between
+    queue = job_event_broadcaster.subscribe(app_id)
+    try:
+        job = await get_job_details_from_state(app_id)
+        yield _format_sse("job", {"round": block_follower.last_round or None, "job": job})
+        while True:
+            try:
+                update = await asyncio.wait_for(queue.get(), timeout=JOB_EVENTS_KEEPALIVE)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield _format_sse("job", update)
+    finally:
+        job_event_broadcaster.unsubscribe(app_id, queue)
+
+
+def get_cache_stats() -> dict:
+    """Hit/miss/eviction counters for the service caches."""
+    return {
+        "job_list": _job_list_cache.stats(),
+        "job_details": _job_details_cache.stats(),
+        "asset_params": _asset_params_cache.stats(),
+        "asset_params_disk": asset_params_store.stats(),
+        "completion_misses": _completion_misses.stats(),
+        "suggested_params": suggested_params_provider.stats(),
+        "contract_programs": dict(_program_stats),
+        "deployer_pool": deployer_pool.stats(),
+        "block_follower": block_follower.stats(),
+        "job_events": job_event_broadcaster.stats(),
+        "confirmations": confirmation_tracker.stats(),
+    }
+
+
+async def _run_job_index_sync_loop() -> None:
+    """Keeps the job index fresh for the lifetime of the process."""
+    while True:
+        try:
+            await sync_job_index()
+        except Exception as e:
+            print(f"[JobIndex] Sync failed: {e}")
+        await asyncio.sleep(JOB_INDEX_SYNC_INTERVAL)
+
+
+def start_background_tasks() -> None:
+    """Starts long-running service tasks. Called from the app lifespan."""
+    _background_tasks.append(asyncio.create_task(_run_job_index_sync_loop()))
+    _background_tasks.append(asyncio.create_task(block_follower.run()))
+    _background_tasks.append(asyncio.create_task(deployer_pool.run()))
+
+
+async def stop_background_tasks() -> None:
+    """Cancels the tasks started by start_background_tasks()."""
+    for task in _background_tasks:
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
+    await deployer_pool.aclose()
+    _algod_executor.shutdown(wait=False, cancel_futures=True)
+    await algod.aclose()
+    await indexer.aclose()
 
 
 async def list_jobs(
@@ -547,166 +1761,81 @@ async def list_jobs(
     client_address: str | None = None,
     freelancer_address: str | None = None,
     limit: int = 10,
-    offset: int = 0
+    offset: int = 0,
+    cursor: str | None = None
 ) -> dict:
     """
-    Query Algorand Indexer to list all AlgoFreelance job contracts.
-    Filters by creator address (deployer) and applies optional filters.
+    Lists AlgoFreelance job contracts from the local job index.
+    The index is kept in sync with the Indexer by a background loop and
+    every filter/page combination is served from its shared in-memory
+    snapshot; the first call syncs it inline if it has never been populated.
     
     Args:
         status: Filter by job status (0=Created, 1=Funded, 2=Submitted, 3=Completed)
         client_address: Filter by client address
         freelancer_address: Filter by freelancer address
         limit: Number of results to return (max 100)
-        offset: Pagination offset
+        offset: Pagination offset (ignored when cursor is given)
+        cursor: Opaque keyset cursor from a previous page's next_cursor
         
     Returns:
-        dict with jobs list, total_count, limit, offset, has_more
+        dict with jobs list, total_count, limit, offset, has_more, next_cursor
+
+    Raises:
+        ValueError if the cursor is malformed
     """
-    import time
-    
+    # Keyset position on (created_at, app_id); stable under new deployments
+    after = decode_cursor(cursor) if cursor else None
+    if after is not None:
+        offset = 0
+
     # Create cache key
-    cache_key = f"{status}:{client_address}:{freelancer_address}:{limit}:{offset}"
+    cache_key = (status, client_address, freelancer_address, limit, offset, after)
     
     # Check cache
-    if cache_key in _job_list_cache:
-        cached_data, cached_time = _job_list_cache[cache_key]
-        if time.time() - cached_time < _cache_timeout:
-            print(f"[ListJobs] Returning cached result for {cache_key}")
-            return cached_data
-    
-    indexer_client = algorand_client.client.indexer
+    cached_data = _job_list_cache.get(cache_key)
+    if cached_data is not None:
+        print(f"[ListJobs] Returning cached result for {cache_key}")
+        return cached_data
     
     try:
-        # Query applications created by deployer
-        print(f"[ListJobs] Querying applications created by {deployer_address}")
-        response = indexer_client.lookup_account_application_by_creator(deployer_address)
-        
-        apps = response.get("applications", [])
-        print(f"[ListJobs] Found {len(apps)} total applications")
-        
-        jobs = []
-        
-        for app_info in apps:
-            app_id = app_info.get("id")
-            
-            try:
-                # Get global state for this application
-                global_state = app_info.get("params", {}).get("global-state", [])
-                
-                # Parse global state
-                state_dict = {}
-                for state_item in global_state:
-                    key = state_item.get("key", "")
-                    value_obj = state_item.get("value", {})
-                    value_type = value_obj.get("type")
-                    
-                    # Decode base64 key
-                    import base64
-                    try:
-                        key_decoded = base64.b64decode(key).decode('utf-8')
-                    except:
-                        continue
-                    
-                    # Extract value
-                    if value_type == 1:  # bytes
-                        value_bytes = base64.b64decode(value_obj.get("bytes", ""))
-                        state_dict[key_decoded] = value_bytes
-                    elif value_type == 2:  # uint
-                        state_dict[key_decoded] = value_obj.get("uint", 0)
-                
-                # Extract job details from state
-                job_status_val = state_dict.get("job_status", 0)
-                job_title_bytes = state_dict.get("job_title", b"")
-                job_title = job_title_bytes.decode('utf-8') if isinstance(job_title_bytes, bytes) else str(job_title_bytes)
-                escrow_amount_val = state_dict.get("escrow_amount", 0)
-                client_addr_bytes = state_dict.get("client_address", b"")
-                freelancer_addr_bytes = state_dict.get("freelancer_address", b"")
-                created_at_val = state_dict.get("created_at", 0)
-                
-                # Decode addresses (they're stored as 32-byte addresses)
-                from algosdk import encoding
-                try:
-                    if len(client_addr_bytes) == 32:
-                        client_addr_str = encoding.encode_address(client_addr_bytes)
-                    else:
-                        client_addr_str = ""
-                    
-                    if len(freelancer_addr_bytes) == 32:
-                        freelancer_addr_str = encoding.encode_address(freelancer_addr_bytes)
-                    else:
-                        freelancer_addr_str = ""
-                except:
-                    client_addr_str = ""
-                    freelancer_addr_str = ""
-                
-                # Apply filters
-                if status is not None and job_status_val != status:
-                    continue
-                
-                if client_address and client_addr_str != client_address:
-                    continue
-                
-                if freelancer_address and freelancer_addr_str != freelancer_address:
-                    continue
-                
-                # Status string mapping
-                status_map = {
-                    0: "Created",
-                    1: "Funded",
-                    2: "Submitted",
-                    3: "Completed",
-                    4: "Canceled"
-                }
-                status_string = status_map.get(job_status_val, "Unknown")
-                
-                # Get contract address
-                contract_address = app_info.get("params", {}).get("address", "")
-                
-                jobs.append({
-                    "app_id": app_id,
-                    "job_title": job_title,
-                    "job_status": job_status_val,
-                    "status_string": status_string,
-                    "escrow_amount": escrow_amount_val,
-                    "client_address": client_addr_str,
-                    "freelancer_address": freelancer_addr_str,
-                    "created_at": created_at_val,
-                    "contract_address": contract_address
-                })
-                
-            except Exception as e:
-                print(f"[ListJobs] Error parsing app {app_id}: {e}")
-                continue
-        
-        # Sort by created_at descending (newest first)
-        jobs.sort(key=lambda x: x["created_at"], reverse=True)
-        
-        # Apply pagination
-        total_count = len(jobs)
-        paginated_jobs = jobs[offset:offset + limit]
-        has_more = (offset + limit) < total_count
+        if not job_index.is_ready:
+            await sync_job_index()
+
+        # Fetch one extra row to know whether another page follows
+        paginated_jobs, total_count = job_index.query(
+            status=status,
+            client_address=client_address,
+            freelancer_address=freelancer_address,
+            limit=limit + 1,
+            offset=offset,
+            after=after,
+        )
+        has_more = len(paginated_jobs) > limit
+        paginated_jobs = paginated_jobs[:limit]
         
         result = {
             "jobs": paginated_jobs,
             "total_count": total_count,
             "limit": limit,
             "offset": offset,
-            "has_more": has_more
+            "has_more": has_more,
+            "next_cursor": encode_cursor(paginated_jobs[-1]) if has_more else None
         }
         
         # Cache result
-        _job_list_cache[cache_key] = (result, time.time())
+        _job_list_cache.set(cache_key, result)
         
         print(f"[ListJobs] Returning {len(paginated_jobs)} jobs (total: {total_count})")
         return result
         
     except Exception as e:
-        print(f"[ListJobs] Error querying applications: {e}")
+        print(f"[ListJobs] Error querying job index: {e}")
         return {
             "jobs": [],
             "total_count": 0,
             "limit": limit,
             "offset": offset,
-            "has_more": False
+            "has_more": False,
+            "next_cursor": None
         }
@@ -0,0 +1,126 @@
+# AlgoFreelance Backend - Asset Params Cache
+# Permanent on-disk cache of ASA params (and certificate completion times)
+# keyed by asset ID.
+# POWCERT certificates are minted with manager/reserve/freeze/clawback zeroed,
+# and an ASA's name, unit name, URL and creator are immutable anyway, so a
+# cached entry never needs to be refreshed from the Indexer.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# Default location: one database per network, next to the job index
+_default_path = (
+    Path(__file__).parent.parent.parent / ".cache"
+    / f"asset_params.{os.getenv('ALGORAND_NETWORK', 'localnet')}.db"
+)
+ASSET_CACHE_PATH = os.getenv("ASSET_CACHE_PATH", str(_default_path))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS asset_params (
+    asset_id INTEGER PRIMARY KEY,
+    params TEXT NOT NULL,
+    cached_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS asset_completions (
+    asset_id INTEGER PRIMARY KEY,
+    completed_at INTEGER NOT NULL
+);
+"""
+
+# SQLite's default limit on bound parameters per statement
+_MAX_VARIABLES = 900
+
+
+class AssetParamsStore:
+    """
+    SQLite store of Indexer asset params (the "params" object of
+    lookup_asset_by_id) that survives restarts. Also records when each
+    POWCERT certificate was delivered, which is just as immutable.
+    """
+
+    def __init__(self, db_path: str = ASSET_CACHE_PATH):
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, asset_ids: list[int]) -> dict[int, dict]:
+        """
+        Returns:
+            {asset_id: params} for every requested asset found on disk
+        """
+        found = {}
+        with self._lock:
+            for start in range(0, len(asset_ids), _MAX_VARIABLES):
+                chunk = asset_ids[start:start + _MAX_VARIABLES]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = self._conn.execute(
+                    f"SELECT asset_id, params FROM asset_params WHERE asset_id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update((asset_id, json.loads(params)) for asset_id, params in rows)
+        self.hits += len(found)
+        self.misses += len(asset_ids) - len(found)
+        return found
+
+    def put_many(self, params_by_id: dict[int, dict]) -> None:
+        if not params_by_id:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO asset_params (asset_id, params, cached_at) VALUES (?, ?, ?)",
+                [(asset_id, json.dumps(params), now) for asset_id, params in params_by_id.items()],
+            )
+            self._conn.commit()
+
+    def get_completions(self, asset_ids: list[int]) -> dict[int, int]:
+        """
+        Returns:
+            {asset_id: completed_at} for every requested asset with a known completion time
+        """
+        found = {}
+        with self._lock:
+            for start in range(0, len(asset_ids), _MAX_VARIABLES):
+                chunk = asset_ids[start:start + _MAX_VARIABLES]
+                placeholders = ", ".join("?" for _ in chunk)
+                found.update(self._conn.execute(
+                    f"SELECT asset_id, completed_at FROM asset_completions WHERE asset_id IN ({placeholders})",
+                    chunk,
+                ).fetchall())
+        return found
+
+    def put_completions(self, completed_at_by_id: dict[int, int]) -> None:
+        if not completed_at_by_id:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO asset_completions (asset_id, completed_at) VALUES (?, ?)",
+                list(completed_at_by_id.items()),
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM asset_params").fetchone()[0]
+        return {
+            "name": "asset_params_disk",
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
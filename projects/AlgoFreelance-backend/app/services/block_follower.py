@@ -0,0 +1,251 @@
+# AlgoFreelance Backend - Block Follower
+# Follows new blocks once with status_after_block, extracts every app call
+# that targets an AlgoFreelance job (or creates one from a deployer account)
+# and publishes state-change events to caches and other subscribers.
+# One block stream replaces per-app polling of application_info; services
+# that need a per-round tick (confirmation tracking, suggested params)
+# subscribe to it as round listeners instead of long-polling on their own.
+
+import asyncio
+import base64
+import os
+from collections import deque
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+if TYPE_CHECKING:  # annotation only: keeps this module importable without httpx
+    from .algod_http import AsyncAlgodClient
+
+# Listener signature: receives the job events of one or more consecutive blocks, in block order
+BlockListener = Callable[[list[dict]], Awaitable[None]]
+# Round listener signature: receives the newest round number, in increasing order
+RoundListener = Callable[[int], Awaitable[None]]
+
+# Apps created by a deployer that are followed before the job index knows them
+FOLLOWER_CREATED_APPS_MAX = int(os.getenv("FOLLOWER_CREATED_APPS_MAX", "10000"))
+
+
+def _decode_global_delta(global_delta: dict) -> dict:
+    """
+    Decodes an eval-delta "gd" map into {key: bytes | int | None}.
+    Action 1 sets bytes, 2 sets a uint, 3 deletes the key.
+
+    In JSON blocks the delta keys and "bs" values are plain JSON strings of
+    the raw bytes (only []byte fields such as "apaa" are base64). Bytes
+    that are not valid UTF-8 reach us as U+FFFD, so such values cannot be
+    recovered from this format and are left out; the key still shows up in
+    the event's changed_keys.
+    """
+    changes = {}
+    for key, delta in global_delta.items():
+        action = delta.get("at")
+        if action == 1:
+            value = delta.get("bs", "")
+            if "\ufffd" not in value:
+                changes[key] = value.encode("utf-8")
+        elif action == 2:
+            changes[key] = delta.get("ui", 0)
+        else:
+            changes[key] = None
+    return changes
+
+
+class _ListenerWorker:
+    """
+    Runs one listener in its own task, so a slow listener (an algod read,
+    say) never holds up block following or the other listeners.
+
+    Calls are made one at a time and in order. Block events that pile up
+    while the listener is busy are merged into one call; round listeners
+    only get the newest round, since every round check looks at the
+    current state anyway. An empty events list (stream lost) replaces
+    anything still pending, as it invalidates everything.
+    """
+
+    def __init__(self, listener: Callable[..., Awaitable[None]], kind: str, latest_only: bool = False):
+        self.listener = listener
+        self.name = f"{kind} {getattr(listener, '__name__', listener)}"
+        self.latest_only = latest_only
+        self._pending: deque = deque()
+        self._wakeup = asyncio.Event()
+
+    @property
+    def backlog(self) -> int:
+        return len(self._pending)
+
+    def put(self, item) -> None:
+        if self.latest_only or item == []:
+            self._pending.clear()
+        elif self._pending and self._pending[-1]:
+            self._pending[-1] = self._pending[-1] + item
+            return
+        self._pending.append(item)
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            item = self._pending.popleft()
+            try:
+                await self.listener(item)
+            except Exception as e:
+                print(f"[BlockFollower] {self.name} failed: {e}")
+
+
+class BlockFollower:
+    """
+    Single block stream for the whole backend.
+
+    Every round is processed exactly once and in order, even after falling
+    behind. For each block, events are emitted for app calls whose target is
+    tracked (`is_tracked(app_id)`) or that create an app from one of
+    `creators`; apps created that way are followed from then on. An event
+    is a dict:
+
+        {
+            "app_id": int,
+            "round": int,
+            "timestamp": int,         # block time (unix seconds)
+            "sender": str,
+            "created": bool,          # True for the app creation transaction
+            "method_selector": str,   # hex ABI selector, "" for bare calls
+            "changed_keys": list,     # every global key in the state delta
+            "state_changes": dict,    # decoded values that JSON blocks carry exactly
+        }
+
+    Listeners are called for blocks that have events. After losing the
+    block stream they are called with an empty list, meaning "anything may
+    have changed while nobody was watching". Round listeners are called as
+    rounds pass (events or not), starting with the round the follower picks
+    up from. Each listener runs in its own task (see _ListenerWorker) while
+    `run` is active, so listeners never delay the next block.
+
+    Created apps are remembered until `is_tracked` reports them (the job
+    index picked them up), at most `created_apps_max` at a time.
+    """
+
+    def __init__(
+        self,
+        algod: "AsyncAlgodClient",
+        is_tracked: Callable[[int], bool],
+        creators: set[str],
+        created_apps_max: int = FOLLOWER_CREATED_APPS_MAX,
+    ):
+        self.algod = algod
+        self.is_tracked = is_tracked
+        self.creators = creators
+        self.created_apps_max = created_apps_max
+        self.last_round = 0
+        self.events_published = 0
+        # Insertion-ordered, so the oldest entry goes first when full
+        self._created_app_ids: dict[int, None] = {}
+        self._listeners: list[_ListenerWorker] = []
+        self._round_listeners: list[_ListenerWorker] = []
+
+    def add_listener(self, listener: BlockListener) -> None:
+        self._listeners.append(_ListenerWorker(listener, "Listener"))
+
+    def add_round_listener(self, listener: RoundListener) -> None:
+        self._round_listeners.append(_ListenerWorker(listener, "Round listener", latest_only=True))
+
+    def _remember_created(self, app_id: int) -> None:
+        self._created_app_ids[app_id] = None
+        while len(self._created_app_ids) > self.created_apps_max:
+            del self._created_app_ids[next(iter(self._created_app_ids))]
+
+    def _is_followed(self, app_id: int) -> bool:
+        if self.is_tracked(app_id):
+            # Indexed now: no need to remember it separately any more
+            self._created_app_ids.pop(app_id, None)
+            return True
+        return app_id in self._created_app_ids
+
+    def extract_events(self, block: dict, round_num: int) -> list[dict]:
+        """Job events for one JSON-format block, including inner app calls."""
+        header = block.get("block", {})
+        timestamp = header.get("ts", 0)
+        events = []
+
+        def visit(stxn: dict) -> None:
+            txn = stxn.get("txn", {})
+            if txn.get("type") == "appl":
+                created = not txn.get("apid")
+                app_id = stxn.get("apid") if created else txn.get("apid")
+                sender = txn.get("snd", "")
+                if created and sender in self.creators:
+                    self._remember_created(app_id)
+                if app_id and self._is_followed(app_id):
+                    app_args = txn.get("apaa", [])
+                    global_delta = stxn.get("dt", {}).get("gd", {})
+                    events.append({
+                        "app_id": app_id,
+                        "round": round_num,
+                        "timestamp": timestamp,
+                        "sender": sender,
+                        "created": created,
+                        "method_selector": base64.b64decode(app_args[0])[:4].hex() if app_args else "",
+                        "changed_keys": sorted(global_delta),
+                        "state_changes": _decode_global_delta(global_delta),
+                    })
+            for inner in stxn.get("dt", {}).get("itx", []):
+                visit(inner)
+
+        for stxn in header.get("txns", []):
+            visit(stxn)
+        return events
+
+    def _publish(self, events: list[dict]) -> None:
+        self.events_published += len(events)
+        for worker in self._listeners:
+            worker.put(events)
+
+    def _tick(self, round_num: int) -> None:
+        for worker in self._round_listeners:
+            worker.put(round_num)
+
+    async def run(self) -> None:
+        """Follows the chain for the lifetime of the process."""
+        workers = [asyncio.create_task(worker.run()) for worker in (*self._listeners, *self._round_listeners)]
+        try:
+            await self._follow()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _follow(self) -> None:
+        while True:
+            try:
+                status = await self.algod.status()
+                self.last_round = status["last-round"]
+                print(f"[BlockFollower] Following blocks from round {self.last_round}")
+                self._tick(self.last_round)
+                while True:
+                    status = await self.algod.status_after_block(self.last_round)
+                    # Process every block we may have missed, in order
+                    for round_num in range(self.last_round + 1, status["last-round"] + 1):
+                        block = await self.algod.block_info(round_num)
+                        events = self.extract_events(block, round_num)
+                        if events:
+                            self._publish(events)
+                        self.last_round = round_num
+                        self._tick(round_num)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[BlockFollower] Lost block stream: {e}")
+                self._publish([])
+                self.last_round = 0
+                await asyncio.sleep(5)
+
+    def stats(self) -> dict:
+        return {
+            "last_round": self.last_round,
+            "events_published": self.events_published,
+            "listeners": len(self._listeners),
+            "round_listeners": len(self._round_listeners),
+            "listener_backlog": sum(worker.backlog for worker in (*self._listeners, *self._round_listeners)),
+            "created_apps": len(self._created_app_ids),
+        }
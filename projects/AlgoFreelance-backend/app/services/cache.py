@@ -0,0 +1,77 @@
+# AlgoFreelance Backend - In-Memory Caches
+# Size-bounded LRU cache with per-entry TTL and hit/miss/eviction counters
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    LRU cache whose entries also expire after `ttl` seconds.
+
+    The least recently used entry is evicted once `max_size` is reached, so
+    memory stays bounded no matter how many distinct keys are requested.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 30.0, name: str = "cache"):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.name = name
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Membership test that does not count as a hit or refresh recency."""
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the cached value, or None on a miss or expired entry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, stored_at = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drops one entry, or every entry when no key is given."""
+        if key is None:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+        elif self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,135 @@
+# AlgoFreelance Backend - Confirmation Tracker
+# Tracks every transaction broadcast through the backend from the shared
+# block stream, so POST /api/v1/broadcast can return as soon as algod
+# accepts the transaction instead of holding the request open for a round.
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+if TYPE_CHECKING:  # annotation only: keeps this module importable without httpx
+    from .algod_http import AsyncAlgodClient
+from .exceptions import AlgorandNodeError
+
+# Rounds after submission before a transaction that never confirmed is given up on
+TXN_TRACKING_MAX_ROUNDS = int(os.getenv("TXN_TRACKING_MAX_ROUNDS", "20"))
+# Finished (confirmed/failed/expired) records kept for status lookups
+TXN_TRACKING_HISTORY = int(os.getenv("TXN_TRACKING_HISTORY", "10000"))
+
+# Listener signature: receives a record when its transaction confirms
+ConfirmationListener = Callable[[dict], Awaitable[None]]
+
+
+class ConfirmationTracker:
+    """
+    Watches pending transaction IDs across all requests.
+
+    `on_round` is registered as a BlockFollower round listener: for each
+    new round it is handed (the newest one if several passed during the
+    last check), every pending transaction is checked with
+    pending_transaction_info concurrently. A record is a dict:
+
+        {
+            "txn_id": str,
+            "status": "pending" | "confirmed" | "failed" | "expired",
+            "submitted_round": int | None,
+            "confirmed_round": int | None,
+            "pool_error": str | None,
+            "app_ids": list[int],   # apps called by the transaction (group)
+            "submitted_at": float,  # unix seconds
+        }
+
+    Rounds without pending transactions cost nothing.
+    """
+
+    def __init__(
+        self,
+        algod: "AsyncAlgodClient",
+        max_rounds: int = TXN_TRACKING_MAX_ROUNDS,
+        history: int = TXN_TRACKING_HISTORY,
+    ):
+        self.algod = algod
+        self.max_rounds = max_rounds
+        self.history = history
+        self._pending: dict[str, dict] = {}
+        self._finished: OrderedDict[str, dict] = OrderedDict()
+        self._listeners: list[ConfirmationListener] = []
+        self.confirmed = 0
+        self.failed = 0
+        self.expired = 0
+
+    def add_listener(self, listener: ConfirmationListener) -> None:
+        self._listeners.append(listener)
+
+    def track(self, txn_id: str, app_ids: list[int] | None = None, submitted_round: int | None = None) -> dict:
+        """Starts tracking a transaction that algod has accepted."""
+        record = self.get(txn_id)
+        if record is not None:
+            # Resubmitted bytes: same transaction, keep the existing record
+            return record
+        record = {
+            "txn_id": txn_id,
+            "status": "pending",
+            "submitted_round": submitted_round,
+            "confirmed_round": None,
+            "pool_error": None,
+            "app_ids": app_ids or [],
+            "submitted_at": time.time(),
+        }
+        self._pending[txn_id] = record
+        return record
+
+    def get(self, txn_id: str) -> dict | None:
+        record = self._pending.get(txn_id) or self._finished.get(txn_id)
+        return dict(record) if record is not None else None
+
+    def _finish(self, record: dict, status: str) -> None:
+        record["status"] = status
+        self._pending.pop(record["txn_id"], None)
+        self._finished[record["txn_id"]] = record
+        while len(self._finished) > self.history:
+            self._finished.popitem(last=False)
+
+    async def _check(self, record: dict, current_round: int) -> None:
+        try:
+            info = await self.algod.pending_transaction_info(record["txn_id"])
+        except AlgorandNodeError as e:
+            # 404: not in the pool (yet) - decided by expiry below
+            if e.status_code != 404:
+                print(f"[Confirmations] Could not check {record['txn_id']}: {e}")
+            info = {}
+
+        if record["submitted_round"] is None:
+            record["submitted_round"] = current_round
+
+        if info.get("confirmed-round"):
+            record["confirmed_round"] = info["confirmed-round"]
+            self._finish(record, "confirmed")
+            self.confirmed += 1
+            for listener in self._listeners:
+                try:
+                    await listener(dict(record))
+                except Exception as e:
+                    print(f"[Confirmations] Listener failed for {record['txn_id']}: {e}")
+        elif info.get("pool-error"):
+            record["pool_error"] = info["pool-error"]
+            self._finish(record, "failed")
+            self.failed += 1
+        elif current_round > record["submitted_round"] + self.max_rounds:
+            self._finish(record, "expired")
+            self.expired += 1
+
+    async def on_round(self, round_num: int) -> None:
+        """Round listener: checks every pending transaction against the new round."""
+        if self._pending:
+            await asyncio.gather(*(self._check(record, round_num) for record in list(self._pending.values())))
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "confirmed": self.confirmed,
+            "failed": self.failed,
+            "expired": self.expired,
+        }
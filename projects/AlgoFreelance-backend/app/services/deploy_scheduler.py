@@ -0,0 +1,167 @@
+# AlgoFreelance Backend - Deploy Scheduler
+# Serializes every contract deployment of a deployer account through one
+# async queue. Requests that arrive together are coalesced into atomic
+# groups, and the number of groups in flight is bounded, so concurrent
+# deploys share confirmation waits instead of colliding with each other.
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Awaitable, Callable
+
+# How long the scheduler waits for more requests before sending a partial group
+DEPLOY_COALESCE_WINDOW = float(os.getenv("DEPLOY_COALESCE_WINDOW", "0.05"))  # seconds
+# Groups submitted but not yet confirmed, per deployer
+DEPLOY_MAX_IN_FLIGHT = int(os.getenv("DEPLOY_MAX_IN_FLIGHT", "4"))
+
+# Sends one group of jobs; returns one result dict per job, in order
+GroupSender = Callable[[list], Awaitable[list[dict]]]
+
+
+class RetrySeparately(Exception):
+    """
+    Returned by a GroupSender in place of a job's result when the group was
+    rejected as a whole and nothing from it reached the chain. The job is
+    queued again and sent in a group of its own.
+    """
+
+
+class DeployScheduler:
+    """
+    Coalescing deploy queue for one deployer account.
+
+    `submit(job)` enqueues a job and waits for its result. A single worker
+    takes the first waiting job, gathers whatever else arrives within
+    `coalesce_window` (up to `max_group_size` jobs) and hands the group to
+    `send_group` as a background task, at most `max_in_flight` at a time.
+    Jobs of a rejected group that come back as RetrySeparately are requeued
+    and sent alone, under the same in-flight bound.
+
+    The worker starts on first use in the running event loop, so scripts
+    that call the service directly work without the app lifespan.
+    """
+
+    def __init__(
+        self,
+        send_group: GroupSender,
+        max_group_size: int = 16,
+        coalesce_window: float = DEPLOY_COALESCE_WINDOW,
+        max_in_flight: int = DEPLOY_MAX_IN_FLIGHT,
+    ):
+        self.send_group = send_group
+        self.max_group_size = max_group_size
+        self.coalesce_window = coalesce_window
+        self.max_in_flight = max_in_flight
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._worker: asyncio.Task | None = None
+        self._in_flight: set[asyncio.Task] = set()
+        # Requeued jobs picked up by the worker while it was coalescing
+        self._solo: deque = deque()
+        self.in_flight_jobs = 0
+        self.groups_sent = 0
+        self.jobs_sent = 0
+        self.jobs_retried = 0
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # New event loop (e.g. a second asyncio.run in a script): start fresh
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._worker = None
+            self._in_flight = set()
+            self._solo = deque()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, job) -> dict:
+        """Queues one job for deployment and returns its result."""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((job, future, True))
+        return await future
+
+    async def _collect_group(self) -> list[tuple]:
+        if self._solo:
+            return [self._solo.popleft()]
+        first = await self._queue.get()
+        if not first[2]:
+            return [first]
+        group = [first]
+        deadline = time.monotonic() + self.coalesce_window
+        while len(group) < self.max_group_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if item[2]:
+                group.append(item)
+            else:
+                self._solo.append(item)
+        return group
+
+    async def _run(self) -> None:
+        while True:
+            await self._slots.acquire()
+            try:
+                group = await self._collect_group()
+            except BaseException:
+                self._slots.release()
+                raise
+            task = asyncio.create_task(self._send(group))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, group: list[tuple]) -> None:
+        jobs = [job for job, _, _ in group]
+        self.in_flight_jobs += len(jobs)
+        try:
+            results = await self.send_group(jobs)
+            if len(results) != len(jobs):
+                # Never leave a submitter waiting on a result that will not come
+                raise RuntimeError(f"Deploy group returned {len(results)} results for {len(jobs)} jobs")
+        except Exception as e:
+            results = [e] * len(group)
+        finally:
+            self.in_flight_jobs -= len(jobs)
+            self._slots.release()
+
+        self.groups_sent += 1
+        self.jobs_sent += len(jobs)
+        for (job, future, _), result in zip(group, results):
+            if future.done():
+                continue
+            if isinstance(result, RetrySeparately) and len(group) > 1:
+                # Its slot is released above, so the retry waits its turn like any group
+                self.jobs_retried += 1
+                self._queue.put_nowait((job, future, False))
+            elif isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def aclose(self) -> None:
+        """Cancels the worker and any groups still being sent."""
+        tasks = [task for task in (self._worker, *self._in_flight) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+
+    def stats(self) -> dict:
+        return {
+            "queued": (self._queue.qsize() if self._queue is not None else 0) + len(self._solo),
+            "in_flight_groups": len(self._in_flight),
+            "in_flight_jobs": self.in_flight_jobs,
+            "groups_sent": self.groups_sent,
+            "jobs_sent": self.jobs_sent,
+            "jobs_retried": self.jobs_retried,
+            "avg_group_size": round(self.jobs_sent / self.groups_sent, 2) if self.groups_sent else None,
+        }
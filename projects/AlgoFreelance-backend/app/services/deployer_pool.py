@@ -0,0 +1,185 @@
+# AlgoFreelance Backend - Deployer Pool
+# Spreads contract deployments across several deployer accounts. Each
+# deployer has its own DeployScheduler; new jobs go to the least-loaded
+# healthy deployer. A background loop watches balances (every created app
+# raises its creator's minimum balance) and tops deployers up from an
+# optional treasury account.
+
+import asyncio
+import base64
+import os
+from typing import Awaitable, Callable
+
+from algosdk import account, encoding, transaction
+
+from .algod_http import AsyncAlgodClient
+from .confirmation_tracker import ConfirmationTracker
+from .deploy_scheduler import DeployScheduler
+from .suggested_params import SuggestedParamsProvider
+
+# Spendable balance (above the minimum balance) below which a deployer is topped up
+DEPLOYER_MIN_SPARE_BALANCE = int(os.getenv("DEPLOYER_MIN_SPARE_BALANCE", "2000000"))  # microALGOs
+DEPLOYER_TOP_UP_AMOUNT = int(os.getenv("DEPLOYER_TOP_UP_AMOUNT", "10000000"))  # microALGOs
+DEPLOYER_BALANCE_CHECK_INTERVAL = float(os.getenv("DEPLOYER_BALANCE_CHECK_INTERVAL", "30"))  # seconds
+
+
+class Deployer:
+    """One deployer account and its deploy queue."""
+
+    def __init__(
+        self,
+        private_key: str,
+        signer,
+        send_group: Callable[["Deployer", list], Awaitable[list[dict]]],
+        max_group_size: int = 16,
+    ):
+        self.address = account.address_from_private_key(private_key)
+        self.signer = signer
+        # Groups from this queue are always sent by this deployer
+        self.scheduler = DeployScheduler(
+            lambda jobs: send_group(self, jobs), max_group_size=max_group_size
+        )
+        self.balance: int | None = None
+        self.min_balance: int | None = None
+        self.healthy = True
+        self.top_up_txn_id: str | None = None
+
+    @property
+    def load(self) -> int:
+        """Jobs queued or awaiting confirmation on this deployer."""
+        stats = self.scheduler.stats()
+        return stats["queued"] + stats["in_flight_jobs"]
+
+    @property
+    def spare_balance(self) -> int | None:
+        if self.balance is None or self.min_balance is None:
+            return None
+        return self.balance - self.min_balance
+
+
+class DeployerPool:
+    """
+    Least-loaded selection over a set of deployers, with balance monitoring.
+
+    A deployer whose spare balance falls below DEPLOYER_MIN_SPARE_BALANCE is
+    topped up with DEPLOYER_TOP_UP_AMOUNT from the treasury. Without a
+    treasury it is marked unhealthy and skipped while healthy deployers remain.
+    """
+
+    def __init__(
+        self,
+        deployers: list[Deployer],
+        algod: AsyncAlgodClient,
+        params_provider: SuggestedParamsProvider,
+        confirmation_tracker: ConfirmationTracker,
+        treasury_private_key: str | None = None,
+    ):
+        if not deployers:
+            raise ValueError("Deployer pool needs at least one deployer")
+        self.deployers = deployers
+        self.algod = algod
+        self.params_provider = params_provider
+        self.confirmation_tracker = confirmation_tracker
+        self.treasury_private_key = treasury_private_key
+        self.treasury_address = (
+            account.address_from_private_key(treasury_private_key) if treasury_private_key else None
+        )
+        self._next = 0
+        self.top_ups = 0
+
+    @property
+    def addresses(self) -> list[str]:
+        return [deployer.address for deployer in self.deployers]
+
+    def select(self) -> Deployer:
+        """Least-loaded healthy deployer; ties are broken round-robin."""
+        candidates = [deployer for deployer in self.deployers if deployer.healthy] or self.deployers
+        start = self._next % len(candidates)
+        rotated = candidates[start:] + candidates[:start]
+        self._next += 1
+        return min(rotated, key=lambda deployer: deployer.load)
+
+    async def submit(self, job) -> dict:
+        """Queues a job on the selected deployer and returns its result."""
+        return await self.select().scheduler.submit(job)
+
+    async def _top_up(self, deployer: Deployer) -> None:
+        params = await self.params_provider.get()
+        payment = transaction.PaymentTxn(
+            sender=self.treasury_address,
+            sp=params,
+            receiver=deployer.address,
+            amt=DEPLOYER_TOP_UP_AMOUNT,
+            note=b"algofreelance:deployer-top-up",
+        )
+        signed = payment.sign(self.treasury_private_key)
+        txn_id = await self.algod.send_raw_transaction(base64.b64decode(encoding.msgpack_encode(signed)))
+        self.confirmation_tracker.track(txn_id)
+        deployer.top_up_txn_id = txn_id
+        self.top_ups += 1
+        print(f"[DeployerPool] Topping up {deployer.address} with {DEPLOYER_TOP_UP_AMOUNT / 1_000_000} ALGO: {txn_id}")
+
+    async def check_balances(self) -> None:
+        """Refreshes every deployer's balance and tops up the ones running low."""
+        infos = await asyncio.gather(
+            *(self.algod.account_info(deployer.address) for deployer in self.deployers),
+            return_exceptions=True,
+        )
+        for deployer, info in zip(self.deployers, infos):
+            if isinstance(info, Exception):
+                print(f"[DeployerPool] Could not read balance of {deployer.address}: {info}")
+                continue
+            deployer.balance = info.get("amount", 0)
+            deployer.min_balance = info.get("min-balance", 0)
+            if deployer.spare_balance >= DEPLOYER_MIN_SPARE_BALANCE:
+                deployer.healthy = True
+                continue
+
+            if self.treasury_private_key is None:
+                if deployer.healthy:
+                    print(f"[DeployerPool] Warning: {deployer.address} is low on funds and no treasury is configured")
+                deployer.healthy = False
+                continue
+
+            # Only one top-up in flight per deployer
+            if deployer.top_up_txn_id is not None:
+                record = self.confirmation_tracker.get(deployer.top_up_txn_id)
+                if record is not None and record["status"] == "pending":
+                    continue
+            try:
+                await self._top_up(deployer)
+            except Exception as e:
+                print(f"[DeployerPool] Top-up of {deployer.address} failed: {e}")
+                deployer.healthy = False
+
+    async def run(self) -> None:
+        """Background loop: balance checks every DEPLOYER_BALANCE_CHECK_INTERVAL seconds."""
+        while True:
+            try:
+                await self.check_balances()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[DeployerPool] Balance check failed: {e}")
+            await asyncio.sleep(DEPLOYER_BALANCE_CHECK_INTERVAL)
+
+    async def aclose(self) -> None:
+        for deployer in self.deployers:
+            await deployer.scheduler.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "treasury": self.treasury_address,
+            "top_ups": self.top_ups,
+            "deployers": [
+                {
+                    "address": deployer.address,
+                    "healthy": deployer.healthy,
+                    "balance": deployer.balance,
+                    "spare_balance": deployer.spare_balance,
+                    "load": deployer.load,
+                    **deployer.scheduler.stats(),
+                }
+                for deployer in self.deployers
+            ],
+        }
@@ -99,3 +99,15 @@ class InvalidEscrowAmountError(AlgoFreelanceError):
         )
         self.amount = amount
 
+
+
+class AlgorandNodeError(AlgoFreelanceError):
+    """Raised when an algod or Indexer request fails"""
+    def __init__(self, service: str, path: str, reason: str, status_code: int | None = None):
+        super().__init__(
+            message=f"{service} request {path} failed: {reason}",
+            error_code="ALGORAND_NODE_ERROR"
+        )
+        self.service = service
+        self.path = path
+        self.status_code = status_code
@@ -0,0 +1,58 @@
+# AlgoFreelance Backend - Job Event Fan-out
+# Delivers live job updates from the block follower to any number of
+# streaming clients (GET /api/v1/jobs/{app_id}/events).
+# Each subscriber gets its own bounded queue. Every event is a full job
+# snapshot, so a slow subscriber only needs the latest one: when its queue is
+# full the oldest event is dropped instead of blocking the follower.
+
+import asyncio
+import os
+
+JOB_EVENTS_QUEUE_SIZE = int(os.getenv("JOB_EVENTS_QUEUE_SIZE", "8"))  # events per subscriber
+
+
+class JobEventBroadcaster:
+    """Per-app fan-out of job events to bounded subscriber queues."""
+
+    def __init__(self, queue_size: int = JOB_EVENTS_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, app_id: int) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(app_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, app_id: int, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(app_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[app_id]
+
+    def subscribed_app_ids(self) -> list[int]:
+        return list(self._subscribers)
+
+    def has_subscribers(self, app_id: int) -> bool:
+        return app_id in self._subscribers
+
+    def publish(self, app_id: int, event: dict) -> None:
+        """Queues `event` for every subscriber of `app_id` without ever blocking."""
+        for queue in self._subscribers.get(app_id, ()):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
+            self.published += 1
+
+    def stats(self) -> dict:
+        return {
+            "apps": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "queue_size": self.queue_size,
+            "published": self.published,
+            "dropped": self.dropped,
+        }
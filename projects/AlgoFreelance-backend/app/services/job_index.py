@@ -0,0 +1,254 @@
+# AlgoFreelance Backend - Local Job Index
+# SQLite-backed index of deployed job contracts, kept up to date by a
+# background sync loop so job listings never scan the Indexer per request.
+# Reads are served from an in-memory snapshot rebuilt once per write batch.
+
+import base64
+import os
+import sqlite3
+import threading
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from pathlib import Path
+
+# Default location: one database per network, next to the backend code
+_default_path = (
+    Path(__file__).parent.parent.parent / ".cache"
+    / f"job_index.{os.getenv('ALGORAND_NETWORK', 'localnet')}.db"
+)
+JOB_INDEX_PATH = os.getenv("JOB_INDEX_PATH", str(_default_path))
+
+_JOB_COLUMNS = (
+    "app_id",
+    "job_title",
+    "job_status",
+    "status_string",
+    "escrow_amount",
+    "client_address",
+    "freelancer_address",
+    "created_at",
+    "contract_address",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    app_id INTEGER PRIMARY KEY,
+    job_title TEXT NOT NULL,
+    job_status INTEGER NOT NULL,
+    status_string TEXT NOT NULL,
+    escrow_amount INTEGER NOT NULL,
+    client_address TEXT NOT NULL,
+    freelancer_address TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    contract_address TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at DESC, app_id DESC);
+"""
+
+
+def _sort_key(job: dict) -> tuple[int, int]:
+    """Ascending key for the newest-first (created_at DESC, app_id DESC) order."""
+    return (-job["created_at"], -job["app_id"])
+
+
+def encode_cursor(job: dict) -> str:
+    """Opaque keyset cursor pointing just after `job`."""
+    raw = f"{job['created_at']}:{job['app_id']}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int]:
+    """
+    Decodes a cursor from encode_cursor().
+
+    Returns:
+        (created_at, app_id) of the last job on the previous page
+
+    Raises:
+        ValueError if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, app_id = raw.split(":")
+        return int(created_at), int(app_id)
+    except Exception:
+        raise ValueError(f"Invalid pagination cursor: {cursor}")
+
+
+class JobSnapshot:
+    """
+    Immutable newest-first view of every indexed job, with secondary
+    indexes on status, client and freelancer.
+
+    Every filter/page combination is answered from the same snapshot: the
+    smallest matching secondary index is walked and the remaining filters
+    are applied to it, so no query touches the Indexer or re-decodes state.
+    """
+
+    def __init__(self, jobs: list[dict]):
+        # Rows arrive ordered by (created_at DESC, app_id DESC)
+        self.jobs = jobs
+        self.by_status: dict[int, list[dict]] = defaultdict(list)
+        self.by_client: dict[str, list[dict]] = defaultdict(list)
+        self.by_freelancer: dict[str, list[dict]] = defaultdict(list)
+        self.by_app_id: dict[int, dict] = {}
+        for job in jobs:
+            self.by_app_id[job["app_id"]] = job
+            self.by_status[job["job_status"]].append(job)
+            self.by_client[job["client_address"]].append(job)
+            self.by_freelancer[job["freelancer_address"]].append(job)
+        self.built_at = time.time()
+
+    def query(
+        self,
+        status: int | None = None,
+        client_address: str | None = None,
+        freelancer_address: str | None = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: tuple[int, int] | None = None,
+    ) -> tuple[list[dict], int]:
+        """
+        Filtered, newest-first page of jobs.
+
+        Args:
+            after: (created_at, app_id) keyset position; when given the page
+                starts right after it and `offset` is ignored
+
+        Returns:
+            (jobs on this page, total number of jobs matching the filters)
+        """
+        candidates = []
+        if status is not None:
+            candidates.append(self.by_status.get(status, []))
+        if client_address:
+            candidates.append(self.by_client.get(client_address, []))
+        if freelancer_address:
+            candidates.append(self.by_freelancer.get(freelancer_address, []))
+
+        if not candidates:
+            matches = self.jobs
+        elif len(candidates) == 1:
+            matches = candidates[0]
+        else:
+            # Walk the most selective index (it keeps snapshot ordering)
+            # and apply the remaining filters to it
+            matches = [
+                job for job in min(candidates, key=len)
+                if (status is None or job["job_status"] == status)
+                and (not client_address or job["client_address"] == client_address)
+                and (not freelancer_address or job["freelancer_address"] == freelancer_address)
+            ]
+
+        if after is not None:
+            # Keyset pagination: binary search to the cursor, O(log n + page)
+            created_at, app_id = after
+            offset = bisect_right(matches, (-created_at, -app_id), key=_sort_key)
+
+        return matches[offset:offset + limit], len(matches)
+
+
+class JobIndex:
+    """
+    Persistent index of job summaries keyed by app ID.
+
+    Rows have the same shape as the JobSummary model. SQLite keeps the
+    index across restarts; queries go to a JobSnapshot that is rebuilt
+    lazily after writes, so a burst of upserts costs one rebuild.
+    """
+
+    def __init__(self, db_path: str = JOB_INDEX_PATH):
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        self.last_synced_at: float | None = None
+        self._snapshot: JobSnapshot | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """True once the index has been synced or holds rows from a previous run."""
+        return self.last_synced_at is not None or self.count() > 0
+
+    def count(self) -> int:
+        return len(self.snapshot().jobs)
+
+    def snapshot(self) -> JobSnapshot:
+        """Current snapshot, rebuilt from SQLite if a write invalidated it."""
+        with self._lock:
+            if self._snapshot is None:
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(_JOB_COLUMNS)} FROM jobs ORDER BY created_at DESC, app_id DESC"
+                ).fetchall()
+                self._snapshot = JobSnapshot([dict(row) for row in rows])
+            return self._snapshot
+
+    def get(self, app_id: int) -> dict | None:
+        """Indexed summary for one app, or None if it is not indexed."""
+        return self.snapshot().by_app_id.get(app_id)
+
+    def upsert_jobs(self, jobs: list[dict]) -> None:
+        """Inserts or replaces job summaries."""
+        if not jobs:
+            return
+        placeholders = ", ".join("?" for _ in _JOB_COLUMNS)
+        rows = [tuple(job[col] for col in _JOB_COLUMNS) for job in jobs]
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO jobs ({', '.join(_JOB_COLUMNS)}) VALUES ({placeholders})",
+                rows,
+            )
+            self._conn.commit()
+            self._snapshot = None
+
+    def prune(self, keep_app_ids: set[int]) -> int:
+        """
+        Removes jobs whose app no longer exists on chain (e.g. deleted apps).
+
+        Args:
+            keep_app_ids: App IDs seen in the latest full sync
+
+        Returns:
+            Number of rows removed
+        """
+        with self._lock:
+            existing = {row[0] for row in self._conn.execute("SELECT app_id FROM jobs")}
+            stale = existing - keep_app_ids
+            if stale:
+                self._conn.executemany("DELETE FROM jobs WHERE app_id = ?", [(app_id,) for app_id in stale])
+                self._conn.commit()
+                self._snapshot = None
+        return len(stale)
+
+    def mark_synced(self) -> None:
+        self.last_synced_at = time.time()
+
+    def query(
+        self,
+        status: int | None = None,
+        client_address: str | None = None,
+        freelancer_address: str | None = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: tuple[int, int] | None = None,
+    ) -> tuple[list[dict], int]:
+        """Filtered, newest-first page of jobs. See JobSnapshot.query()."""
+        return self.snapshot().query(
+            status=status,
+            client_address=client_address,
+            freelancer_address=freelancer_address,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,84 @@
+# AlgoFreelance Backend - Suggested Params Provider
+# Process-wide cache of algod suggested params, refreshed from the shared
+# block stream every few rounds so transaction construction never waits on algod.
+
+import asyncio
+import copy
+import os
+import time
+
+from algosdk import transaction
+
+from .algod_http import AsyncAlgodClient
+
+SUGGESTED_PARAMS_REFRESH_ROUNDS = int(os.getenv("SUGGESTED_PARAMS_REFRESH_ROUNDS", "5"))
+# Params older than this are refreshed inline (e.g. if the background loop stalled)
+SUGGESTED_PARAMS_MAX_AGE = float(os.getenv("SUGGESTED_PARAMS_MAX_AGE", "60"))  # seconds
+
+
+class SuggestedParamsProvider:
+    """
+    Shares one SuggestedParams value across all concurrent requests.
+
+    `on_round` is registered as a BlockFollower round listener and refetches
+    params every `refresh_rounds` rounds. Callers get a copy, so they are
+    free to adjust fees without affecting each other.
+    """
+
+    def __init__(self, algod: AsyncAlgodClient, refresh_rounds: int = SUGGESTED_PARAMS_REFRESH_ROUNDS):
+        self.algod = algod
+        self.refresh_rounds = refresh_rounds
+        self._params: transaction.SuggestedParams | None = None
+        self._fetched_at: float | None = None
+        self._lock = asyncio.Lock()
+        self.refreshes = 0
+        self.inline_refreshes = 0
+
+    @property
+    def age(self) -> float | None:
+        """Seconds since params were last fetched, or None if never fetched."""
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    @property
+    def fetched_round(self) -> int | None:
+        return self._params.first if self._params is not None else None
+
+    async def refresh(self) -> transaction.SuggestedParams:
+        """Fetches fresh params from algod. Concurrent callers share one request."""
+        fetched_at = self._fetched_at
+        async with self._lock:
+            # Another caller refreshed while we waited for the lock
+            if self._fetched_at != fetched_at and self._params is not None:
+                return self._params
+            self._params = await self.algod.suggested_params()
+            self._fetched_at = time.monotonic()
+            self.refreshes += 1
+            return self._params
+
+    async def get(self) -> transaction.SuggestedParams:
+        """Returns a copy of the current params, fetching only if missing or stale."""
+        params = self._params
+        if params is None or self.age > SUGGESTED_PARAMS_MAX_AGE:
+            self.inline_refreshes += 1
+            params = await self.refresh()
+        return copy.copy(params)
+
+    async def on_round(self, round_num: int) -> None:
+        """Round listener: refreshes params once they are `refresh_rounds` rounds old."""
+        if self.fetched_round is not None and round_num < self.fetched_round + self.refresh_rounds:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            print(f"[SuggestedParams] Refresh failed: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "round": self.fetched_round,
+            "age_seconds": round(self.age, 3) if self.age is not None else None,
+            "refresh_rounds": self.refresh_rounds,
+            "refreshes": self.refreshes,
+            "inline_refreshes": self.inline_refreshes,
+        }
@@ -0,0 +1,91 @@
+"""
+Benchmark for the job details read paths
+
+Compares the latency of the three ways the backend can read a job:
+1. ABI call   - previous behaviour: get_job_details() sent via the algokit client (signed by the deployer)
+2. Simulate   - get_job_details() run through algod simulate with an unsigned transaction
+3. State read - global state decoded straight from application_info (used by GET /api/v1/jobs/{app_id})
+
+All three include the contract balance lookup so the numbers are comparable.
+
+Prerequisites:
+1. Start LocalNet: algokit localnet start
+2. Deploy a job (e.g. python test_integration.py) and note its App ID
+3. Run: python benchmark_job_details.py --app-id <app_id> [--iterations 50]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.algorand import (
+    get_job_details_via_abi_call,
+    simulate_job_details,
+    read_job_state,
+)
+
+
+async def time_path(name: str, read, iterations: int) -> dict:
+    """Runs one read path `iterations` times and returns latency statistics in ms"""
+    samples = []
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = await read()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        "name": name,
+        "mean": statistics.mean(samples),
+        "p50": samples[len(samples) // 2],
+        "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        "result": result,
+    }
+
+
+async def run_benchmark(app_id: int, iterations: int) -> bool:
+    print("=" * 70)
+    print(f"Job details read paths - App ID {app_id}, {iterations} iterations each")
+    print("=" * 70)
+
+    paths = [
+        ("ABI call (previous)", lambda: get_job_details_via_abi_call(app_id)),
+        ("Simulate (unsigned)", lambda: simulate_job_details(app_id, include_balance=True)),
+        ("State read (current)", lambda: read_job_state(app_id, include_balance=True)),
+    ]
+
+    results = []
+    for name, read in paths:
+        # Warm-up call so connection setup is not counted
+        await read()
+        results.append(await time_path(name, read, iterations))
+
+    print(f"\n{'Path':<24}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for r in results:
+        print(f"{r['name']:<24}{r['mean']:>10.2f}{r['p50']:>10.2f}{r['p95']:>10.2f}")
+
+    # All paths must agree on the decoded job
+    baseline = results[0]["result"]
+    consistent = all(r["result"] == baseline for r in results[1:])
+    print(f"\n{'✅' if consistent else '❌'} Decoded job details {'match' if consistent else 'differ'} across paths")
+    return consistent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark job details read paths.")
+    parser.add_argument("--app-id", type=int, required=True, help="App ID of a deployed job contract.")
+    parser.add_argument("--iterations", type=int, default=50, help="Reads per path.")
+    args = parser.parse_args()
+
+    success = asyncio.run(run_benchmark(args.app_id, args.iterations))
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Test the Batch Broadcast Endpoint Against a Running Backend
+
+This test verifies:
+- POST /api/v1/broadcast/batch sends several signed fund groups in one
+  request, and a rejected group does not affect the others
+- GET /api/v1/transactions/{txn_id} follows each group to "confirmed"
+- GET /api/v1/jobs/{app_id} shows the jobs as Funded afterwards
+- Resending an already-confirmed group is still reported as a success
+
+Prerequisites:
+1. LocalNet running: algokit localnet start
+2. Accounts funded: ./fund_via_docker.sh
+3. Backend server running: uvicorn app.main:app --reload
+4. Run: python test_batch_broadcast.py
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import httpx
+from algosdk import account, encoding, mnemonic
+from dotenv import load_dotenv
+
+API_BASE = os.getenv("API_BASE", "http://localhost:8000")
+FREELANCER_ADDRESS = "YU7WSI2Y3MRHNHHUQUXHCZKHDJXS5665YUKVCXWS4NPWOBIKDBD2GSQD3A"
+
+
+def sign_transactions(unsigned_b64: list[str], private_key: str) -> list[str]:
+    """Decodes base64 unsigned transactions, signs them and re-encodes them"""
+    signed = []
+    for txn_b64 in unsigned_b64:
+        txn = encoding.msgpack_decode(txn_b64)
+        signed.append(encoding.msgpack_encode(txn.sign(private_key)))
+    return signed
+
+
+async def wait_for_status(http: httpx.AsyncClient, txn_id: str, timeout: float = 30.0) -> dict:
+    """Polls the tracking endpoint until the transaction leaves "pending" """
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        response = await http.get(f"/api/v1/transactions/{txn_id}")
+        response.raise_for_status()
+        record = response.json()
+        if record["status"] != "pending":
+            return record
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError(f"Transaction {txn_id} still pending after {timeout}s")
+        await asyncio.sleep(1)
+
+
+async def test_batch_broadcast():
+    """Fund several jobs with one batch broadcast and track them to confirmation"""
+
+    print("=" * 80)
+    print("AlgoFreelance - Batch Broadcast Test")
+    print("=" * 80)
+
+    client_mnemonic = os.getenv("DEPLOYER_MNEMONIC")  # Using deployer as client
+    if not client_mnemonic:
+        print("\n❌ ERROR: DEPLOYER_MNEMONIC not found in environment!")
+        return False
+
+    client_private_key = mnemonic.to_private_key(client_mnemonic)
+    client_address = account.address_from_private_key(client_private_key)
+
+    try:
+        async with httpx.AsyncClient(base_url=API_BASE, timeout=60.0) as http:
+            # ============================================================
+            # Setup: Deploy Two Jobs and Build Their Fund Groups
+            # ============================================================
+            print("\n📋 Setup: Deploy Test Contracts")
+            print("=" * 80)
+
+            app_ids = []
+            for i in range(2):
+                response = await http.post("/api/v1/jobs/create", json={
+                    "client_address": client_address,
+                    "freelancer_address": FREELANCER_ADDRESS,
+                    "escrow_amount": 1_000_000 * (i + 1),
+                    "job_title": f"Broadcast Test {i + 1}",
+                    "job_description": "Testing the batch broadcast endpoint",
+                })
+                assert response.status_code == 200, f"Create failed: {response.status_code} {response.text}"
+                app_ids.append(response.json()["app_id"])
+            print(f"✅ Test contracts deployed: {app_ids}")
+
+            groups = []
+            for app_id in app_ids:
+                response = await http.post(f"/api/v1/jobs/{app_id}/fund", json={"client_address": client_address})
+                assert response.status_code == 200, f"Fund construction failed: {response.text}"
+                groups.append(sign_transactions(response.json()["transactions"], client_private_key))
+            print(f"✅ {len(groups)} fund groups signed")
+
+            # ============================================================
+            # Test 1: Broadcast Both Groups (Plus a Bad One) in One Request
+            # ============================================================
+            print("\n📡 Test 1: POST /broadcast/batch")
+            print("=" * 80)
+
+            # Only the payment of the first group: algod rejects the incomplete group
+            incomplete = groups[0][:1]
+            response = await http.post("/api/v1/broadcast/batch", json={"groups": [incomplete, *groups]})
+            assert response.status_code == 200, f"broadcast/batch failed: {response.status_code} {response.text}"
+            rejected, *results = response.json()["results"]
+
+            assert rejected["group_index"] == 0 and not rejected["success"] and rejected["error"], (
+                f"Incomplete group should be rejected on its own result: {rejected}"
+            )
+            for result in results:
+                assert result["success"], f"Group {result['group_index']} rejected: {result['error']}"
+                assert result["status"] == "pending", f"Unexpected status {result['status']}"
+                assert result["tracking_url"] == f"/api/v1/transactions/{result['txn_id']}", "Unexpected tracking URL"
+            txn_ids = [result["txn_id"] for result in results]
+            print(f"✅ Incomplete group rejected: {rejected['error']}")
+            print(f"✅ Fund groups accepted: {txn_ids}")
+
+            # ============================================================
+            # Test 2: Track Confirmation
+            # ============================================================
+            print("\n⏳ Test 2: GET /transactions/{txn_id}")
+            print("=" * 80)
+
+            records = await asyncio.gather(*(wait_for_status(http, txn_id) for txn_id in txn_ids))
+            for record, app_id in zip(records, app_ids):
+                assert record["status"] == "confirmed", f"{record['txn_id']} ended as {record['status']}: {record['pool_error']}"
+                assert app_id in record["app_ids"], f"App {app_id} missing from tracked app IDs {record['app_ids']}"
+                print(f"✅ {record['txn_id']} confirmed in round {record['confirmed_round']}")
+
+            for app_id in app_ids:
+                response = await http.get(f"/api/v1/jobs/{app_id}")
+                response.raise_for_status()
+                job = response.json()
+                assert job["job_status"] == 1, f"App {app_id} should be Funded, got {job['status_string']}"
+            print("✅ Both jobs report Funded")
+
+            # ============================================================
+            # Test 3: Resend an Already-Confirmed Group
+            # ============================================================
+            print("\n🔁 Test 3: Resend Confirmed Group")
+            print("=" * 80)
+
+            response = await http.post("/api/v1/broadcast/batch", json={"groups": groups[:1]})
+            assert response.status_code == 200, f"broadcast/batch failed: {response.status_code} {response.text}"
+            result = response.json()["results"][0]
+            assert result["success"], f"Resent group should be reported as sent: {result['error']}"
+            assert result["txn_id"] == txn_ids[0], "Resent group reported a different transaction ID"
+            print("✅ Duplicate submission treated as success")
+
+        print("\n" + "=" * 80)
+        print("✅ BATCH BROADCAST TESTS PASSED!")
+        print("=" * 80)
+        return True
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED!")
+        print(f"   Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    load_dotenv(Path(__file__).parent / f".env.{os.getenv('ALGORAND_NETWORK', 'localnet')}")
+
+    success = asyncio.run(test_batch_broadcast())
+
+    if not success:
+        sys.exit(1)
+
+    print("\n🎉 Batch broadcast verified!\n")
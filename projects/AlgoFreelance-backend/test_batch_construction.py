@@ -0,0 +1,155 @@
+"""
+Test the Batch Transaction Construction Endpoint Against a Running Backend
+
+This test verifies:
+- POST /api/v1/transactions/batch builds fund, submit and approve
+  transactions for a job in one request, in request order
+- The fund action is a payment + app call group paying the escrow amount
+- An action that cannot be constructed (missing app, bad IPFS hash) is
+  reported on its own result without failing the rest of the batch
+- All actions share one suggested-params snapshot
+- An empty batch is rejected with 400
+
+Prerequisites:
+1. LocalNet running: algokit localnet start
+2. Accounts funded: ./fund_via_docker.sh
+3. Backend server running: uvicorn app.main:app --reload
+4. Run: python test_batch_construction.py
+"""
+import asyncio
+import base64
+import os
+import sys
+from pathlib import Path
+
+import httpx
+from algosdk import account, encoding, mnemonic, transaction
+from algosdk.logic import get_application_address
+from dotenv import load_dotenv
+
+API_BASE = os.getenv("API_BASE", "http://localhost:8000")
+FREELANCER_ADDRESS = "YU7WSI2Y3MRHNHHUQUXHCZKHDJXS5665YUKVCXWS4NPWOBIKDBD2GSQD3A"
+IPFS_HASH = "Qm" + "T" * 44  # Valid CIDv0 length
+MISSING_APP_ID = 999_999_999
+
+
+async def test_batch_construction():
+    """Construct fund/submit/approve transactions for one job in a single request"""
+
+    print("=" * 80)
+    print("AlgoFreelance - Batch Transaction Construction Test")
+    print("=" * 80)
+
+    client_mnemonic = os.getenv("DEPLOYER_MNEMONIC")  # Using deployer as client
+    if not client_mnemonic:
+        print("\n❌ ERROR: DEPLOYER_MNEMONIC not found in environment!")
+        return False
+
+    client_address = account.address_from_private_key(mnemonic.to_private_key(client_mnemonic))
+    escrow_amount = 2_000_000
+    job_title = "Batch Construction Test"
+
+    try:
+        async with httpx.AsyncClient(base_url=API_BASE, timeout=60.0) as http:
+            # ============================================================
+            # Setup: Deploy a Test Job
+            # ============================================================
+            print("\n📋 Setup: Deploy Test Contract")
+            print("=" * 80)
+
+            response = await http.post("/api/v1/jobs/create", json={
+                "client_address": client_address,
+                "freelancer_address": FREELANCER_ADDRESS,
+                "escrow_amount": escrow_amount,
+                "job_title": job_title,
+                "job_description": "Testing the transactions/batch endpoint",
+            })
+            assert response.status_code == 200, f"Create failed: {response.status_code} {response.text}"
+            app_id = response.json()["app_id"]
+            print(f"✅ Test contract deployed: {app_id}")
+
+            # ============================================================
+            # Test 1: Construct a Mixed Batch
+            # ============================================================
+            print("\n🔨 Test 1: POST /transactions/batch")
+            print("=" * 80)
+
+            actions = [
+                {"action": "fund", "app_id": app_id, "address": client_address},
+                {"action": "submit", "app_id": app_id, "address": FREELANCER_ADDRESS, "ipfs_hash": IPFS_HASH},
+                {"action": "approve", "app_id": app_id, "address": client_address},
+                {"action": "fund", "app_id": MISSING_APP_ID, "address": client_address},
+                {"action": "submit", "app_id": app_id, "address": FREELANCER_ADDRESS, "ipfs_hash": "too-short"},
+            ]
+            response = await http.post("/api/v1/transactions/batch", json={"actions": actions})
+            assert response.status_code == 200, f"transactions/batch failed: {response.status_code} {response.text}"
+            results = response.json()["results"]
+
+            assert [r["index"] for r in results] == list(range(len(actions))), "Results are not in request order"
+            fund, submit, approve, missing, bad_hash = results
+            for result in (fund, submit, approve):
+                assert result["success"], f"{result['action']} failed: {result['error']}"
+                assert result["app_id"] == app_id, f"{result['action']} reported app {result['app_id']}"
+            for result in (missing, bad_hash):
+                assert not result["success"] and result["error"], f"Action {result['index']} should fail on its own: {result}"
+                assert result["transactions"] == [], f"Failed action {result['index']} returned transactions"
+                print(f"✅ Action {result['index']} rejected: {result['error']}")
+
+            # ============================================================
+            # Test 2: Verify the Constructed Transactions
+            # ============================================================
+            print("\n🔍 Test 2: Verify Transactions")
+            print("=" * 80)
+
+            assert len(fund["transactions"]) == 2, "Fund should be a payment + app call group"
+            payment, fund_call = (encoding.msgpack_decode(txn) for txn in fund["transactions"])
+            assert isinstance(payment, transaction.PaymentTxn), "First fund transaction is not a payment"
+            assert payment.amt == escrow_amount, f"Payment amount {payment.amt} != escrow {escrow_amount}"
+            assert payment.receiver == get_application_address(app_id), "Payment does not go to the contract"
+            assert payment.group == fund_call.group == base64.b64decode(fund["group_id"]), "Fund group ID mismatch"
+            print(f"✅ Fund group pays {payment.amt} microALGOs to the contract")
+
+            assert len(submit["transactions"]) == 1 and len(approve["transactions"]) == 1, "Expected one app call each"
+            submit_call = encoding.msgpack_decode(submit["transactions"][0])
+            approve_call = encoding.msgpack_decode(approve["transactions"][0])
+            assert submit_call.sender == FREELANCER_ADDRESS, "Submit is not signed by the freelancer"
+            assert approve["expected_payment_amount"] == escrow_amount, "Approve reports the wrong payment"
+            assert approve["expected_nft_name"] == f"AlgoFreelance: {job_title}", "Approve reports the wrong NFT name"
+            print("✅ Submit and approve calls built with their expected outcomes")
+
+            first_valid = {txn.first_valid_round for txn in (payment, fund_call, submit_call, approve_call)}
+            assert len(first_valid) == 1, f"Actions built from different params: {first_valid}"
+            print("✅ All actions share one suggested-params snapshot")
+
+            # ============================================================
+            # Test 3: Empty Batch
+            # ============================================================
+            print("\n🚫 Test 3: Empty Batch")
+            print("=" * 80)
+
+            response = await http.post("/api/v1/transactions/batch", json={"actions": []})
+            assert response.status_code == 400, f"Expected 400 for an empty batch, got {response.status_code}"
+            print("✅ Empty batch rejected with 400")
+
+        print("\n" + "=" * 80)
+        print("✅ BATCH CONSTRUCTION TESTS PASSED!")
+        print("=" * 80)
+        return True
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED!")
+        print(f"   Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    load_dotenv(Path(__file__).parent / f".env.{os.getenv('ALGORAND_NETWORK', 'localnet')}")
+
+    success = asyncio.run(test_batch_construction())
+
+    if not success:
+        sys.exit(1)
+
+    print("\n🎉 Batch transaction construction verified!\n")
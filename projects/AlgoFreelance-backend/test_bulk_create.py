@@ -0,0 +1,126 @@
+"""
+Test the Bulk Job Creation Endpoint Against a Running Backend
+
+This test verifies:
+- POST /api/v1/jobs/create-batch deploys every valid job, in request order
+- Jobs that fail validation (bad address, zero escrow) are reported on their
+  own result without failing the rest of the batch
+- Every deployed job is initialized with its own terms
+- An empty batch is rejected with 400
+
+Prerequisites:
+1. LocalNet running: algokit localnet start
+2. Accounts funded: ./fund_via_docker.sh
+3. Backend server running: uvicorn app.main:app --reload
+4. Run: python test_bulk_create.py
+"""
+import asyncio
+import os
+import sys
+
+import httpx
+
+API_BASE = os.getenv("API_BASE", "http://localhost:8000")
+CLIENT_ADDRESS = "RPBPGTR47IY7GZXETWSUFB2GFSLJKOO46GA6Z3ZIFL45F32XUBZINLK54Q"
+FREELANCER_ADDRESS = "YU7WSI2Y3MRHNHHUQUXHCZKHDJXS5665YUKVCXWS4NPWOBIKDBD2GSQD3A"
+
+
+async def test_bulk_create():
+    """Create several jobs, some invalid, in one request"""
+
+    print("=" * 80)
+    print("AlgoFreelance - Bulk Job Creation Test")
+    print("=" * 80)
+
+    def job(i: int, **overrides) -> dict:
+        return {
+            "client_address": CLIENT_ADDRESS,
+            "freelancer_address": FREELANCER_ADDRESS,
+            "escrow_amount": 1_000_000 * (i + 1),
+            "job_title": f"Bulk Test Job {i + 1}",
+            "job_description": "Testing the create-batch endpoint",
+            **overrides,
+        }
+
+    # Identical jobs 0 and 1 must still become separate contracts
+    jobs = [
+        job(0),
+        job(0),
+        job(2, freelancer_address="NOT_AN_ADDRESS"),
+        job(3, escrow_amount=0),
+        job(4),
+    ]
+    valid = [0, 1, 4]
+
+    try:
+        async with httpx.AsyncClient(base_url=API_BASE, timeout=120.0) as http:
+            # ============================================================
+            # Test 1: Create a Mixed Batch
+            # ============================================================
+            print("\n🚀 Test 1: POST /jobs/create-batch")
+            print("=" * 80)
+
+            response = await http.post("/api/v1/jobs/create-batch", json={"jobs": jobs})
+            assert response.status_code == 200, f"create-batch failed: {response.status_code} {response.text}"
+            results = response.json()["results"]
+
+            assert [r["index"] for r in results] == list(range(len(jobs))), "Results are not in request order"
+            for i in valid:
+                assert results[i]["success"], f"Job {i} failed: {results[i]['error']}"
+                assert results[i]["app_id"] and results[i]["txn_id"], f"Job {i} is missing its app ID or txn ID"
+                assert results[i]["funding_amount"] > jobs[i]["escrow_amount"], f"Job {i} funding amount too low"
+            for i in set(range(len(jobs))) - set(valid):
+                assert not results[i]["success"] and results[i]["error"], f"Job {i} should fail on its own: {results[i]}"
+                assert results[i]["app_id"] is None, f"Invalid job {i} was deployed"
+                print(f"✅ Job {i} rejected: {results[i]['error']}")
+
+            app_ids = [results[i]["app_id"] for i in valid]
+            assert len(set(app_ids)) == len(app_ids), f"Jobs share an app ID: {app_ids}"
+            print(f"✅ Deployed apps {app_ids}")
+
+            # ============================================================
+            # Test 2: Each Job Initialized With Its Own Terms
+            # ============================================================
+            print("\n🔍 Test 2: Verify Job State")
+            print("=" * 80)
+
+            for i, app_id in zip(valid, app_ids):
+                response = await http.get(f"/api/v1/jobs/{app_id}")
+                response.raise_for_status()
+                details = response.json()
+                assert details["job_status"] == 0, f"App {app_id} should be Created, got {details['status_string']}"
+                assert details["escrow_amount"] == jobs[i]["escrow_amount"], f"App {app_id} has the wrong escrow"
+                assert details["job_title"] == jobs[i]["job_title"], f"App {app_id} has the wrong title"
+                assert details["client_address"] == CLIENT_ADDRESS, f"App {app_id} has the wrong client"
+            print("✅ Every deployed job is initialized with its own terms")
+
+            # ============================================================
+            # Test 3: Empty Batch
+            # ============================================================
+            print("\n🚫 Test 3: Empty Batch")
+            print("=" * 80)
+
+            response = await http.post("/api/v1/jobs/create-batch", json={"jobs": []})
+            assert response.status_code == 400, f"Expected 400 for an empty batch, got {response.status_code}"
+            print("✅ Empty batch rejected with 400")
+
+        print("\n" + "=" * 80)
+        print("✅ BULK CREATE TESTS PASSED!")
+        print("=" * 80)
+        return True
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED!")
+        print(f"   Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = asyncio.run(test_bulk_create())
+
+    if not success:
+        sys.exit(1)
+
+    print("\n🎉 Bulk job creation verified!\n")
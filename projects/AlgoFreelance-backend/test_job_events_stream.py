@@ -0,0 +1,155 @@
+"""
+Test the Job Events Stream Against a Running Backend
+
+This test verifies:
+- GET /api/v1/jobs/{app_id}/events answers 404 for an unknown app before
+  any stream starts
+- The stream opens with the job's current state
+- Funding the job pushes a new "job" event with the Funded status and the
+  round that changed it, without polling
+
+Prerequisites:
+1. LocalNet running: algokit localnet start
+2. Accounts funded: ./fund_via_docker.sh
+3. Backend server running: uvicorn app.main:app --reload
+4. Run: python test_job_events_stream.py
+"""
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import httpx
+from algosdk import account, encoding, mnemonic
+from dotenv import load_dotenv
+
+API_BASE = os.getenv("API_BASE", "http://localhost:8000")
+FREELANCER_ADDRESS = "YU7WSI2Y3MRHNHHUQUXHCZKHDJXS5665YUKVCXWS4NPWOBIKDBD2GSQD3A"
+MISSING_APP_ID = 999_999_999
+
+
+async def read_events(response: httpx.Response):
+    """Yields (event, data) pairs from a Server-Sent Events response, skipping keep-alives"""
+    event, data = None, []
+    async for line in response.aiter_lines():
+        if line.startswith(":"):
+            continue
+        if line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data.append(line[len("data:"):].strip())
+        elif not line and data:
+            yield event, json.loads("\n".join(data))
+            event, data = None, []
+
+
+async def test_job_events():
+    """Watch a job's event stream while it is funded"""
+
+    print("=" * 80)
+    print("AlgoFreelance - Job Events Stream Test")
+    print("=" * 80)
+
+    client_mnemonic = os.getenv("DEPLOYER_MNEMONIC")  # Using deployer as client
+    if not client_mnemonic:
+        print("\n❌ ERROR: DEPLOYER_MNEMONIC not found in environment!")
+        return False
+
+    client_private_key = mnemonic.to_private_key(client_mnemonic)
+    client_address = account.address_from_private_key(client_private_key)
+
+    try:
+        async with httpx.AsyncClient(base_url=API_BASE, timeout=60.0) as http:
+            # ============================================================
+            # Test 1: Unknown App
+            # ============================================================
+            print("\n🔍 Test 1: Stream for an Unknown App")
+            print("=" * 80)
+
+            response = await http.get(f"/api/v1/jobs/{MISSING_APP_ID}/events")
+            assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+            print("✅ Unknown app rejected with 404")
+
+            # ============================================================
+            # Setup: Deploy a Job
+            # ============================================================
+            print("\n📋 Setup: Deploy Test Contract")
+            print("=" * 80)
+
+            response = await http.post("/api/v1/jobs/create", json={
+                "client_address": client_address,
+                "freelancer_address": FREELANCER_ADDRESS,
+                "escrow_amount": 1_000_000,
+                "job_title": "Events Test Job",
+                "job_description": "Testing the job events stream",
+            })
+            assert response.status_code == 200, f"Create failed: {response.status_code} {response.text}"
+            app_id = response.json()["app_id"]
+            print(f"✅ Test contract deployed: App ID {app_id}")
+
+            # ============================================================
+            # Test 2: Initial State, Then a Pushed Update
+            # ============================================================
+            print("\n📡 Test 2: Stream Job Events While Funding")
+            print("=" * 80)
+
+            async with http.stream("GET", f"/api/v1/jobs/{app_id}/events", timeout=None) as stream:
+                assert stream.status_code == 200, f"Stream failed: {stream.status_code}"
+                assert stream.headers["content-type"].startswith("text/event-stream"), "Not an event stream"
+                events = read_events(stream)
+
+                event, data = await asyncio.wait_for(anext(events), timeout=10)
+                assert event == "job", f"Unexpected first event: {event}"
+                assert data["job"]["app_id"] == app_id, "Initial event is for the wrong app"
+                assert data["job"]["job_status"] == 0, f"Job should start Created, got {data['job']['status_string']}"
+                print(f"✅ Initial state received: {data['job']['status_string']}")
+
+                # Fund the job while the stream is open
+                response = await http.post(f"/api/v1/jobs/{app_id}/fund", json={"client_address": client_address})
+                assert response.status_code == 200, f"Fund construction failed: {response.text}"
+                signed = [
+                    encoding.msgpack_encode(encoding.msgpack_decode(txn).sign(client_private_key))
+                    for txn in response.json()["transactions"]
+                ]
+                response = await http.post("/api/v1/broadcast/batch", json={"groups": [signed]})
+                assert response.status_code == 200, f"Broadcast failed: {response.text}"
+                result = response.json()["results"][0]
+                assert result["success"], f"Fund group rejected: {result['error']}"
+                print(f"✅ Fund group sent: {result['txn_id']}")
+
+                async def next_status_change() -> tuple:
+                    # The deploy round may still be pushed (as Created) if the follower lags
+                    async for event, data in events:
+                        if data["job"]["job_status"] != 0:
+                            return event, data
+                    raise AssertionError("Stream ended before the job changed")
+
+                event, data = await asyncio.wait_for(next_status_change(), timeout=30)
+                assert event == "job", f"Unexpected event: {event}"
+                assert data["job"]["job_status"] == 1, f"Job should be Funded, got {data['job']['status_string']}"
+                assert data["round"], "Update does not name the round that changed the job"
+                print(f"✅ Funded state pushed for round {data['round']}")
+
+        print("\n" + "=" * 80)
+        print("✅ JOB EVENTS TESTS PASSED!")
+        print("=" * 80)
+        return True
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED!")
+        print(f"   Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    load_dotenv(Path(__file__).parent / f".env.{os.getenv('ALGORAND_NETWORK', 'localnet')}")
+
+    success = asyncio.run(test_job_events())
+
+    if not success:
+        sys.exit(1)
+
+    print("\n🎉 Job events stream verified!\n")
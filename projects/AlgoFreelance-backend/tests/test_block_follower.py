@@ -0,0 +1,192 @@
+"""
+Unit tests for BlockFollower (no node required).
+
+The fixture follows the encoding of algod's GET /v2/blocks/{round}?format=json:
+addresses are checksummed strings, []byte fields such as "apaa" are base64,
+and global delta keys and "bs" values are plain JSON strings of the raw bytes.
+"""
+import asyncio
+import json
+from pathlib import Path
+
+from app.services.block_follower import BlockFollower
+
+FIXTURE = Path(__file__).parent / "fixtures" / "block_job_calls.json"
+CREATOR = "RPBPGTR47IY7GZXETWSUFB2GFSLJKOO46GA6Z3ZIFL45F32XUBZINLK54Q"
+FREELANCER = "YU7WSI2Y3MRHNHHUQUXHCZKHDJXS5665YUKVCXWS4NPWOBIKDBD2GSQD3A"
+CID = "QmYwAPJzv5CZsnA625s3Xf2nemtYgPpHdWEz79ojWnPbdG"
+
+
+def _load_block() -> dict:
+    return json.loads(FIXTURE.read_text())
+
+
+def _follower(tracked: set[int]) -> BlockFollower:
+    return BlockFollower(algod=None, is_tracked=lambda app_id: app_id in tracked, creators={CREATOR})
+
+
+def test_extracts_events_for_tracked_and_created_apps():
+    follower = _follower({1001, 1002})
+    events = follower.extract_events(_load_block(), 1234)
+
+    # The plain payment and the call to an untracked app are skipped
+    assert [event["app_id"] for event in events] == [1005, 1001, 1002]
+    assert all(event["round"] == 1234 and event["timestamp"] == 1717000123 for event in events)
+
+    created, submitted, approved = events
+    assert created["created"] is True
+    assert created["sender"] == CREATOR
+    assert created["method_selector"] == "890632b1"  # initialize(address,address,uint64,string)void
+    assert submitted["created"] is False
+    assert submitted["sender"] == FREELANCER
+    assert submitted["method_selector"] == "e031da70"  # submit_work(string)void
+    assert approved["method_selector"] == "40c3067f"  # approve_work()void
+
+
+def test_created_apps_are_followed_afterwards():
+    follower = _follower(set())
+    follower.extract_events(_load_block(), 1234)
+    assert 1005 in follower._created_app_ids
+
+    # Apps created by anyone else are not picked up
+    other = BlockFollower(algod=None, is_tracked=lambda app_id: False, creators={FREELANCER})
+    assert other.extract_events(_load_block(), 1234) == []
+
+
+def test_state_delta_keys_and_values_are_raw_strings():
+    follower = _follower({1001, 1002})
+    created, submitted, approved = follower.extract_events(_load_block(), 1234)
+
+    assert submitted["changed_keys"] == ["job_status", "work_hash"]
+    assert submitted["state_changes"] == {
+        "job_status": (2).to_bytes(8, "big"),
+        "work_hash": len(CID).to_bytes(2, "big") + CID.encode(),
+    }
+    assert approved["state_changes"] == {"job_status": (3).to_bytes(8, "big")}
+
+    # Escrow amount and title survive the JSON encoding; random address
+    # bytes do not, so only their keys are reported
+    assert "client_address" in created["changed_keys"]
+    assert "client_address" not in created["state_changes"]
+    assert "freelancer_address" not in created["state_changes"]
+    assert created["state_changes"]["escrow_amount"] == (5_000_000).to_bytes(8, "big")
+    assert created["state_changes"]["job_title"] == b"\x00\x0bLogo Design"
+    assert created["state_changes"]["work_hash"] == b"\x00\x00"
+
+
+def test_uint_and_delete_deltas():
+    block = {"block": {"ts": 1, "txns": [{
+        "dt": {"gd": {"counter": {"at": 2, "ui": 7}, "gone": {"at": 3}}},
+        "txn": {"apid": 1001, "snd": FREELANCER, "type": "appl"},
+    }]}}
+    (event,) = _follower({1001}).extract_events(block, 5)
+    assert event["method_selector"] == ""
+    assert event["state_changes"] == {"counter": 7, "gone": None}
+
+
+def test_created_apps_are_forgotten_once_indexed_and_bounded():
+    indexed = set()
+    follower = BlockFollower(algod=None, is_tracked=lambda app_id: app_id in indexed, creators={CREATOR})
+    follower.extract_events(_load_block(), 1234)
+    assert 1005 in follower._created_app_ids
+
+    indexed.add(1005)
+    follower.extract_events(_load_block(), 1235)
+    assert 1005 not in follower._created_app_ids
+
+    bounded = BlockFollower(algod=None, is_tracked=lambda app_id: False, creators={CREATOR}, created_apps_max=2)
+    for app_id in (2001, 2002, 2003):
+        bounded._remember_created(app_id)
+    assert list(bounded._created_app_ids) == [2002, 2003]
+
+
+class _FakeAlgod:
+    """Serves rounds 1233 and 1234 (the fixture block), then waits for a block that never comes."""
+
+    def __init__(self, block: dict):
+        self.block = block
+        self.waits = 0
+
+    async def status(self) -> dict:
+        return {"last-round": 1232}
+
+    async def status_after_block(self, round_num: int) -> dict:
+        self.waits += 1
+        if self.waits > 1:
+            await asyncio.Event().wait()
+        return {"last-round": 1234}
+
+    async def block_info(self, round_num: int) -> dict:
+        return self.block if round_num == 1234 else {"block": {"rnd": round_num, "txns": []}}
+
+
+async def _follow_until(follower: BlockFollower, done) -> None:
+    """Runs the follower until done() is true, then stops it."""
+    task = asyncio.create_task(follower.run())
+    for _ in range(1000):
+        if done():
+            break
+        await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    assert done()
+
+
+def test_listeners_get_events_and_rounds_in_order():
+    events_seen = []
+    rounds_seen = []
+
+    async def on_events(events: list[dict]) -> None:
+        events_seen.append([event["round"] for event in events])
+
+    async def on_round(round_num: int) -> None:
+        rounds_seen.append(round_num)
+
+    async def main() -> None:
+        follower = BlockFollower(_FakeAlgod(_load_block()), is_tracked=lambda app_id: app_id == 1001, creators=set())
+        follower.add_listener(on_events)
+        follower.add_round_listener(on_round)
+        await _follow_until(follower, lambda: events_seen and rounds_seen and rounds_seen[-1] == 1234)
+        assert follower.last_round == 1234
+
+    asyncio.run(main())
+    assert events_seen == [[1234]]
+    # Rounds that pass while a round listener is busy collapse into the newest one
+    assert rounds_seen == sorted(set(rounds_seen)) and rounds_seen[-1] == 1234
+
+
+def test_slow_listener_does_not_stall_the_follower():
+    release = asyncio.Event()
+    batches = []
+    rounds_seen = []
+
+    async def slow(events: list[dict]) -> None:
+        await release.wait()
+        batches.append(events)
+
+    async def on_round(round_num: int) -> None:
+        rounds_seen.append(round_num)
+
+    async def main() -> None:
+        follower = BlockFollower(_FakeAlgod(_load_block()), is_tracked=lambda app_id: app_id == 1001, creators=set())
+        follower.add_listener(slow)
+        follower.add_round_listener(on_round)
+
+        task = asyncio.create_task(follower.run())
+        for _ in range(100):
+            await asyncio.sleep(0)
+        # Every round was followed and ticked while the listener was still blocked
+        assert follower.last_round == 1234 and rounds_seen[-1] == 1234
+        assert batches == []
+
+        # Blocks that arrive while the listener is busy are merged into its next call
+        follower._publish([{"app_id": 1001, "round": 1235}])
+        follower._publish([{"app_id": 1001, "round": 1236}])
+        release.set()
+        for _ in range(100):
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(main())
+    assert [[event["round"] for event in batch] for batch in batches] == [[1234], [1235, 1236]]
@@ -0,0 +1,78 @@
+"""
+Unit tests for TTLCache (no node required).
+"""
+from app.services import cache as cache_module
+from app.services.cache import TTLCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _patched_cache(monkeypatch, **kwargs) -> tuple[TTLCache, _Clock]:
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return TTLCache(**kwargs), clock
+
+
+def test_hit_and_miss_counters():
+    cache = TTLCache(max_size=4, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache, clock = _patched_cache(monkeypatch, max_size=4, ttl=30)
+    cache.set("a", 1)
+    clock.now += 29.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_infinite_ttl_never_expires(monkeypatch):
+    cache, clock = _patched_cache(monkeypatch, max_size=4, ttl=float("inf"))
+    cache.set("a", 1)
+    clock.now += 10 ** 9
+    assert cache.get("a") == 1
+
+
+def test_contains_does_not_count_or_refresh():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert "a" in cache
+    cache.set("c", 3)  # "a" was not refreshed by the membership test
+    assert "a" not in cache
+    assert cache.stats()["hits"] == 0
+
+
+def test_invalidate_one_or_all():
+    cache = TTLCache(max_size=4, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert "a" not in cache and "b" in cache
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.stats()["invalidations"] == 2
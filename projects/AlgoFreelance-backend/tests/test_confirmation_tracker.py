@@ -0,0 +1,108 @@
+"""
+Unit tests for ConfirmationTracker (no node required).
+"""
+import asyncio
+
+from app.services.confirmation_tracker import ConfirmationTracker
+from app.services.exceptions import AlgorandNodeError
+
+
+class _FakeAlgod:
+    """pending_transaction_info backed by a dict; unknown IDs answer 404."""
+
+    def __init__(self):
+        self.pending_info: dict[str, dict] = {}
+        self.calls = 0
+
+    async def pending_transaction_info(self, txid: str) -> dict:
+        self.calls += 1
+        if txid not in self.pending_info:
+            raise AlgorandNodeError("algod", f"/v2/transactions/pending/{txid}", "not found", status_code=404)
+        return self.pending_info[txid]
+
+
+def test_pending_transactions_confirm_fail_or_expire():
+    async def main():
+        algod = _FakeAlgod()
+        tracker = ConfirmationTracker(algod, max_rounds=5)
+        confirmed = []
+
+        async def listener(record: dict) -> None:
+            confirmed.append(record["txn_id"])
+
+        tracker.add_listener(listener)
+        tracker.track("OK", app_ids=[1001], submitted_round=10)
+        tracker.track("BAD", submitted_round=10)
+        tracker.track("LOST")  # submitted round filled in by the first check
+
+        await tracker.on_round(11)
+        for txn_id in ("OK", "BAD", "LOST"):
+            assert tracker.get(txn_id)["status"] == "pending"
+        assert tracker.get("LOST")["submitted_round"] == 11
+
+        algod.pending_info["OK"] = {"confirmed-round": 12}
+        algod.pending_info["BAD"] = {"pool-error": "overspend"}
+        await tracker.on_round(12)
+        assert tracker.get("OK")["status"] == "confirmed"
+        assert tracker.get("OK")["confirmed_round"] == 12
+        assert tracker.get("BAD")["status"] == "failed"
+        assert tracker.get("BAD")["pool_error"] == "overspend"
+        assert confirmed == ["OK"]
+
+        await tracker.on_round(16)
+        assert tracker.get("LOST")["status"] == "pending"  # 16 is not past 11 + 5
+        await tracker.on_round(17)
+        assert tracker.get("LOST")["status"] == "expired"
+
+        assert tracker.stats() == {"pending": 0, "confirmed": 1, "failed": 1, "expired": 1}
+
+    asyncio.run(main())
+
+
+def test_rounds_without_pending_transactions_cost_nothing():
+    async def main():
+        algod = _FakeAlgod()
+        tracker = ConfirmationTracker(algod)
+        await tracker.on_round(1)
+        assert algod.calls == 0
+
+    asyncio.run(main())
+
+
+def test_resubmitted_transaction_keeps_its_record():
+    tracker = ConfirmationTracker(_FakeAlgod())
+    first = tracker.track("TX", app_ids=[1001], submitted_round=10)
+    again = tracker.track("TX", app_ids=[], submitted_round=20)
+    assert again == first
+    assert tracker.get("TX")["app_ids"] == [1001]
+
+
+def test_listener_failure_does_not_block_confirmation():
+    async def main():
+        algod = _FakeAlgod()
+        tracker = ConfirmationTracker(algod)
+
+        async def broken(record: dict) -> None:
+            raise RuntimeError("listener bug")
+
+        tracker.add_listener(broken)
+        tracker.track("TX", submitted_round=1)
+        algod.pending_info["TX"] = {"confirmed-round": 2}
+        await tracker.on_round(2)
+        assert tracker.get("TX")["status"] == "confirmed"
+
+    asyncio.run(main())
+
+
+def test_finished_history_is_bounded():
+    async def main():
+        algod = _FakeAlgod()
+        tracker = ConfirmationTracker(algod, history=2)
+        for txn_id in ("A", "B", "C"):
+            tracker.track(txn_id, submitted_round=1)
+            algod.pending_info[txn_id] = {"confirmed-round": 2}
+        await tracker.on_round(2)
+        assert tracker.get("A") is None
+        assert tracker.get("B")["status"] == tracker.get("C")["status"] == "confirmed"
+
+    asyncio.run(main())
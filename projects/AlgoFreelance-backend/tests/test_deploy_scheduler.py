@@ -0,0 +1,210 @@
+"""
+Unit tests for DeployScheduler coalescing and failure handling (no node required).
+"""
+import asyncio
+
+import pytest
+
+from app.services.deploy_scheduler import DeployScheduler, RetrySeparately
+
+
+class _Sender:
+    """Records every group it is given and answers one result per job."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.groups: list[list] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, jobs: list) -> list[dict]:
+        self.groups.append(list(jobs))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return [{"job": job} for job in jobs]
+
+
+def test_concurrent_submits_are_coalesced_into_one_group():
+    async def main():
+        sender = _Sender()
+        scheduler = DeployScheduler(sender, max_group_size=16, coalesce_window=0.05)
+        try:
+            results = await asyncio.gather(*(scheduler.submit(i) for i in range(5)))
+        finally:
+            await scheduler.aclose()
+
+        assert results == [{"job": i} for i in range(5)]
+        assert sender.groups == [[0, 1, 2, 3, 4]]
+        stats = scheduler.stats()
+        assert (stats["groups_sent"], stats["jobs_sent"], stats["avg_group_size"]) == (1, 5, 5.0)
+
+    asyncio.run(main())
+
+
+def test_groups_are_split_at_max_group_size():
+    async def main():
+        sender = _Sender()
+        scheduler = DeployScheduler(sender, max_group_size=2, coalesce_window=0.05)
+        try:
+            results = await asyncio.gather(*(scheduler.submit(i) for i in range(5)))
+        finally:
+            await scheduler.aclose()
+
+        assert results == [{"job": i} for i in range(5)]
+        assert sender.groups == [[0, 1], [2, 3], [4]]
+
+    asyncio.run(main())
+
+
+def test_groups_in_flight_are_bounded():
+    async def main():
+        sender = _Sender(delay=0.05)
+        scheduler = DeployScheduler(sender, max_group_size=1, coalesce_window=0, max_in_flight=2)
+        try:
+            await asyncio.gather(*(scheduler.submit(i) for i in range(6)))
+        finally:
+            await scheduler.aclose()
+
+        assert len(sender.groups) == 6
+        assert sender.max_active == 2
+        assert scheduler.stats()["in_flight_jobs"] == 0
+
+    asyncio.run(main())
+
+
+def test_send_failure_fails_every_job_in_the_group():
+    async def main():
+        async def broken(jobs: list) -> list[dict]:
+            raise RuntimeError("node unavailable")
+
+        scheduler = DeployScheduler(broken, coalesce_window=0.05)
+        try:
+            results = await asyncio.gather(*(scheduler.submit(i) for i in range(3)), return_exceptions=True)
+            assert all(isinstance(r, RuntimeError) and str(r) == "node unavailable" for r in results)
+
+            # The worker keeps serving after a failed group
+            scheduler.send_group = _Sender()
+            assert await scheduler.submit(9) == {"job": 9}
+        finally:
+            await scheduler.aclose()
+
+    asyncio.run(main())
+
+
+def test_short_result_list_fails_every_job_instead_of_hanging():
+    async def main():
+        async def short(jobs: list) -> list[dict]:
+            return [{"job": jobs[0]}]
+
+        scheduler = DeployScheduler(short, coalesce_window=0.05)
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*(scheduler.submit(i) for i in range(3)), return_exceptions=True),
+                timeout=1,
+            )
+        finally:
+            await scheduler.aclose()
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert "1 results for 3 jobs" in str(results[0])
+
+    asyncio.run(main())
+
+
+def test_per_job_exceptions_are_raised_to_their_submitter_only():
+    async def main():
+        async def mixed(jobs: list) -> list:
+            return [ValueError(f"bad job {job}") if job == 1 else {"job": job} for job in jobs]
+
+        scheduler = DeployScheduler(mixed, coalesce_window=0.05)
+        try:
+            results = await asyncio.gather(*(scheduler.submit(i) for i in range(3)), return_exceptions=True)
+        finally:
+            await scheduler.aclose()
+
+        assert results[0] == {"job": 0} and results[2] == {"job": 2}
+        assert isinstance(results[1], ValueError)
+
+    asyncio.run(main())
+
+
+def test_rejected_group_is_retried_one_job_per_group():
+    async def main():
+        sender = _Sender()
+
+        async def reject_shared(jobs: list) -> list:
+            if len(jobs) > 1:
+                sender.groups.append(list(jobs))
+                return [RetrySeparately("group rejected") for _ in jobs]
+            if jobs == [1]:
+                return [RetrySeparately("still rejected")]
+            return await sender(jobs)
+
+        scheduler = DeployScheduler(reject_shared, coalesce_window=0.05, max_in_flight=1)
+        try:
+            results = await asyncio.gather(*(scheduler.submit(i) for i in range(3)), return_exceptions=True)
+            # New submissions are not coalesced with the retries
+            assert await scheduler.submit(3) == {"job": 3}
+        finally:
+            await scheduler.aclose()
+
+        assert results[0] == {"job": 0} and results[2] == {"job": 2}
+        # A job rejected on its own is not requeued again
+        assert isinstance(results[1], RetrySeparately)
+        assert sender.groups == [[0, 1, 2], [0], [2], [3]]
+        assert scheduler.stats()["jobs_retried"] == 3
+
+    asyncio.run(main())
+
+
+def test_retries_wait_for_a_free_slot():
+    async def main():
+        sender = _Sender(delay=0.02)
+
+        async def reject_shared(jobs: list) -> list:
+            if len(jobs) > 1:
+                return [RetrySeparately("group rejected") for _ in jobs]
+            return await sender(jobs)
+
+        scheduler = DeployScheduler(reject_shared, coalesce_window=0.01, max_in_flight=2)
+        try:
+            results = await asyncio.gather(*(scheduler.submit(i) for i in range(6)))
+        finally:
+            await scheduler.aclose()
+
+        assert results == [{"job": i} for i in range(6)]
+        assert sorted(job for group in sender.groups for job in group) == list(range(6))
+        assert all(len(group) == 1 for group in sender.groups)
+        assert sender.max_active <= 2
+
+    asyncio.run(main())
+
+
+def test_scheduler_restarts_in_a_new_event_loop():
+    sender = _Sender()
+    scheduler = DeployScheduler(sender, coalesce_window=0)
+
+    async def deploy(job):
+        return await scheduler.submit(job)
+
+    assert asyncio.run(deploy("first")) == {"job": "first"}
+    assert asyncio.run(deploy("second")) == {"job": "second"}
+    assert sender.groups == [["first"], ["second"]]
+
+
+@pytest.mark.parametrize("window", [0, 0.01])
+def test_single_job_is_sent_alone(window):
+    async def main():
+        sender = _Sender()
+        scheduler = DeployScheduler(sender, coalesce_window=window)
+        try:
+            assert await scheduler.submit("only") == {"job": "only"}
+        finally:
+            await scheduler.aclose()
+        assert sender.groups == [["only"]]
+
+    asyncio.run(main())
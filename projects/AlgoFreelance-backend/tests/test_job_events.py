@@ -0,0 +1,63 @@
+"""
+Unit tests for JobEventBroadcaster (no node required).
+"""
+import asyncio
+
+from app.services.job_events import JobEventBroadcaster
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+def test_events_reach_only_subscribers_of_the_app():
+    async def main():
+        broadcaster = JobEventBroadcaster(queue_size=4)
+        first = broadcaster.subscribe(1001)
+        second = broadcaster.subscribe(1001)
+        other = broadcaster.subscribe(1002)
+
+        broadcaster.publish(1001, {"round": 1})
+        broadcaster.publish(1003, {"round": 1})  # nobody listening
+
+        assert _drain(first) == [{"round": 1}]
+        assert _drain(second) == [{"round": 1}]
+        assert _drain(other) == []
+        assert broadcaster.stats()["published"] == 2
+
+    asyncio.run(main())
+
+
+def test_full_queue_drops_the_oldest_event():
+    async def main():
+        broadcaster = JobEventBroadcaster(queue_size=2)
+        queue = broadcaster.subscribe(1001)
+        for round_num in range(1, 5):
+            broadcaster.publish(1001, {"round": round_num})
+
+        # The latest snapshots survive; publishing never blocked
+        assert _drain(queue) == [{"round": 3}, {"round": 4}]
+        assert broadcaster.stats()["dropped"] == 2
+
+    asyncio.run(main())
+
+
+def test_unsubscribe_removes_empty_apps():
+    async def main():
+        broadcaster = JobEventBroadcaster()
+        first = broadcaster.subscribe(1001)
+        second = broadcaster.subscribe(1001)
+        assert broadcaster.subscribed_app_ids() == [1001]
+
+        broadcaster.unsubscribe(1001, first)
+        assert broadcaster.has_subscribers(1001)
+        broadcaster.unsubscribe(1001, second)
+        assert not broadcaster.has_subscribers(1001)
+        assert broadcaster.stats()["apps"] == 0
+
+        broadcaster.unsubscribe(1001, second)  # already gone: no error
+
+    asyncio.run(main())
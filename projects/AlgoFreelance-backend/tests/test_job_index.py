@@ -0,0 +1,156 @@
+"""
+Unit tests for the SQLite job index, its in-memory snapshot and keyset cursors (no node required).
+"""
+import pytest
+
+from app.services.job_index import JobIndex, JobSnapshot, decode_cursor, encode_cursor
+
+CLIENT_A = "CLIENTA"
+CLIENT_B = "CLIENTB"
+FREELANCER_A = "FREELANCERA"
+FREELANCER_B = "FREELANCERB"
+
+
+def _job(app_id: int, created_at: int, status: int = 0, client: str = CLIENT_A, freelancer: str = FREELANCER_A) -> dict:
+    return {
+        "app_id": app_id,
+        "job_title": f"Job {app_id}",
+        "job_status": status,
+        "status_string": "Created",
+        "escrow_amount": 1_000_000,
+        "client_address": client,
+        "freelancer_address": freelancer,
+        "created_at": created_at,
+        "contract_address": f"ADDR{app_id}",
+    }
+
+
+def _newest_first(jobs: list[dict]) -> list[dict]:
+    return sorted(jobs, key=lambda job: (job["created_at"], job["app_id"]), reverse=True)
+
+
+JOBS = _newest_first([
+    _job(1001, 100, status=0, client=CLIENT_A, freelancer=FREELANCER_A),
+    _job(1002, 200, status=1, client=CLIENT_A, freelancer=FREELANCER_B),
+    _job(1003, 200, status=1, client=CLIENT_B, freelancer=FREELANCER_A),  # same second as 1002
+    _job(1004, 300, status=2, client=CLIENT_B, freelancer=FREELANCER_B),
+    _job(1005, 400, status=1, client=CLIENT_A, freelancer=FREELANCER_A),
+])
+
+
+def _ids(jobs: list[dict]) -> list[int]:
+    return [job["app_id"] for job in jobs]
+
+
+def test_unfiltered_query_is_newest_first():
+    page, total = JobSnapshot(JOBS).query(limit=10)
+    assert _ids(page) == [1005, 1004, 1003, 1002, 1001]
+    assert total == 5
+
+
+def test_single_and_combined_filters():
+    snapshot = JobSnapshot(JOBS)
+
+    assert _ids(snapshot.query(status=1)[0]) == [1005, 1003, 1002]
+    assert _ids(snapshot.query(client_address=CLIENT_B)[0]) == [1004, 1003]
+    assert _ids(snapshot.query(freelancer_address=FREELANCER_B)[0]) == [1004, 1002]
+
+    page, total = snapshot.query(status=1, client_address=CLIENT_A, freelancer_address=FREELANCER_A)
+    assert _ids(page) == [1005]
+    assert total == 1
+
+    assert snapshot.query(status=4) == ([], 0)
+    assert snapshot.query(client_address="NOBODY") == ([], 0)
+
+
+def test_offset_pagination():
+    snapshot = JobSnapshot(JOBS)
+    page, total = snapshot.query(limit=2, offset=2)
+    assert _ids(page) == [1003, 1002]
+    assert total == 5
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(_job(1003, 200))
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (200, 1003)
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", encode_cursor({"created_at": "x", "app_id": 1})])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_keyset_pages_cover_every_job_once():
+    snapshot = JobSnapshot(JOBS)
+    seen = []
+    after = None
+    while True:
+        page, _ = snapshot.query(limit=2, after=after)
+        if not page:
+            break
+        seen.extend(_ids(page))
+        after = decode_cursor(encode_cursor(page[-1]))
+    assert seen == [1005, 1004, 1003, 1002, 1001]
+
+    # offset is ignored once a cursor is given
+    assert _ids(snapshot.query(limit=2, offset=3, after=(300, 1004))[0]) == [1003, 1002]
+
+
+def test_keyset_pagination_with_filter_and_equal_timestamps():
+    snapshot = JobSnapshot(JOBS)
+    first, total = snapshot.query(status=1, limit=2)
+    assert _ids(first) == [1005, 1003]
+    second, _ = snapshot.query(status=1, limit=2, after=(first[-1]["created_at"], first[-1]["app_id"]))
+    assert _ids(second) == [1002]
+    assert total == 3
+
+
+def test_snapshot_is_reused_until_the_next_write():
+    index = JobIndex(":memory:")
+    try:
+        index.upsert_jobs(JOBS)
+        snapshot = index.snapshot()
+        assert index.snapshot() is snapshot
+
+        index.upsert_jobs([{**JOBS[0], "job_status": 3}])
+        assert index.snapshot() is not snapshot
+        assert _ids(index.query(status=3)[0]) == [1005]
+    finally:
+        index.close()
+
+
+def test_job_index_upserts_and_prunes():
+    index = JobIndex(":memory:")
+    try:
+        assert not index.is_ready
+        index.upsert_jobs(JOBS)
+        assert index.count() == 5
+        assert _ids(index.query(limit=10)[0]) == [1005, 1004, 1003, 1002, 1001]
+
+        index.upsert_jobs([{**JOBS[0], "job_status": 3}])
+        assert index.count() == 5
+        assert index.get(1005)["job_status"] == 3
+
+        assert index.prune({1001, 1002}) == 3
+        assert _ids(index.query(limit=10)[0]) == [1002, 1001]
+        assert index.get(1005) is None
+    finally:
+        index.close()
+
+
+def test_job_index_survives_restart(tmp_path):
+    db_path = str(tmp_path / "jobs.sqlite3")
+    index = JobIndex(db_path)
+    index.upsert_jobs(JOBS)
+    index.close()
+
+    reopened = JobIndex(db_path)
+    try:
+        # Rows from the previous run are served before the first sync
+        assert reopened.last_synced_at is None
+        assert reopened.is_ready
+        assert reopened.get(1003) == JOBS[2]
+    finally:
+        reopened.close()
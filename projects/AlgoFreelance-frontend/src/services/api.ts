@@ -3,14 +3,19 @@
 import type {
   JobCreateRequest,
   JobCreateResponse,
+  JobBatchCreateResponse,
   JobDetailsResponse,
   PortfolioResponse,
   FundJobResponse,
   SubmitWorkRequest,
   SubmitWorkResponse,
   ApproveWorkResponse,
+  TransactionBatchItem,
+  TransactionBatchResponse,
   BroadcastTransactionRequest,
   BroadcastTransactionResponse,
+  TransactionStatusResponse,
+  BatchBroadcastResponse,
   JobListResponse,
   IPFSUploadResponse,
 } from '../types/job'
@@ -51,12 +56,31 @@ export const api = {
     return handleResponse<JobCreateResponse>(response)
   },
 
+  // Create several job contracts in one request
+  async createJobsBatch(jobs: JobCreateRequest[]): Promise<JobBatchCreateResponse> {
+    const response = await fetch(`${API_BASE_URL}/api/v1/jobs/create-batch`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ jobs }),
+    })
+    return handleResponse<JobBatchCreateResponse>(response)
+  },
+
   // Get job details
   async getJob(appId: number): Promise<JobDetailsResponse> {
     const response = await fetch(`${API_BASE_URL}/api/v1/jobs/${appId}`)
     return handleResponse<JobDetailsResponse>(response)
   },
 
+  // Stream live job details (Server-Sent Events); returns a function that closes the stream
+  subscribeToJob(appId: number, onUpdate: (job: JobDetailsResponse) => void): () => void {
+    const source = new EventSource(`${API_BASE_URL}/api/v1/jobs/${appId}/events`)
+    source.addEventListener('job', (event) => {
+      onUpdate(JSON.parse((event as MessageEvent).data).job)
+    })
+    return () => source.close()
+  },
+
   // List all jobs with optional filters
   async listJobs(params?: {
     status?: number
@@ -64,6 +88,7 @@ export const api = {
     freelancer_address?: string
     limit?: number
     offset?: number
+    cursor?: string
   }): Promise<JobListResponse> {
     const queryParams = new URLSearchParams()
     if (params?.status !== undefined) queryParams.set('status', String(params.status))
@@ -71,6 +96,7 @@ export const api = {
     if (params?.freelancer_address) queryParams.set('freelancer_address', params.freelancer_address)
     if (params?.limit) queryParams.set('limit', String(params.limit))
     if (params?.offset) queryParams.set('offset', String(params.offset))
+    if (params?.cursor) queryParams.set('cursor', params.cursor)
 
     const url = `${API_BASE_URL}/api/v1/jobs${queryParams.toString() ? `?${queryParams.toString()}` : ''}`
     const response = await fetch(url)
@@ -119,6 +145,16 @@ export const api = {
     return handleResponse<ApproveWorkResponse>(response)
   },
 
+  // Construct unsigned transactions for several actions at once (sign them together)
+  async constructTransactionsBatch(actions: TransactionBatchItem[]): Promise<TransactionBatchResponse> {
+    const response = await fetch(`${API_BASE_URL}/api/v1/transactions/batch`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ actions }),
+    })
+    return handleResponse<TransactionBatchResponse>(response)
+  },
+
   // Broadcast signed transaction (optional helper)
   async broadcastTransaction(signedTxn: string): Promise<BroadcastTransactionResponse> {
     const response = await fetch(`${API_BASE_URL}/api/v1/broadcast`, {
@@ -129,6 +165,22 @@ export const api = {
     return handleResponse<BroadcastTransactionResponse>(response)
   },
 
+  // Broadcast several signed transactions/groups at once (one inner array per atomic group)
+  async broadcastTransactionGroups(groups: string[][]): Promise<BatchBroadcastResponse> {
+    const response = await fetch(`${API_BASE_URL}/api/v1/broadcast/batch`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ groups }),
+    })
+    return handleResponse<BatchBroadcastResponse>(response)
+  },
+
+  // Confirmation status of a transaction broadcast through the backend
+  async getTransactionStatus(txnId: string): Promise<TransactionStatusResponse> {
+    const response = await fetch(`${API_BASE_URL}/api/v1/transactions/${txnId}`)
+    return handleResponse<TransactionStatusResponse>(response)
+  },
+
   // Upload file to IPFS
   async uploadToIPFS(file: File): Promise<IPFSUploadResponse> {
     const formData = new FormData()
@@ -17,6 +17,21 @@ export interface JobCreateResponse {
   explorer_url: string
 }
 
+export interface JobBatchCreateResult {
+  index: number
+  success: boolean
+  app_id?: number | null
+  app_address?: string | null
+  funding_amount?: number | null
+  txn_id?: string | null
+  explorer_url?: string | null
+  error?: string | null
+}
+
+export interface JobBatchCreateResponse {
+  results: JobBatchCreateResult[]
+}
+
 export interface JobDetailsResponse {
   app_id: number
   client_address: string
@@ -85,6 +100,31 @@ export interface ApproveWorkResponse {
   message: string
 }
 
+export interface TransactionBatchItem {
+  action: 'fund' | 'submit' | 'approve'
+  app_id: number
+  address: string // Signer of the action's transactions
+  ipfs_hash?: string // Required for submit
+}
+
+export interface TransactionBatchResult {
+  index: number
+  action: string
+  app_id: number
+  success: boolean
+  transactions: string[] // Base64-encoded unsigned transactions, in signing order
+  group_id?: string | null
+  signer_address?: string | null
+  expected_nft_name?: string | null
+  expected_payment_amount?: number | null
+  error?: string | null
+}
+
+export interface TransactionBatchResponse {
+  results: TransactionBatchResult[]
+  message: string
+}
+
 export interface BroadcastTransactionRequest {
   signed_transaction: string
 }
@@ -93,6 +133,31 @@ export interface BroadcastTransactionResponse {
   success: boolean
   txn_id: string
   explorer_url: string
+  status?: string
+  tracking_url?: string
+}
+
+export interface BroadcastGroupResult {
+  group_index: number
+  success: boolean
+  txn_id?: string | null
+  explorer_url?: string | null
+  status?: string | null
+  tracking_url?: string | null
+  error?: string | null
+}
+
+export interface BatchBroadcastResponse {
+  results: BroadcastGroupResult[]
+}
+
+export interface TransactionStatusResponse {
+  txn_id: string
+  status: 'pending' | 'confirmed' | 'failed' | 'expired'
+  submitted_round: number | null
+  confirmed_round: number | null
+  pool_error: string | null
+  app_ids: number[]
 }
 
 export interface JobSummary {
@@ -114,6 +179,7 @@ export interface JobListResponse {
   limit: number
   offset: number
   has_more: boolean
+  next_cursor?: string | null
 }
 
 // Job status enum